@@ -2,7 +2,7 @@
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
 # Module import
-from plane.db.models import WorkspaceMember, ProjectMember
+from plane.utils.membership import get_membership
 
 # Permission Mappings
 Admin = 20
@@ -16,31 +16,18 @@ class ProjectBasePermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
+        membership = get_membership(request)
+
         ## Safe Methods -> Handle the filtering logic in queryset
         if request.method in SAFE_METHODS:
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                is_active=True,
-            ).exists()
+            return membership.workspace_role(view.workspace_slug) is not None
 
         ## Only workspace owners or admins can create the projects
         if request.method == "POST":
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                role__in=[Admin, Member],
-                is_active=True,
-            ).exists()
+            return membership.workspace_role(view.workspace_slug) in [Admin, Member]
 
         ## Only Project Admins can update project attributes
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            role=Admin,
-            project_id=view.project_id,
-            is_active=True,
-        ).exists()
+        return membership.project_role(view.workspace_slug, view.project_id) == Admin
 
 
 class ProjectMemberPermission(BasePermission):
@@ -48,30 +35,20 @@ class ProjectMemberPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
+        membership = get_membership(request)
+
         ## Safe Methods -> Handle the filtering logic in queryset
         if request.method in SAFE_METHODS:
-            return ProjectMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                is_active=True,
-            ).exists()
+            return bool(membership.project_ids(view.workspace_slug, active=True))
         ## Only workspace owners or admins can create the projects
         if request.method == "POST":
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                role__in=[Admin, Member],
-                is_active=True,
-            ).exists()
+            return membership.workspace_role(view.workspace_slug) in [Admin, Member]
 
         ## Only Project Admins can update project attributes
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            role__in=[Admin, Member],
-            project_id=view.project_id,
-            is_active=True,
-        ).exists()
+        return membership.project_role(view.workspace_slug, view.project_id) in [
+            Admin,
+            Member,
+        ]
 
 
 class ProjectEntityPermission(BasePermission):
@@ -79,23 +56,16 @@ class ProjectEntityPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
+        role = get_membership(request).project_role(
+            view.workspace_slug, view.project_id
+        )
+
         ## Safe Methods -> Handle the filtering logic in queryset
         if request.method in SAFE_METHODS:
-            return ProjectMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                project_id=view.project_id,
-                is_active=True,
-            ).exists()
+            return role is not None
 
         ## Only project members or admins can create and edit the project attributes
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            role__in=[Admin, Member],
-            project_id=view.project_id,
-            is_active=True,
-        ).exists()
+        return role in [Admin, Member]
 
 
 class ProjectLitePermission(BasePermission):
@@ -103,9 +73,7 @@ class ProjectLitePermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            project_id=view.project_id,
-            is_active=True,
-        ).exists()
+        return (
+            get_membership(request).project_role(view.workspace_slug, view.project_id)
+            is not None
+        )
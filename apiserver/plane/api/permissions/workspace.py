@@ -2,7 +2,7 @@
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
 # Module imports
-from plane.db.models import WorkspaceMember
+from plane.utils.membership import get_membership
 
 
 # Permission Mappings
@@ -26,23 +26,15 @@ class WorkSpaceBasePermission(BasePermission):
         if request.method in SAFE_METHODS:
             return True
 
+        role = get_membership(request).workspace_role(view.workspace_slug)
+
         # allow only admins and owners to update the workspace settings
         if request.method in ["PUT", "PATCH"]:
-            return WorkspaceMember.objects.filter(
-                member=request.user,
-                workspace__slug=view.workspace_slug,
-                role__in=[Owner, Admin],
-                is_active=True,
-            ).exists()
+            return role in [Owner, Admin]
 
         # allow only owner to delete the workspace
         if request.method == "DELETE":
-            return WorkspaceMember.objects.filter(
-                member=request.user,
-                workspace__slug=view.workspace_slug,
-                role=Owner,
-                is_active=True,
-            ).exists()
+            return role == Owner
 
 
 class WorkspaceOwnerPermission(BasePermission):
@@ -50,11 +42,10 @@ class WorkspaceOwnerPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return WorkspaceMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            role=Owner,
-        ).exists()
+        return (
+            get_membership(request).workspace_role(view.workspace_slug, active=False)
+            == Owner
+        )
 
 
 class WorkSpaceAdminPermission(BasePermission):
@@ -62,12 +53,10 @@ class WorkSpaceAdminPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return WorkspaceMember.objects.filter(
-            member=request.user,
-            workspace__slug=view.workspace_slug,
-            role__in=[Owner, Admin],
-            is_active=True,
-        ).exists()
+        return get_membership(request).workspace_role(view.workspace_slug) in [
+            Owner,
+            Admin,
+        ]
 
 
 class WorkspaceEntityPermission(BasePermission):
@@ -75,20 +64,13 @@ class WorkspaceEntityPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
+        role = get_membership(request).workspace_role(view.workspace_slug)
+
         ## Safe Methods -> Handle the filtering logic in queryset
         if request.method in SAFE_METHODS:
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                is_active=True,
-            ).exists()
+            return role is not None
 
-        return WorkspaceMember.objects.filter(
-            member=request.user,
-            workspace__slug=view.workspace_slug,
-            role__in=[Owner, Admin],
-            is_active=True,
-        ).exists()
+        return role in [Owner, Admin]
 
 
 class WorkspaceViewerPermission(BasePermission):
@@ -96,12 +78,8 @@ class WorkspaceViewerPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return WorkspaceMember.objects.filter(
-            member=request.user,
-            workspace__slug=view.workspace_slug,
-            role__gte=10,
-            is_active=True,
-        ).exists()
+        role = get_membership(request).workspace_role(view.workspace_slug)
+        return role is not None and role >= 10
 
 
 class WorkspaceUserPermission(BasePermission):
@@ -109,8 +87,4 @@ class WorkspaceUserPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return WorkspaceMember.objects.filter(
-            member=request.user,
-            workspace__slug=view.workspace_slug,
-            is_active=True,
-        ).exists()
+        return get_membership(request).workspace_role(view.workspace_slug) is not None
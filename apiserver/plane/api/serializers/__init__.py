@@ -61,6 +61,7 @@ from .issue import (
     IssueRelationSerializer,
     RelatedIssueSerializer,
     IssuePublicSerializer,
+    IssueStateFlatSerializer,
 )
 
 from .module import (
@@ -101,4 +102,6 @@ from .notification import NotificationSerializer
 
 from .exporter import ExporterHistorySerializer
 
-from .webhook import WebhookSerializer, WebhookLogSerializer
\ No newline at end of file
+from .webhook import WebhookSerializer, WebhookLogSerializer
+
+from .projection import project_queryset
\ No newline at end of file
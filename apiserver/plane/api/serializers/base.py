@@ -1,9 +1,38 @@
+from django.db import models
 from rest_framework import serializers
 
+from plane.utils.instrumentation import serializer_timer
+
 
 class BaseSerializer(serializers.ModelSerializer):
     id = serializers.PrimaryKeyRelatedField(read_only=True)
 
+    def get_fields(self):
+        fields = super().get_fields()
+        # Search vectors only back the full text index, fields = "__all__"
+        # would otherwise send them in every response and webhook
+        fields.pop("search_vector", None)
+        return fields
+
+    def to_representation(self, instance):
+        with serializer_timer():
+            return super().to_representation(instance)
+
+class EmbeddingListSerializer(serializers.ListSerializer):
+    """List serializer resolving the embedded relations of all rows at once
+
+    The child's embed(instances) returns what its fields read from the
+    context, so every embedded relation costs one query per list instead of
+    one per row.
+    """
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        instances = list(iterable)
+        self.context.update(self.child.embed(instances))
+        return super().to_representation(instances)
+
+
 class DynamicBaseSerializer(BaseSerializer):
 
     def __init__(self, *args, **kwargs):
@@ -2,7 +2,7 @@
 from rest_framework import serializers
 
 # Module imports
-from .base import BaseSerializer, DynamicBaseSerializer
+from .base import BaseSerializer, DynamicBaseSerializer, EmbeddingListSerializer
 from plane.api.serializers.workspace import WorkSpaceSerializer, WorkspaceLiteSerializer
 from plane.api.serializers.user import UserLiteSerializer, UserAdminLiteSerializer
 from plane.db.models import (
@@ -102,21 +102,45 @@ class ProjectListSerializer(DynamicBaseSerializer):
     is_deployed = serializers.BooleanField(read_only=True)
     members = serializers.SerializerMethodField()
 
-    def get_members(self, obj):
+    def embed(self, projects):
+        """active members of the projects, only their ids with members=ids"""
+        if "members" not in self.fields:
+            return {}
+
+        members = {project.id: [] for project in projects}
+        if not members:
+            return {"project_members": members}
+
         project_members = ProjectMember.objects.filter(
-            project_id=obj.id,
-            is_active=True,
-        ).values(
-            "id",
-            "member_id",
-            "member__display_name",
-            "member__avatar",
+            project_id__in=list(members), is_active=True
         )
-        return list(project_members)
+        if self.context.get("members") == "ids":
+            for project_id, member_id in project_members.values_list(
+                "project_id", "member_id"
+            ):
+                members[project_id].append(member_id)
+        else:
+            for project_member in project_members.values(
+                "id",
+                "member_id",
+                "member__display_name",
+                "member__avatar",
+                "project_id",
+            ):
+                members[project_member.pop("project_id")].append(project_member)
+        return {"project_members": members}
+
+    def get_members(self, obj):
+        # Embedded for the whole list by EmbeddingListSerializer
+        members = self.context.get("project_members")
+        if members is None or obj.id not in members:
+            members = self.embed([obj])["project_members"]
+        return members[obj.id]
 
     class Meta:
         model = Project
         fields = "__all__"
+        list_serializer_class = EmbeddingListSerializer
 
 
 class ProjectDetailSerializer(BaseSerializer):
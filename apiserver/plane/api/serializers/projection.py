@@ -0,0 +1,171 @@
+# Django imports
+from django.db.models import F
+from django.utils.encoding import is_protected_type
+
+# Third party imports
+from rest_framework import serializers
+from rest_framework.relations import ManyRelatedField, PrimaryKeyRelatedField
+
+# Module imports
+from plane.utils.instrumentation import serializer_timer
+
+PARENT_KEY = "projection_parent_id"
+
+
+def model_field_representation(value):
+    # Same as ModelField, which falls back to value_to_string
+    return value if is_protected_type(value) else str(value)
+
+
+class Projection:
+    """Output of a model serializer built straight from .values() rows
+
+    The serializer fields are read once to plan the columns: nested
+    serializers become joined columns, many relations one query each, and
+    every plain field keeps its own to_representation so the output is the
+    same as the serializer's. Fields pruned from the serializer, like the
+    fields= of a DynamicBaseSerializer, are neither selected nor fetched.
+    """
+
+    def __init__(self, serializer, prefix=""):
+        self.model = serializer.Meta.model
+        self.pk_key = prefix + self.model._meta.pk.attname
+        self.plan = []
+        self.relations = {}
+
+        for name, field in serializer.fields.items():
+            source = field.source
+            if source == "*" or "." in source:
+                raise ValueError(f"{name} is not read from a single column")
+            if isinstance(field, (serializers.ListSerializer, ManyRelatedField)):
+                if prefix:
+                    raise ValueError(f"{name} is a many relation below {prefix}")
+                child = (
+                    Projection(field.child)
+                    if isinstance(field, serializers.ListSerializer)
+                    else None
+                )
+                self.relations.setdefault(source, []).append((name, child))
+                self.plan.append((name, "many", source, child))
+            elif isinstance(field, serializers.BaseSerializer):
+                self.plan.append(
+                    (
+                        name,
+                        "nested",
+                        prefix + self.model._meta.get_field(source).attname,
+                        Projection(field, prefix=f"{prefix}{source}__"),
+                    )
+                )
+            elif isinstance(field, PrimaryKeyRelatedField):
+                self.plan.append(
+                    (
+                        name,
+                        "pk",
+                        prefix + self.model._meta.get_field(source).attname,
+                        None,
+                    )
+                )
+            elif isinstance(field, serializers.ModelField):
+                self.plan.append(
+                    (name, "value", prefix + source, model_field_representation)
+                )
+            else:
+                self.plan.append(
+                    (name, "value", prefix + source, field.to_representation)
+                )
+
+    def available(self, annotations):
+        # Annotations the queryset lacks are skipped like the serializer does
+        concrete = {field.attname for field in self.model._meta.concrete_fields}
+        concrete |= {field.name for field in self.model._meta.concrete_fields}
+        self.plan = [
+            step
+            for step in self.plan
+            if step[1] != "value" or step[2] in concrete or step[2] in annotations
+        ]
+
+    def columns(self):
+        columns = {self.pk_key}
+        for _, kind, key, child in self.plan:
+            if kind in ("value", "pk", "nested"):
+                columns.add(key)
+            if kind == "nested":
+                columns.update(child.columns())
+        return columns
+
+    def related_rows(self, source, parent_ids):
+        field = self.model._meta.get_field(source)
+        related_model = field.related_model
+        # Forward many to many or reverse foreign key, ordered like a prefetch
+        parent = (
+            field.related_query_name() if field.many_to_many else field.field.name
+        )
+
+        columns = {related_model._meta.pk.attname}
+        for _, child in self.relations[source]:
+            if child is not None:
+                columns.update(child.columns())
+
+        return list(
+            related_model._default_manager.filter(**{f"{parent}__in": parent_ids})
+            .values(*sorted(columns), **{PARENT_KEY: F(parent)})
+        )
+
+    def load_related(self, rows):
+        parent_ids = [row[self.pk_key] for row in rows]
+        related = {}
+        for source, fields in self.relations.items():
+            related_rows = self.related_rows(source, parent_ids) if parent_ids else []
+            indices = {}
+            for index, related_row in enumerate(related_rows):
+                indices.setdefault(related_row[PARENT_KEY], []).append(index)
+
+            pk_key = self.model._meta.get_field(source).related_model._meta.pk.attname
+            outputs = {
+                name: (
+                    child.represent_rows(related_rows)
+                    if child is not None
+                    else [related_row[pk_key] for related_row in related_rows]
+                )
+                for name, child in fields
+            }
+            related[source] = (indices, outputs)
+        return related
+
+    def represent(self, row, related):
+        data = {}
+        for name, kind, key, payload in self.plan:
+            if kind == "many":
+                indices, outputs = related[key]
+                data[name] = [
+                    outputs[name][index] for index in indices.get(row[self.pk_key], [])
+                ]
+            elif row[key] is None:
+                data[name] = None
+            elif kind == "value":
+                data[name] = payload(row[key])
+            elif kind == "pk":
+                data[name] = row[key]
+            else:
+                data[name] = payload.represent(row, None)
+        return data
+
+    def represent_rows(self, rows):
+        related = self.load_related(rows)
+        return [self.represent(row, related) for row in rows]
+
+
+def project_queryset(serializer, queryset):
+    """serialize a queryset with many=True output, without model instances
+
+    Args:
+        serializer (Serializer): unbound serializer, e.g. built with fields=
+        queryset (QuerySet): queryset of the serializer model, annotated as
+            the serializer expects
+    """
+    with serializer_timer():
+        projection = Projection(serializer)
+        projection.available(queryset.query.annotations)
+        columns = sorted(projection.columns())
+        rows = list(queryset.prefetch_related(None).values(*columns))
+        return projection.represent_rows(rows)
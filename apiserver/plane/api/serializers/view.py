@@ -7,6 +7,7 @@ from .workspace import WorkspaceLiteSerializer
 from .project import ProjectLiteSerializer
 from plane.db.models import GlobalView, IssueView, IssueViewFavorite
 from plane.utils.issue_filters import issue_filters
+from plane.utils.view_filters import compile_filter_plan
 
 
 class GlobalViewSerializer(BaseSerializer):
@@ -18,6 +19,7 @@ class GlobalViewSerializer(BaseSerializer):
         read_only_fields = [
             "workspace",
             "query",
+            "filter_plan",
         ]
 
     def create(self, validated_data):
@@ -26,6 +28,7 @@ class GlobalViewSerializer(BaseSerializer):
             validated_data["query"] = issue_filters(query_params, "POST")
         else:
             validated_data["query"] = dict()
+        validated_data["filter_plan"] = compile_filter_plan(query_params)
         return GlobalView.objects.create(**validated_data)
 
     def update(self, instance, validated_data):
@@ -35,6 +38,8 @@ class GlobalViewSerializer(BaseSerializer):
         else:
             validated_data["query"] = dict()
         validated_data["query"] = issue_filters(query_params, "PATCH")
+        if "query_data" in validated_data:
+            validated_data["filter_plan"] = compile_filter_plan(query_params)
         return super().update(instance, validated_data)
 
 
@@ -50,6 +55,7 @@ class IssueViewSerializer(BaseSerializer):
             "workspace",
             "project",
             "query",
+            "filter_plan",
         ]
 
     def create(self, validated_data):
@@ -58,6 +64,7 @@ class IssueViewSerializer(BaseSerializer):
             validated_data["query"] = issue_filters(query_params, "POST")
         else:
             validated_data["query"] = {}
+        validated_data["filter_plan"] = compile_filter_plan(query_params)
         return IssueView.objects.create(**validated_data)
 
     def update(self, instance, validated_data):
@@ -67,6 +74,8 @@ class IssueViewSerializer(BaseSerializer):
         else:
             validated_data["query"] = {}
         validated_data["query"] = issue_filters(query_params, "PATCH")
+        if "query_data" in validated_data:
+            validated_data["filter_plan"] = compile_filter_plan(query_params)
         return super().update(instance, validated_data)
 
 
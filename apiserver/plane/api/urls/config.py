@@ -1,7 +1,7 @@
 from django.urls import path
 
 
-from plane.api.views import ConfigurationEndpoint
+from plane.api.views import ConfigurationEndpoint, MetricsEndpoint
 
 urlpatterns = [
     path(
@@ -9,4 +9,9 @@ urlpatterns = [
         ConfigurationEndpoint.as_view(),
         name="configuration",
     ),
+    path(
+        "metrics/",
+        MetricsEndpoint.as_view(),
+        name="metrics",
+    ),
 ]
\ No newline at end of file
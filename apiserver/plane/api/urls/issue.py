@@ -11,6 +11,8 @@ from plane.api.views import (
     BulkImportIssuesEndpoint,
     UserWorkSpaceIssues,
     SubIssuesEndpoint,
+    SubIssueTreeEndpoint,
+    IssueAncestorsEndpoint,
     IssueLinkViewSet,
     IssueAttachmentEndpoint,
     ExportIssuesEndpoint,
@@ -106,6 +108,16 @@ urlpatterns = [
         SubIssuesEndpoint.as_view(),
         name="sub-issues",
     ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/issues/<uuid:issue_id>/sub-issues/tree/",
+        SubIssueTreeEndpoint.as_view(),
+        name="sub-issues-tree",
+    ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/issues/<uuid:issue_id>/ancestors/",
+        IssueAncestorsEndpoint.as_view(),
+        name="issue-ancestors",
+    ),
     path(
         "workspaces/<str:slug>/projects/<uuid:project_id>/issues/<uuid:issue_id>/issue-links/",
         IssueLinkViewSet.as_view(
@@ -74,6 +74,8 @@ from .issue import (
     BulkDeleteIssuesEndpoint,
     UserWorkSpaceIssues,
     SubIssuesEndpoint,
+    SubIssueTreeEndpoint,
+    IssueAncestorsEndpoint,
     IssueLinkViewSet,
     BulkCreateIssueLabelsEndpoint,
     IssueAttachmentEndpoint,
@@ -172,6 +174,6 @@ from .notification import (
 
 from .exporter import ExportIssuesEndpoint
 
-from .config import ConfigurationEndpoint
+from .config import ConfigurationEndpoint, MetricsEndpoint
 
 from .webhook import WebhookEndpoint, WebhookLogsEndpoint, WebhookSecretRegenerateEndpoint
@@ -12,7 +12,13 @@ from plane.api.views import BaseAPIView, BaseViewSet
 from plane.api.permissions import WorkSpaceAdminPermission
 from plane.db.models import Issue, AnalyticView, Workspace, State, Label
 from plane.api.serializers import AnalyticViewSerializer
-from plane.utils.analytics_plot import build_graph_plot
+from plane.utils.analytics_plot import build_graph_plot, build_graph_details
+from plane.utils.analytics_rollup import (
+    can_use_rollups,
+    rollup_graph_plot,
+    rollup_state_summary,
+    rollup_total,
+)
 from plane.bgtasks.analytic_plot_export import analytic_export_task
 from plane.utils.issue_filters import issue_filters
 
@@ -73,102 +79,26 @@ class AnalyticsEndpoint(BaseAPIView):
         # Additional filters that need to be applied
         filters = issue_filters(request.GET, "GET")
 
-        # Get the issues for the workspace with the additional filters applied
-        queryset = Issue.issue_objects.filter(workspace__slug=slug, **filters)
+        if can_use_rollups(filters, x_axis, segment):
+            total_issues = rollup_total(slug, filters)
+            distribution = rollup_graph_plot(slug, filters, x_axis, y_axis)
+        else:
+            # Get the issues for the workspace with the additional filters applied
+            queryset = Issue.issue_objects.filter(workspace__slug=slug, **filters)
 
-        # Get the total issue count
-        total_issues = queryset.count()
-
-        # Build the graph payload
-        distribution = build_graph_plot(
-            queryset=queryset, x_axis=x_axis, y_axis=y_axis, segment=segment
-        )
-
-        state_details = {}
-        if x_axis in ["state_id"] or segment in ["state_id"]:
-            state_details = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    **filters,
-                )
-                .distinct("state_id")
-                .order_by("state_id")
-                .values("state_id", "state__name", "state__color")
-            )
-
-        label_details = {}
-        if x_axis in ["labels__id"] or segment in ["labels__id"]:
-            label_details = (
-                Issue.objects.filter(
-                    workspace__slug=slug, **filters, labels__id__isnull=False
-                )
-                .distinct("labels__id")
-                .order_by("labels__id")
-                .values("labels__id", "labels__color", "labels__name")
-            )
-
-        assignee_details = {}
-        if x_axis in ["assignees__id"] or segment in ["assignees__id"]:
-            assignee_details = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug, **filters, assignees__avatar__isnull=False
-                )
-                .order_by("assignees__id")
-                .distinct("assignees__id")
-                .values(
-                    "assignees__avatar",
-                    "assignees__display_name",
-                    "assignees__first_name",
-                    "assignees__last_name",
-                    "assignees__id",
-                )
-            )
+            # Get the total issue count
+            total_issues = queryset.count()
 
-        cycle_details = {}
-        if x_axis in ["issue_cycle__cycle_id"] or segment in ["issue_cycle__cycle_id"]:
-            cycle_details = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    **filters,
-                    issue_cycle__cycle_id__isnull=False,
-                )
-                .distinct("issue_cycle__cycle_id")
-                .order_by("issue_cycle__cycle_id")
-                .values(
-                    "issue_cycle__cycle_id",
-                    "issue_cycle__cycle__name",
-                )
-            )
-
-        module_details = {}
-        if x_axis in ["issue_module__module_id"] or segment in [
-            "issue_module__module_id"
-        ]:
-            module_details = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    **filters,
-                    issue_module__module_id__isnull=False,
-                )
-                .distinct("issue_module__module_id")
-                .order_by("issue_module__module_id")
-                .values(
-                    "issue_module__module_id",
-                    "issue_module__module__name",
-                )
+            # Build the graph payload
+            distribution = build_graph_plot(
+                queryset=queryset, x_axis=x_axis, y_axis=y_axis, segment=segment
             )
 
         return Response(
             {
                 "total": total_issues,
                 "distribution": distribution,
-                "extras": {
-                    "state_details": state_details,
-                    "assignee_details": assignee_details,
-                    "label_details": label_details,
-                    "cycle_details": cycle_details,
-                    "module_details": module_details,
-                },
+                "extras": build_graph_details(distribution, x_axis, segment),
             },
             status=status.HTTP_200_OK,
         )
@@ -296,25 +226,35 @@ class DefaultAnalyticsEndpoint(BaseAPIView):
         filters = issue_filters(request.GET, "GET")
         base_issues = Issue.issue_objects.filter(workspace__slug=slug, **filters)
 
-        total_issues = base_issues.count()
-
-        state_groups = base_issues.annotate(state_group=F("state__group"))
-
-        total_issues_classified = (
-            state_groups.values("state_group")
-            .annotate(state_count=Count("state_group"))
-            .order_by("state_group")
-        )
-
         open_issues_groups = ["backlog", "unstarted", "started"]
-        open_issues_queryset = state_groups.filter(state__group__in=open_issues_groups)
 
-        open_issues = open_issues_queryset.count()
-        open_issues_classified = (
-            open_issues_queryset.values("state_group")
-            .annotate(state_count=Count("state_group"))
-            .order_by("state_group")
-        )
+        if can_use_rollups(filters, "state__group"):
+            state_summary = rollup_state_summary(slug, filters, open_issues_groups)
+        else:
+            state_groups = base_issues.annotate(state_group=F("state__group"))
+            open_issues_queryset = state_groups.filter(
+                state__group__in=open_issues_groups
+            )
+            state_summary = {
+                "total_issues": base_issues.count(),
+                "total_issues_classified": (
+                    state_groups.values("state_group")
+                    .annotate(state_count=Count("state_group"))
+                    .order_by("state_group")
+                ),
+                "open_issues": open_issues_queryset.count(),
+                "open_issues_classified": (
+                    open_issues_queryset.values("state_group")
+                    .annotate(state_count=Count("state_group"))
+                    .order_by("state_group")
+                ),
+                "open_estimate_sum": open_issues_queryset.aggregate(
+                    sum=Sum("estimate_point")
+                )["sum"],
+                "total_estimate_sum": base_issues.aggregate(sum=Sum("estimate_point"))[
+                    "sum"
+                ],
+            }
 
         issue_completed_month_wise = (
             base_issues.filter(completed_at__isnull=False)
@@ -362,23 +302,13 @@ class DefaultAnalyticsEndpoint(BaseAPIView):
             .order_by("-count")
         )
 
-        open_estimate_sum = open_issues_queryset.aggregate(sum=Sum("estimate_point"))[
-            "sum"
-        ]
-        total_estimate_sum = base_issues.aggregate(sum=Sum("estimate_point"))["sum"]
-
         return Response(
             {
-                "total_issues": total_issues,
-                "total_issues_classified": total_issues_classified,
-                "open_issues": open_issues,
-                "open_issues_classified": open_issues_classified,
+                **state_summary,
                 "issue_completed_month_wise": issue_completed_month_wise,
                 "most_issue_created_user": most_issue_created_user,
                 "most_issue_closed_user": most_issue_closed_user,
                 "pending_issue_user": pending_issue_user,
-                "open_estimate_sum": open_estimate_sum,
-                "total_estimate_sum": total_estimate_sum,
             },
             status=status.HTTP_200_OK,
         )
@@ -6,6 +6,7 @@ import json
 from django.urls import resolve
 from django.conf import settings
 from django.utils import timezone
+from django.utils.cache import patch_cache_control
 from django.db import IntegrityError
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.core.serializers.json import DjangoJSONEncoder
@@ -25,6 +26,8 @@ from django_filters.rest_framework import DjangoFilterBackend
 # Module imports
 from plane.utils.paginator import BasePaginator
 from plane.bgtasks.webhook_task import send_webhook
+from plane.utils.membership import get_membership
+from plane.utils.etag import etag_matches, resource_etag
 
 
 class TimezoneMixin:
@@ -63,7 +66,50 @@ class WebhookMixin:
         return response
 
 
-class BaseViewSet(TimezoneMixin, ModelViewSet, BasePaginator):
+class NotModified(APIException):
+    status_code = status.HTTP_304_NOT_MODIFIED
+
+
+class ConditionalGetMixin:
+    """
+    Strong ETags for GET responses built from resource change counters,
+    a request sending the current one back in If-None-Match gets a 304
+    after a single cache read
+    """
+
+    def get_etag_scopes(self):
+        # Counters the GET response is built from, None for no ETag
+        return None
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.etag = None
+        if request.method != "GET":
+            return
+
+        scopes = self.get_etag_scopes()
+        if scopes is None:
+            return
+        # Read before the handler runs, a write racing it moves the ETag on
+        self.etag = resource_etag(request, scopes)
+        if etag_matches(request, self.etag):
+            raise NotModified()
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            return Response(status=status.HTTP_304_NOT_MODIFIED)
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        etag = getattr(self, "etag", None)
+        if etag is not None and response.status_code in [200, 304]:
+            response["ETag"] = etag
+            patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+
+class BaseViewSet(TimezoneMixin, ConditionalGetMixin, ModelViewSet, BasePaginator):
     model = None
 
     permission_classes = [
@@ -146,6 +192,11 @@ class BaseViewSet(TimezoneMixin, ModelViewSet, BasePaginator):
     def workspace_slug(self):
         return self.kwargs.get("slug", None)
 
+    @property
+    def member_project_ids(self):
+        # Projects of the workspace the user is a member of
+        return get_membership(self.request).project_ids(self.workspace_slug)
+
     @property
     def project_id(self):
         project_id = self.kwargs.get("project_id", None)
@@ -156,7 +207,7 @@ class BaseViewSet(TimezoneMixin, ModelViewSet, BasePaginator):
             return self.kwargs.get("pk", None)
 
 
-class BaseAPIView(TimezoneMixin, APIView, BasePaginator):
+class BaseAPIView(TimezoneMixin, ConditionalGetMixin, APIView, BasePaginator):
     permission_classes = [
         IsAuthenticated,
     ]
@@ -232,6 +283,11 @@ class BaseAPIView(TimezoneMixin, APIView, BasePaginator):
     def workspace_slug(self):
         return self.kwargs.get("slug", None)
 
+    @property
+    def member_project_ids(self):
+        # Projects of the workspace the user is a member of
+        return get_membership(self.request).project_ids(self.workspace_slug)
+
     @property
     def project_id(self):
         return self.kwargs.get("project_id", None)
@@ -1,8 +1,10 @@
 # Python imports
 import os
+import hmac
 
 # Django imports
 from django.conf import settings
+from django.http import HttpResponse
 
 # Third party imports
 from rest_framework.permissions import AllowAny
@@ -12,6 +14,7 @@ from sentry_sdk import capture_exception
 
 # Module imports
 from .base import BaseAPIView
+from plane.utils.instrumentation import render_metrics
 
 
 class ConfigurationEndpoint(BaseAPIView):
@@ -35,3 +38,21 @@ class ConfigurationEndpoint(BaseAPIView):
         data["posthog_host"] = os.environ.get("POSTHOG_HOST", None)
         data["has_unsplash_configured"] = bool(settings.UNSPLASH_ACCESS_KEY)
         return Response(data, status=status.HTTP_200_OK)
+
+
+class MetricsEndpoint(BaseAPIView):
+    authentication_classes = []
+    permission_classes = [
+        AllowAny,
+    ]
+
+    def get(self, request):
+        expected = f"Bearer {settings.METRICS_TOKEN}"
+        if not settings.METRICS_TOKEN or not hmac.compare_digest(
+            request.headers.get("Authorization", ""), expected
+        ):
+            return Response(status=status.HTTP_404_NOT_FOUND)
+
+        return HttpResponse(
+            render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8"
+        )
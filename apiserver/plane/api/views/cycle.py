@@ -9,9 +9,8 @@ from django.db.models import (
     Exists,
     OuterRef,
     Count,
-    Prefetch,
-    Sum,
 )
+from django.db.models.functions import Coalesce
 from django.core import serializers
 from django.utils import timezone
 from django.utils.decorators import method_decorator
@@ -33,19 +32,20 @@ from plane.api.serializers import (
 )
 from plane.api.permissions import ProjectEntityPermission
 from plane.db.models import (
-    User,
     Cycle,
     CycleIssue,
     Issue,
     CycleFavorite,
     IssueLink,
     IssueAttachment,
-    Label,
 )
 from plane.bgtasks.issue_activites_task import issue_activity
 from plane.utils.grouper import group_results
+from plane.utils.issue_counts import child_count_annotations
 from plane.utils.issue_filters import issue_filters
 from plane.utils.analytics_plot import burndown_plot
+from plane.utils.progress import ISSUE_COUNT_FIELDS, refresh_cycle_progress
+from plane.utils.view_filters import invalidate_project_issues
 
 
 class CycleViewSet(WebhookMixin, BaseViewSet):
@@ -73,103 +73,20 @@ class CycleViewSet(WebhookMixin, BaseViewSet):
             .get_queryset()
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=self.member_project_ids)
             .select_related("project")
             .select_related("workspace")
             .select_related("owned_by")
             .annotate(is_favorite=Exists(subquery))
             .annotate(
-                total_issues=Count(
-                    "issue_cycle",
-                    filter=Q(
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                    ),
-                )
-            )
-            .annotate(
-                completed_issues=Count(
-                    "issue_cycle__issue__state__group",
-                    filter=Q(
-                        issue_cycle__issue__state__group="completed",
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                    ),
-                )
-            )
-            .annotate(
-                cancelled_issues=Count(
-                    "issue_cycle__issue__state__group",
-                    filter=Q(
-                        issue_cycle__issue__state__group="cancelled",
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                    ),
-                )
-            )
-            .annotate(
-                started_issues=Count(
-                    "issue_cycle__issue__state__group",
-                    filter=Q(
-                        issue_cycle__issue__state__group="started",
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                    ),
-                )
-            )
-            .annotate(
-                unstarted_issues=Count(
-                    "issue_cycle__issue__state__group",
-                    filter=Q(
-                        issue_cycle__issue__state__group="unstarted",
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                    ),
-                )
-            )
-            .annotate(
-                backlog_issues=Count(
-                    "issue_cycle__issue__state__group",
-                    filter=Q(
-                        issue_cycle__issue__state__group="backlog",
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                    ),
-                )
-            )
-            .annotate(total_estimates=Sum("issue_cycle__issue__estimate_point"))
-            .annotate(
-                completed_estimates=Sum(
-                    "issue_cycle__issue__estimate_point",
-                    filter=Q(
-                        issue_cycle__issue__state__group="completed",
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                    ),
-                )
-            )
-            .annotate(
-                started_estimates=Sum(
-                    "issue_cycle__issue__estimate_point",
-                    filter=Q(
-                        issue_cycle__issue__state__group="started",
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                    ),
-                )
-            )
-            .prefetch_related(
-                Prefetch(
-                    "issue_cycle__issue__assignees",
-                    queryset=User.objects.only("avatar", "first_name", "id").distinct(),
-                )
-            )
-            .prefetch_related(
-                Prefetch(
-                    "issue_cycle__issue__labels",
-                    queryset=Label.objects.only("name", "color", "id").distinct(),
-                )
+                **{
+                    field: Coalesce(F(f"cycle_progress__{field}"), 0)
+                    for field in ISSUE_COUNT_FIELDS
+                }
             )
+            .annotate(total_estimates=F("cycle_progress__total_estimates"))
+            .annotate(completed_estimates=F("cycle_progress__completed_estimates"))
+            .annotate(started_estimates=F("cycle_progress__started_estimates"))
             .order_by("-is_favorite", "name")
             .distinct()
         )
@@ -518,14 +435,11 @@ class CycleIssueViewSet(WebhookMixin, BaseViewSet):
             super()
             .get_queryset()
             .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("issue_id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                **child_count_annotations("sub_issues_count", prefix="issue__")
             )
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=self.member_project_ids)
             .filter(cycle_id=self.kwargs.get("cycle_id"))
             .select_related("project")
             .select_related("workspace")
@@ -543,12 +457,7 @@ class CycleIssueViewSet(WebhookMixin, BaseViewSet):
         filters = issue_filters(request.query_params, "GET")
         issues = (
             Issue.issue_objects.filter(issue_cycle__cycle_id=cycle_id)
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**child_count_annotations("sub_issues_count"))
             .annotate(bridge_id=F("issue_cycle__id"))
             .filter(project_id=project_id)
             .filter(workspace__slug=slug)
@@ -560,18 +469,7 @@ class CycleIssueViewSet(WebhookMixin, BaseViewSet):
             .prefetch_related("labels")
             .order_by(order_by)
             .filter(**filters)
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=IssueAttachment.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**child_count_annotations("link_count", "attachment_count"))
         )
 
         issues_data = IssueStateSerializer(issues, many=True).data
@@ -660,6 +558,13 @@ class CycleIssueViewSet(WebhookMixin, BaseViewSet):
             batch_size=10,
         )
 
+        # Bulk writes skip the model signals, refresh both ends of a move
+        refresh_cycle_progress(
+            [cycle_id]
+            + [activity["old_cycle_id"] for activity in update_cycle_issue_activity]
+        )
+        invalidate_project_issues([project_id])
+
         # Capture Issue Activity
         issue_activity.delay(
             type="cycle.activity.created",
@@ -818,5 +723,7 @@ class TransferCycleIssueEndpoint(BaseAPIView):
         cycle_issues = CycleIssue.objects.bulk_update(
             updated_cycles, ["cycle_id"], batch_size=100
         )
+        refresh_cycle_progress([cycle_id, new_cycle_id])
+        invalidate_project_issues([project_id])
 
         return Response({"message": "Success"}, status=status.HTTP_200_OK)
@@ -7,7 +7,7 @@ from rest_framework.response import Response
 from sentry_sdk import capture_exception
 
 # Django imports
-from django.db.models import Max, Q
+from django.db.models import Q
 
 # Module imports
 from plane.api.views import BaseAPIView
@@ -18,6 +18,7 @@ from plane.db.models import (
     Project,
     State,
     IssueSequence,
+    IssueCounter,
     Issue,
     IssueActivity,
     IssueComment,
@@ -37,8 +38,13 @@ from plane.api.serializers import (
 )
 from plane.utils.integrations.github import get_github_repo_details
 from plane.utils.importers.jira import jira_project_issue_summary
+from plane.utils.search import update_search_vectors
 from plane.bgtasks.importer_task import service_importer
+from plane.bgtasks.analytics_rollup_task import refresh_project_rollups
 from plane.utils.html_processor import strip_tags
+from plane.utils.progress import refresh_module_progress
+from plane.utils.view_filters import invalidate_project_issues
+from plane.utils.issue_counts import refresh_issue_counts
 from plane.api.permissions import WorkSpaceAdminPermission
 
 
@@ -280,22 +286,6 @@ class BulkImportIssuesEndpoint(BaseAPIView):
                 ~Q(name="Triage"), project_id=project_id
             ).first()
 
-        # Get the maximum sequence_id
-        last_id = IssueSequence.objects.filter(project_id=project_id).aggregate(
-            largest=Max("sequence")
-        )["largest"]
-
-        last_id = 1 if last_id is None else last_id + 1
-
-        # Get the maximum sort order
-        largest_sort_order = Issue.objects.filter(
-            project_id=project_id, state=default_state
-        ).aggregate(largest=Max("sort_order"))["largest"]
-
-        largest_sort_order = (
-            65535 if largest_sort_order is None else largest_sort_order + 10000
-        )
-
         # Get the issues_data
         issues_data = request.data.get("issues_data", [])
 
@@ -305,9 +295,16 @@ class BulkImportIssuesEndpoint(BaseAPIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        # Reserve the sequence ids and sort orders of all the issues at once
+        sequence_ids, sort_orders = IssueCounter.objects.allocate(
+            project_id, len(issues_data)
+        )
+
         # Issues
         bulk_issues = []
-        for issue_data in issues_data:
+        for issue_data, sequence_id, sort_order in zip(
+            issues_data, sequence_ids, sort_orders
+        ):
             bulk_issues.append(
                 Issue(
                     project_id=project_id,
@@ -325,8 +322,8 @@ class BulkImportIssuesEndpoint(BaseAPIView):
                         )
                         else strip_tags(issue_data.get("description_html"))
                     ),
-                    sequence_id=last_id,
-                    sort_order=largest_sort_order,
+                    sequence_id=sequence_id,
+                    sort_order=sort_order,
                     start_date=issue_data.get("start_date", None),
                     target_date=issue_data.get("target_date", None),
                     priority=issue_data.get("priority", "none"),
@@ -334,14 +331,12 @@ class BulkImportIssuesEndpoint(BaseAPIView):
                 )
             )
 
-            largest_sort_order = largest_sort_order + 10000
-            last_id = last_id + 1
-
         issues = Issue.objects.bulk_create(
             bulk_issues,
             batch_size=100,
             ignore_conflicts=True,
         )
+        update_search_vectors(Issue, [issue.id for issue in issues])
 
         # Sequences
         _ = IssueSequence.objects.bulk_create(
@@ -428,7 +423,12 @@ class BulkImportIssuesEndpoint(BaseAPIView):
                 for comment in comments_list
             ]
 
-        _ = IssueComment.objects.bulk_create(bulk_issue_comments, batch_size=100)
+        issue_comments = IssueComment.objects.bulk_create(
+            bulk_issue_comments, batch_size=100
+        )
+        update_search_vectors(
+            IssueComment, [issue_comment.id for issue_comment in issue_comments]
+        )
 
         # Attach Links
         _ = IssueLink.objects.bulk_create(
@@ -444,6 +444,9 @@ class BulkImportIssuesEndpoint(BaseAPIView):
                 for issue, issue_data in zip(issues, issues_data)
             ]
         )
+        refresh_issue_counts([issue.id for issue in issues])
+
+        refresh_project_rollups.delay(str(project_id))
 
         return Response(
             {"issues": IssueFlatSerializer(issues, many=True).data},
@@ -513,6 +516,9 @@ class BulkImportModulesEndpoint(BaseAPIView):
             _ = ModuleIssue.objects.bulk_create(
                 bulk_module_issues, batch_size=100, ignore_conflicts=True
             )
+            refresh_module_progress([module.id for module in modules])
+            invalidate_project_issues([project_id])
+            refresh_project_rollups.delay(str(project_id))
 
             serializer = ModuleSerializer(modules, many=True)
             return Response(
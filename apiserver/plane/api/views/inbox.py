@@ -32,6 +32,7 @@ from plane.api.serializers import (
     IssueStateInboxSerializer,
 )
 from plane.utils.issue_filters import issue_filters
+from plane.utils.issue_counts import child_count_annotations
 from plane.bgtasks.issue_activites_task import issue_activity
 
 
@@ -114,22 +115,9 @@ class InboxIssueViewSet(BaseViewSet):
             .prefetch_related("assignees", "labels")
             .order_by("issue_inbox__snoozed_till", "issue_inbox__status")
             .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=IssueAttachment.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                **child_count_annotations(
+                    "sub_issues_count", "link_count", "attachment_count"
+                )
             )
             .prefetch_related(
                 Prefetch(
@@ -409,22 +397,9 @@ class InboxIssuePublicViewSet(BaseViewSet):
             .prefetch_related("assignees", "labels")
             .order_by("issue_inbox__snoozed_till", "issue_inbox__status")
             .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=IssueAttachment.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                **child_count_annotations(
+                    "sub_issues_count", "link_count", "attachment_count"
+                )
             )
             .prefetch_related(
                 Prefetch(
@@ -29,7 +29,7 @@ class SlackProjectSyncViewSet(BaseViewSet):
                 workspace__slug=self.kwargs.get("slug"),
                 project_id=self.kwargs.get("project_id"),
             )
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=self.member_project_ids)
         )
 
     def create(self, request, slug, project_id, workspace_integration_id):
@@ -53,6 +53,8 @@ from plane.api.serializers import (
     IssueRelationSerializer,
     RelatedIssueSerializer,
     IssuePublicSerializer,
+    IssueStateFlatSerializer,
+    project_queryset,
 )
 from plane.api.permissions import (
     ProjectEntityPermission,
@@ -79,9 +81,26 @@ from plane.db.models import (
     IssueRelation,
     ProjectPublicMember,
 )
-from plane.bgtasks.issue_activites_task import issue_activity
-from plane.utils.grouper import group_results
+from plane.bgtasks.issue_activites_task import issue_activity, issue_activity_batch
+from plane.utils.grouper import (
+    group_results,
+    group_results_paginated,
+    GROUP_BY_FIELDS,
+)
 from plane.utils.issue_filters import issue_filters
+from plane.utils.view_filters import (
+    DATE_FILTER_PARAMS,
+    PROJECT_ISSUES_CACHE,
+    filter_issues,
+    get_saved_view,
+)
+from plane.utils.issue_tree import MAX_TREE_DEPTH, get_ancestor_ids, get_subtree
+from plane.utils.issue_counts import child_count_annotations, refresh_issue_counts
+from plane.utils.etag import (
+    invalidate_project_resources,
+    project_scope,
+    workspace_scope,
+)
 
 
 class IssueViewSet(WebhookMixin, BaseViewSet):
@@ -108,14 +127,27 @@ class IssueViewSet(WebhookMixin, BaseViewSet):
         "workspace__id",
     ]
 
+    def get_etag_scopes(self):
+        # Saved views and relative dates change the result without any write
+        if self.action != "list" or self.request.GET.get("view_id"):
+            return None
+        if DATE_FILTER_PARAMS.intersection(self.request.GET):
+            return None
+
+        project_id = self.kwargs.get("project_id")
+        return [
+            (PROJECT_ISSUES_CACHE, str(project_id)),
+            project_scope(project_id, "issue_children"),
+            project_scope(project_id, "states"),
+            project_scope(project_id, "labels"),
+            project_scope(project_id, "members"),
+            project_scope(project_id, "project"),
+            workspace_scope(self.kwargs.get("slug"), "workspace"),
+        ]
+
     def get_queryset(self):
         return (
-            Issue.issue_objects.annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            Issue.issue_objects.annotate(**child_count_annotations("sub_issues_count"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(workspace__slug=self.kwargs.get("slug"))
             .select_related("project")
@@ -134,8 +166,6 @@ class IssueViewSet(WebhookMixin, BaseViewSet):
 
     @method_decorator(gzip_page)
     def list(self, request, slug, project_id):
-        filters = issue_filters(request.query_params, "GET")
-
         # Custom ordering for priority and state
         priority_order = ["urgent", "high", "medium", "low", "none"]
         state_order = ["backlog", "unstarted", "started", "completed", "cancelled"]
@@ -143,22 +173,15 @@ class IssueViewSet(WebhookMixin, BaseViewSet):
         order_by_param = request.GET.get("order_by", "-created_at")
 
         issue_queryset = (
-            self.get_queryset()
-            .filter(**filters)
+            filter_issues(
+                self.get_queryset(),
+                request,
+                view=get_saved_view(request, slug, project_id),
+                project_ids=[project_id],
+            )
             .annotate(cycle_id=F("issue_cycle__cycle_id"))
             .annotate(module_id=F("issue_module__module_id"))
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=IssueAttachment.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**child_count_annotations("link_count", "attachment_count"))
         )
 
         # Priority Ordering
@@ -217,8 +240,6 @@ class IssueViewSet(WebhookMixin, BaseViewSet):
         else:
             issue_queryset = issue_queryset.order_by(order_by_param)
 
-        issues = IssueLiteSerializer(issue_queryset, many=True).data
-
         ## Grouping the results
         group_by = request.GET.get("group_by", False)
         sub_group_by = request.GET.get("sub_group_by", False)
@@ -228,6 +249,73 @@ class IssueViewSet(WebhookMixin, BaseViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        # Database side grouping, every group with its count and first issues
+        if group_by and request.GET.get("per_group", False):
+            try:
+                per_group = min(int(request.GET.get("per_group")), 100)
+                group_offset = max(int(request.GET.get("group_offset", 0)), 0)
+            except ValueError:
+                return Response(
+                    {"error": "per_group and group_offset must be integers"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            if group_by not in GROUP_BY_FIELDS or (
+                sub_group_by and sub_group_by not in GROUP_BY_FIELDS
+            ):
+                return Response(
+                    {"error": "Grouping is not supported for the given key"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            return Response(
+                group_results_paginated(
+                    issue_queryset,
+                    on_results=lambda issues: IssueLiteSerializer(
+                        issues, many=True
+                    ).data,
+                    group_by=group_by,
+                    sub_group_by=sub_group_by,
+                    order_by=order_by_param,
+                    per_group=per_group,
+                    offset=group_offset,
+                ),
+                status=status.HTTP_200_OK,
+            )
+
+        # Grouping is applied on the serialized page
+        controller = (
+            (lambda issues: group_results(issues, group_by, sub_group_by))
+            if group_by
+            else None
+        )
+
+        # Streaming
+        if request.GET.get("stream", "false") == "true":
+            if group_by:
+                return Response(
+                    {"error": "Grouped issues cannot be streamed, use per_group"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            return self.stream(
+                request=request,
+                queryset=issue_queryset,
+                on_results=lambda issues: IssueLiteSerializer(
+                    issues, many=True
+                ).data,
+            )
+
+        # Pagination
+        if request.GET.get("per_page", False) and request.GET.get("cursor", False):
+            return self.paginate(
+                request=request,
+                queryset=issue_queryset,
+                on_results=lambda issues: IssueLiteSerializer(
+                    issues, many=True
+                ).data,
+                controller=controller,
+            )
+
+        issues = project_queryset(IssueLiteSerializer(), issue_queryset)
+
         if group_by:
             grouped_results = group_results(issues, group_by, sub_group_by)
             return Response(
@@ -267,10 +355,7 @@ class IssueViewSet(WebhookMixin, BaseViewSet):
 
     def retrieve(self, request, slug, project_id, pk=None):
         issue = Issue.issue_objects.annotate(
-            sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-            .order_by()
-            .annotate(count=Func(F("id"), function="Count"))
-            .values("count")
+            **child_count_annotations("sub_issues_count")
         ).get(workspace__slug=slug, project_id=project_id, pk=pk)
         return Response(IssueSerializer(issue).data, status=status.HTTP_200_OK)
 
@@ -339,18 +424,7 @@ class IssueListEndpoint(BaseAPIView):
             .filter(**filters)
             .annotate(cycle_id=F("issue_cycle__cycle_id"))
             .annotate(module_id=F("issue_module__module_id"))
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=IssueAttachment.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**child_count_annotations("link_count", "attachment_count"))
             .distinct()
         )
 
@@ -388,22 +462,13 @@ class IssueListGroupedEndpoint(BaseAPIView):
             .filter(**filters)
             .annotate(cycle_id=F("issue_cycle__cycle_id"))
             .annotate(module_id=F("issue_module__module_id"))
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=IssueAttachment.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**child_count_annotations("link_count", "attachment_count"))
             .distinct()
         )
 
-        issues = IssueLiteSerializer(issue_queryset, many=True, fields=fields if fields else None).data
+        issues = project_queryset(
+            IssueLiteSerializer(fields=fields if fields else None), issue_queryset
+        )
         issue_dict = {str(issue["id"]): issue for issue in issues}
         return Response(
             issue_dict,
@@ -430,12 +495,7 @@ class UserWorkSpaceIssues(BaseAPIView):
                 ),
                 workspace__slug=slug,
             )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**child_count_annotations("sub_issues_count"))
             .select_related("project")
             .select_related("workspace")
             .select_related("state")
@@ -443,18 +503,7 @@ class UserWorkSpaceIssues(BaseAPIView):
             .prefetch_related("assignees")
             .prefetch_related("labels")
             .order_by(order_by_param)
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=IssueAttachment.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**child_count_annotations("link_count", "attachment_count"))
             .prefetch_related(
                 Prefetch(
                     "issue_reactions",
@@ -520,7 +569,7 @@ class UserWorkSpaceIssues(BaseAPIView):
         else:
             issue_queryset = issue_queryset.order_by(order_by_param)
 
-        issues = IssueLiteSerializer(issue_queryset, many=True).data
+        issues = project_queryset(IssueLiteSerializer(), issue_queryset)
 
         ## Grouping the results
         group_by = request.GET.get("group_by", False)
@@ -550,7 +599,7 @@ class WorkSpaceIssuesEndpoint(BaseAPIView):
     def get(self, request, slug):
         issues = (
             Issue.issue_objects.filter(workspace__slug=slug)
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=self.member_project_ids)
             .order_by("-created_at")
         )
         serializer = IssueSerializer(issues, many=True)
@@ -568,13 +617,13 @@ class IssueActivityEndpoint(BaseAPIView):
             IssueActivity.objects.filter(issue_id=issue_id)
             .filter(
                 ~Q(field__in=["comment", "vote", "reaction", "draft"]),
-                project__project_projectmember__member=self.request.user,
+                project_id__in=self.member_project_ids,
             )
             .select_related("actor", "workspace", "issue", "project")
         ).order_by("created_at")
         issue_comments = (
             IssueComment.objects.filter(issue_id=issue_id)
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=self.member_project_ids)
             .order_by("created_at")
             .select_related("actor", "issue", "project", "workspace")
             .prefetch_related(
@@ -615,7 +664,7 @@ class IssueCommentViewSet(WebhookMixin, BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(issue_id=self.kwargs.get("issue_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=self.member_project_ids)
             .select_related("project")
             .select_related("workspace")
             .select_related("issue")
@@ -733,6 +782,16 @@ class LabelViewSet(BaseViewSet):
         ProjectMemberPermission,
     ]
 
+    def get_etag_scopes(self):
+        if self.action != "list":
+            return None
+        project_id = self.kwargs.get("project_id")
+        return [
+            project_scope(project_id, "labels"),
+            project_scope(project_id, "project"),
+            workspace_scope(self.kwargs.get("slug"), "workspace"),
+        ]
+
     def create(self, request, slug, project_id):
         try:
             serializer = LabelSerializer(data=request.data)
@@ -752,7 +811,7 @@ class LabelViewSet(BaseViewSet):
             .get_queryset()
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=self.member_project_ids)
             .select_related("project")
             .select_related("workspace")
             .select_related("parent")
@@ -805,22 +864,9 @@ class SubIssuesEndpoint(BaseAPIView):
             .prefetch_related("assignees")
             .prefetch_related("labels")
             .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=IssueAttachment.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                **child_count_annotations(
+                    "sub_issues_count", "link_count", "attachment_count"
+                )
             )
             .prefetch_related(
                 Prefetch(
@@ -867,26 +913,31 @@ class SubIssuesEndpoint(BaseAPIView):
 
         sub_issues = Issue.issue_objects.filter(id__in=sub_issue_ids)
 
+        previous_parent_ids = []
         for sub_issue in sub_issues:
+            previous_parent_ids.append(sub_issue.parent_id)
             sub_issue.parent = parent_issue
 
         _ = Issue.objects.bulk_update(sub_issues, ["parent"], batch_size=10)
+        refresh_issue_counts([issue_id] + previous_parent_ids)
 
         updated_sub_issues = Issue.issue_objects.filter(id__in=sub_issue_ids)
 
         # Track the issue
-        _ = [
-            issue_activity.delay(
-                type="issue.activity.updated",
-                requested_data=json.dumps({"parent": str(issue_id)}),
-                actor_id=str(request.user.id),
-                issue_id=str(sub_issue_id),
-                project_id=str(project_id),
-                current_instance=json.dumps({"parent": str(sub_issue_id)}),
-                epoch=int(timezone.now().timestamp()),
-            )
-            for sub_issue_id in sub_issue_ids
-        ]
+        issue_activity_batch.delay(
+            type="issue.activity.updated",
+            diffs=[
+                {
+                    "issue_id": str(sub_issue_id),
+                    "requested_data": json.dumps({"parent": str(issue_id)}),
+                    "current_instance": json.dumps({"parent": str(sub_issue_id)}),
+                }
+                for sub_issue_id in sub_issue_ids
+            ],
+            actor_id=str(request.user.id),
+            project_id=str(project_id),
+            epoch=int(timezone.now().timestamp()),
+        )
 
         return Response(
             IssueFlatSerializer(updated_sub_issues, many=True).data,
@@ -894,6 +945,127 @@ class SubIssuesEndpoint(BaseAPIView):
         )
 
 
+class SubIssueTreeEndpoint(BaseAPIView):
+    permission_classes = [
+        ProjectEntityPermission,
+    ]
+
+    def serialize_node(self, node, issues):
+        return {
+            **issues[str(node.issue_id)],
+            "depth": node.depth,
+            "subtree_issue_count": node.issue_count,
+            "subtree_state_distribution": node.state_distribution,
+            "subtree_estimate_total": node.estimate_total,
+            "sub_issues": [
+                self.serialize_node(child, issues)
+                for child in node.children
+                if str(child.issue_id) in issues
+            ],
+        }
+
+    @method_decorator(gzip_page)
+    def get(self, request, slug, project_id, issue_id):
+        try:
+            max_depth = min(
+                max(int(request.GET.get("depth", MAX_TREE_DEPTH)), 1), MAX_TREE_DEPTH
+            )
+        except ValueError:
+            max_depth = MAX_TREE_DEPTH
+
+        # The tree is walked from any id, the root must belong to the project
+        Issue.objects.only("id").get(
+            pk=issue_id, project_id=project_id, workspace__slug=slug
+        )
+        roots = get_subtree(issue_id, max_depth=max_depth)
+
+        nodes = list(roots)
+        for node in nodes:
+            nodes.extend(node.children)
+
+        issues = (
+            Issue.issue_objects.filter(
+                pk__in=[node.issue_id for node in nodes], workspace__slug=slug
+            )
+            .filter(project_id__in=self.member_project_ids)
+            .select_related("project")
+            .select_related("workspace")
+            .select_related("state")
+            .select_related("parent")
+            .prefetch_related("assignees")
+            .prefetch_related("labels")
+            .annotate(**child_count_annotations("link_count", "attachment_count"))
+            .prefetch_related(
+                Prefetch(
+                    "issue_reactions",
+                    queryset=IssueReaction.objects.select_related("actor"),
+                )
+            )
+        )
+
+        # Issues on the depth limit were not walked, their count is unknown
+        nodes = {node.issue_id: node for node in nodes}
+        for issue in issues:
+            node = nodes[issue.id]
+            issue.sub_issues_count = (
+                len(node.children) if node.depth < max_depth else None
+            )
+
+        issues = {
+            issue["id"]: issue
+            for issue in IssueLiteSerializer(issues, many=True).data
+        }
+
+        state_distribution = {}
+        for node in roots:
+            for state_group, count in node.state_distribution.items():
+                state_distribution[state_group] = (
+                    state_distribution.get(state_group, 0) + count
+                )
+
+        return Response(
+            {
+                "sub_issues": [
+                    self.serialize_node(node, issues)
+                    for node in roots
+                    if str(node.issue_id) in issues
+                ],
+                "issue_count": sum(node.issue_count for node in roots),
+                "state_distribution": state_distribution,
+                "estimate_total": sum(node.estimate_total for node in roots),
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class IssueAncestorsEndpoint(BaseAPIView):
+    permission_classes = [
+        ProjectEntityPermission,
+    ]
+
+    def get(self, request, slug, project_id, issue_id):
+        Issue.objects.only("id").get(
+            pk=issue_id, project_id=project_id, workspace__slug=slug
+        )
+        ancestor_ids = get_ancestor_ids(issue_id)
+        ancestors = {
+            ancestor.id: ancestor
+            for ancestor in Issue.objects.filter(
+                pk__in=ancestor_ids, workspace__slug=slug
+            )
+            .filter(project_id__in=self.member_project_ids)
+            .select_related("project")
+            .select_related("state")
+        }
+        # Root first, down to the direct parent
+        return Response(
+            IssueStateFlatSerializer(
+                [ancestors[pk] for pk in ancestor_ids if pk in ancestors], many=True
+            ).data,
+            status=status.HTTP_200_OK,
+        )
+
+
 class IssueLinkViewSet(BaseViewSet):
     permission_classes = [
         ProjectEntityPermission,
@@ -909,7 +1081,7 @@ class IssueLinkViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(issue_id=self.kwargs.get("issue_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=self.member_project_ids)
             .order_by("-created_at")
             .distinct()
         )
@@ -999,6 +1171,8 @@ class BulkCreateIssueLabelsEndpoint(BaseAPIView):
             batch_size=50,
             ignore_conflicts=True,
         )
+        # Bulk creates skip the model signals
+        invalidate_project_resources([project_id], ["labels"])
 
         return Response(
             {"labels": LabelSerializer(labels, many=True).data},
@@ -1099,18 +1273,7 @@ class IssueArchiveViewSet(BaseViewSet):
             .filter(**filters)
             .annotate(cycle_id=F("issue_cycle__cycle_id"))
             .annotate(module_id=F("issue_module__module_id"))
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=IssueAttachment.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**child_count_annotations("link_count", "attachment_count"))
         )
 
         # Priority Ordering
@@ -1175,7 +1338,7 @@ class IssueArchiveViewSet(BaseViewSet):
             else issue_queryset.filter(parent__isnull=True)
         )
 
-        issues = IssueLiteSerializer(issue_queryset, many=True).data
+        issues = project_queryset(IssueLiteSerializer(), issue_queryset)
 
         ## Grouping the results
         group_by = request.GET.get("group_by", False)
@@ -1250,7 +1413,7 @@ class IssueSubscriberViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(issue_id=self.kwargs.get("issue_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=self.member_project_ids)
             .order_by("-created_at")
             .distinct()
         )
@@ -1345,7 +1508,7 @@ class IssueReactionViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(issue_id=self.kwargs.get("issue_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=self.member_project_ids)
             .order_by("-created_at")
             .distinct()
         )
@@ -1410,7 +1573,7 @@ class CommentReactionViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(comment_id=self.kwargs.get("comment_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=self.member_project_ids)
             .order_by("-created_at")
             .distinct()
         )
@@ -1902,7 +2065,7 @@ class IssueRelationViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(issue_id=self.kwargs.get("issue_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=self.member_project_ids)
             .select_related("project")
             .select_related("workspace")
             .select_related("issue")
@@ -2005,12 +2168,7 @@ class ProjectIssuesPublicEndpoint(BaseAPIView):
         order_by_param = request.GET.get("order_by", "-created_at")
 
         issue_queryset = (
-            Issue.issue_objects.annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            Issue.issue_objects.annotate(**child_count_annotations("sub_issues_count"))
             .filter(project_id=project_id)
             .filter(workspace__slug=slug)
             .select_related("project", "workspace", "state", "parent")
@@ -2030,18 +2188,7 @@ class ProjectIssuesPublicEndpoint(BaseAPIView):
             .filter(**filters)
             .annotate(cycle_id=F("issue_cycle__cycle_id"))
             .annotate(module_id=F("issue_module__module_id"))
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=IssueAttachment.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**child_count_annotations("link_count", "attachment_count"))
         )
 
         # Priority Ordering
@@ -2158,12 +2305,7 @@ class IssueDraftViewSet(BaseViewSet):
 
     def get_queryset(self):
         return (
-            Issue.objects.annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            Issue.objects.annotate(**child_count_annotations("sub_issues_count"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(is_draft=True)
@@ -2196,18 +2338,7 @@ class IssueDraftViewSet(BaseViewSet):
             .filter(**filters)
             .annotate(cycle_id=F("issue_cycle__cycle_id"))
             .annotate(module_id=F("issue_module__module_id"))
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=IssueAttachment.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**child_count_annotations("link_count", "attachment_count"))
         )
 
         # Priority Ordering
@@ -2266,7 +2397,7 @@ class IssueDraftViewSet(BaseViewSet):
         else:
             issue_queryset = issue_queryset.order_by(order_by_param)
 
-        issues = IssueLiteSerializer(issue_queryset, many=True).data
+        issues = project_queryset(IssueLiteSerializer(), issue_queryset)
 
         ## Grouping the results
         group_by = request.GET.get("group_by", False)
@@ -5,6 +5,7 @@ import json
 from django.utils import timezone
 from django.db import IntegrityError
 from django.db.models import Prefetch, F, OuterRef, Func, Exists, Count, Q
+from django.db.models.functions import Coalesce
 from django.core import serializers
 from django.utils.decorators import method_decorator
 from django.views.decorators.gzip import gzip_page
@@ -37,8 +38,11 @@ from plane.db.models import (
 )
 from plane.bgtasks.issue_activites_task import issue_activity
 from plane.utils.grouper import group_results
+from plane.utils.issue_counts import child_count_annotations
 from plane.utils.issue_filters import issue_filters
 from plane.utils.analytics_plot import burndown_plot
+from plane.utils.progress import ISSUE_COUNT_FIELDS, refresh_module_progress
+from plane.utils.view_filters import invalidate_project_issues
 
 
 class ModuleViewSet(WebhookMixin, BaseViewSet):
@@ -80,63 +84,10 @@ class ModuleViewSet(WebhookMixin, BaseViewSet):
                 )
             )
             .annotate(
-                total_issues=Count(
-                    "issue_module",
-                    filter=Q(
-                        issue_module__issue__archived_at__isnull=True,
-                        issue_module__issue__is_draft=False,
-                    ),
-                ),
-            )
-            .annotate(
-                completed_issues=Count(
-                    "issue_module__issue__state__group",
-                    filter=Q(
-                        issue_module__issue__state__group="completed",
-                        issue_module__issue__archived_at__isnull=True,
-                        issue_module__issue__is_draft=False,
-                    ),
-                )
-            )
-            .annotate(
-                cancelled_issues=Count(
-                    "issue_module__issue__state__group",
-                    filter=Q(
-                        issue_module__issue__state__group="cancelled",
-                        issue_module__issue__archived_at__isnull=True,
-                        issue_module__issue__is_draft=False,
-                    ),
-                )
-            )
-            .annotate(
-                started_issues=Count(
-                    "issue_module__issue__state__group",
-                    filter=Q(
-                        issue_module__issue__state__group="started",
-                        issue_module__issue__archived_at__isnull=True,
-                        issue_module__issue__is_draft=False,
-                    ),
-                )
-            )
-            .annotate(
-                unstarted_issues=Count(
-                    "issue_module__issue__state__group",
-                    filter=Q(
-                        issue_module__issue__state__group="unstarted",
-                        issue_module__issue__archived_at__isnull=True,
-                        issue_module__issue__is_draft=False,
-                    ),
-                )
-            )
-            .annotate(
-                backlog_issues=Count(
-                    "issue_module__issue__state__group",
-                    filter=Q(
-                        issue_module__issue__state__group="backlog",
-                        issue_module__issue__archived_at__isnull=True,
-                        issue_module__issue__is_draft=False,
-                    ),
-                )
+                **{
+                    field: Coalesce(F(f"module_progress__{field}"), 0)
+                    for field in ISSUE_COUNT_FIELDS
+                }
             )
             .order_by("-is_favorite","-created_at")
         )
@@ -303,15 +254,12 @@ class ModuleIssueViewSet(BaseViewSet):
             super()
             .get_queryset()
             .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("issue"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
+                **child_count_annotations("sub_issues_count", prefix="issue__")
             )
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(module_id=self.kwargs.get("module_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=self.member_project_ids)
             .select_related("project")
             .select_related("workspace")
             .select_related("module")
@@ -329,12 +277,7 @@ class ModuleIssueViewSet(BaseViewSet):
         filters = issue_filters(request.query_params, "GET")
         issues = (
             Issue.issue_objects.filter(issue_module__module_id=module_id)
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**child_count_annotations("sub_issues_count"))
             .annotate(bridge_id=F("issue_module__id"))
             .filter(project_id=project_id)
             .filter(workspace__slug=slug)
@@ -346,18 +289,7 @@ class ModuleIssueViewSet(BaseViewSet):
             .prefetch_related("labels")
             .order_by(order_by)
             .filter(**filters)
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=IssueAttachment.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**child_count_annotations("link_count", "attachment_count"))
         )
         issues_data = IssueStateSerializer(issues, many=True).data
 
@@ -436,6 +368,16 @@ class ModuleIssueViewSet(BaseViewSet):
             batch_size=10,
         )
 
+        # Bulk writes skip the model signals, refresh both ends of a move
+        refresh_module_progress(
+            [module_id]
+            + [
+                activity["old_module_id"]
+                for activity in update_module_issue_activity
+            ]
+        )
+        invalidate_project_issues([project_id])
+
         # Capture Issue Activity
         issue_activity.delay(
             type="module.activity.created",
@@ -502,7 +444,7 @@ class ModuleLinkViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(module_id=self.kwargs.get("module_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=self.member_project_ids)
             .order_by("-created_at")
             .distinct()
         )
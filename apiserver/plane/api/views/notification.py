@@ -6,7 +6,7 @@ from django.utils import timezone
 from rest_framework import status
 from rest_framework.response import Response
 from sentry_sdk import capture_exception
-from plane.utils.paginator import BasePaginator
+from plane.utils.paginator import BasePaginator, SeekPaginator
 
 # Module imports
 from .base import BaseViewSet, BaseAPIView
@@ -102,6 +102,8 @@ class NotificationViewSet(BaseViewSet, BasePaginator):
             return self.paginate(
                 request=request,
                 queryset=(notifications),
+                paginator_cls=SeekPaginator,
+                order_by=["snoozed_till", "-created_at"],
                 on_results=lambda notifications: NotificationSerializer(
                     notifications, many=True
                 ).data,
@@ -7,7 +7,6 @@ from datetime import datetime
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError
 from django.db.models import (
-    Prefetch,
     Q,
     Exists,
     OuterRef,
@@ -65,6 +64,8 @@ from plane.db.models import (
 )
 
 from plane.bgtasks.project_invitation_task import project_invitation
+from plane.utils.paginator import SeekPaginator
+from plane.utils.etag import project_scope, workspace_scope
 
 
 class ProjectViewSet(WebhookMixin, BaseViewSet):
@@ -81,6 +82,11 @@ class ProjectViewSet(WebhookMixin, BaseViewSet):
             return ProjectSerializer
         return ProjectDetailSerializer
 
+    def get_etag_scopes(self):
+        if self.action != "list":
+            return None
+        return [workspace_scope(self.kwargs.get("slug"), "projects")]
+
     def get_queryset(self):
         return self.filter_queryset(
             super()
@@ -161,29 +167,24 @@ class ProjectViewSet(WebhookMixin, BaseViewSet):
         projects = (
             self.get_queryset()
             .annotate(sort_order=Subquery(sort_order_query))
-            .prefetch_related(
-                Prefetch(
-                    "project_projectmember",
-                    queryset=ProjectMember.objects.filter(
-                        workspace__slug=slug,
-                        is_active=True,
-                    ).select_related("member"),
-                )
-            )
             .order_by("sort_order", "name")
         )
+        # Members are embedded for the whole page, only their ids with members=ids
+        context = {"members": request.GET.get("members")}
         if request.GET.get("per_page", False) and request.GET.get("cursor", False):
             return self.paginate(
                 request=request,
                 queryset=(projects),
+                paginator_cls=SeekPaginator,
+                order_by=["sort_order", "name"],
                 on_results=lambda projects: ProjectListSerializer(
-                    projects, many=True
+                    projects, many=True, context=context
                 ).data,
             )
 
         return Response(
             ProjectListSerializer(
-                projects, many=True, fields=fields if fields else None
+                projects, many=True, fields=fields if fields else None, context=context
             ).data
         )
 
@@ -601,6 +602,16 @@ class ProjectMemberViewSet(BaseViewSet):
         "member__first_name",
     ]
 
+    def get_etag_scopes(self):
+        if self.action != "list":
+            return None
+        project_id = self.kwargs.get("project_id")
+        return [
+            project_scope(project_id, "members"),
+            project_scope(project_id, "project"),
+            workspace_scope(self.kwargs.get("slug"), "workspace"),
+        ]
+
     def get_queryset(self):
         return self.filter_queryset(
             super()
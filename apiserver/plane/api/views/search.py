@@ -2,7 +2,7 @@
 import re
 
 # Django imports
-from django.db.models import Q
+from django.db.models import Q, Value, FloatField
 
 # Third party imports
 from rest_framework import status
@@ -11,8 +11,20 @@ from sentry_sdk import capture_exception
 
 # Module imports
 from .base import BaseAPIView
-from plane.db.models import Workspace, Project, Issue, Cycle, Module, Page, IssueView
+from plane.db.models import (
+    Workspace,
+    WorkspaceMember,
+    Project,
+    ProjectMember,
+    Issue,
+    IssueComment,
+    Cycle,
+    Module,
+    Page,
+    IssueView,
+)
 from plane.utils.issue_search import search_issues
+from plane.utils.search import search_query, search_rank
 
 
 class GlobalSearchEndpoint(BaseAPIView):
@@ -20,151 +32,130 @@ class GlobalSearchEndpoint(BaseAPIView):
     also show related workspace if found
     """
 
-    def filter_workspaces(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-        return (
-            Workspace.objects.filter(q, workspace_member__member=self.request.user)
-            .distinct()
-            .values("name", "id", "slug")
-        )
+    # Number of hits returned per entity type
+    result_limit = 20
 
-    def filter_projects(self, query, slug, project_id, workspace_search):
-        fields = ["name", "identifier"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-        return (
-            Project.objects.filter(
-                q,
-                Q(project_projectmember__member=self.request.user) | Q(network=2),
-                workspace__slug=slug,
-            )
-            .distinct()
-            .values("name", "id", "identifier", "workspace__slug")
-        )
+    def member_projects(self, slug):
+        return ProjectMember.objects.filter(
+            member=self.request.user, workspace__slug=slug
+        ).values("project_id")
 
-    def filter_issues(self, query, slug, project_id, workspace_search):
-        fields = ["name", "sequence_id", "project__identifier"]
-        q = Q()
-        for field in fields:
-            if field == "sequence_id":
-                sequences = re.findall(r"\d+\.\d+|\d+", query)
-                for sequence_id in sequences:
-                    q |= Q(**{"sequence_id": sequence_id})
-            else:
-                q |= Q(**{f"{field}__icontains": query})
-
-        issues = Issue.issue_objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
+    def filter_project_entities(
+        self, queryset, query, slug, project_id, workspace_search
+    ):
+        queryset = queryset.filter(
+            name__icontains=query,
+            project_id__in=self.member_projects(slug),
             workspace__slug=slug,
         )
 
         if workspace_search == "false" and project_id:
-            issues = issues.filter(project_id=project_id)
+            queryset = queryset.filter(project_id=project_id)
 
-        return issues.distinct().values(
+        return queryset.values(
             "name",
             "id",
-            "sequence_id",
-            "project__identifier",
             "project_id",
+            "project__identifier",
             "workspace__slug",
-        )
+        )[: self.result_limit]
 
-    def filter_cycles(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
+    def filter_workspaces(self, query, slug, project_id, workspace_search):
+        return Workspace.objects.filter(
+            name__icontains=query,
+            pk__in=WorkspaceMember.objects.filter(member=self.request.user).values(
+                "workspace_id"
+            ),
+        ).values("name", "id", "slug")[: self.result_limit]
+
+    def filter_projects(self, query, slug, project_id, workspace_search):
+        return Project.objects.filter(
+            Q(name__icontains=query) | Q(identifier__icontains=query),
+            Q(pk__in=self.member_projects(slug)) | Q(network=2),
+            workspace__slug=slug,
+        ).values("name", "id", "identifier", "workspace__slug")[: self.result_limit]
+
+    def filter_issues(self, query, slug, project_id, workspace_search):
         q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
+        sequences = re.findall(r"\d+\.\d+|\d+", query)
+        for sequence_id in sequences:
+            q |= Q(**{"sequence_id": sequence_id})
+
+        # An exact project identifier lists the issues of that project
+        q |= Q(project__identifier__iexact=query.strip())
+
+        search = search_query(query)
+        if search is not None:
+            # Issues whose name, description or comments match
+            q |= Q(search_vector=search) | Q(
+                pk__in=IssueComment.objects.filter(
+                    search_vector=search, workspace__slug=slug
+                ).values("issue_id")
+            )
 
-        cycles = Cycle.objects.filter(
+        issues = Issue.issue_objects.filter(
             q,
-            project__project_projectmember__member=self.request.user,
+            project_id__in=self.member_projects(slug),
             workspace__slug=slug,
         )
 
         if workspace_search == "false" and project_id:
-            cycles = cycles.filter(project_id=project_id)
+            issues = issues.filter(project_id=project_id)
 
-        return cycles.distinct().values(
-            "name",
-            "id",
-            "project_id",
-            "project__identifier",
-            "workspace__slug",
+        return (
+            issues.annotate(
+                rank=search_rank(search)
+                if search is not None
+                else Value(0.0, output_field=FloatField())
+            )
+            .order_by("-rank", "-created_at")
+            .values(
+                "name",
+                "id",
+                "sequence_id",
+                "project__identifier",
+                "project_id",
+                "workspace__slug",
+            )[: self.result_limit]
         )
 
-    def filter_modules(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-
-        modules = Module.objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
-            workspace__slug=slug,
+    def filter_cycles(self, query, slug, project_id, workspace_search):
+        return self.filter_project_entities(
+            Cycle.objects.all(), query, slug, project_id, workspace_search
         )
 
-        if workspace_search == "false" and project_id:
-            modules = modules.filter(project_id=project_id)
-
-        return modules.distinct().values(
-            "name",
-            "id",
-            "project_id",
-            "project__identifier",
-            "workspace__slug",
+    def filter_modules(self, query, slug, project_id, workspace_search):
+        return self.filter_project_entities(
+            Module.objects.all(), query, slug, project_id, workspace_search
         )
 
     def filter_pages(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-
+        search = search_query(query)
         pages = Page.objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
+            Q(search_vector=search) if search is not None else Q(name__icontains=query),
+            project_id__in=self.member_projects(slug),
             workspace__slug=slug,
         )
 
         if workspace_search == "false" and project_id:
             pages = pages.filter(project_id=project_id)
 
-        return pages.distinct().values(
+        if search is not None:
+            pages = pages.annotate(rank=search_rank(search)).order_by(
+                "-rank", "-created_at"
+            )
+
+        return pages.values(
             "name",
             "id",
             "project_id",
             "project__identifier",
             "workspace__slug",
-        )
+        )[: self.result_limit]
 
     def filter_views(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-
-        issue_views = IssueView.objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
-            workspace__slug=slug,
-        )
-
-        if workspace_search == "false" and project_id:
-            issue_views = issue_views.filter(project_id=project_id)
-
-        return issue_views.distinct().values(
-            "name",
-            "id",
-            "project_id",
-            "project__identifier",
-            "workspace__slug",
+        return self.filter_project_entities(
+            IssueView.objects.all(), query, slug, project_id, workspace_search
         )
 
     def get(self, request, slug):
@@ -220,7 +211,9 @@ class IssueSearchEndpoint(BaseAPIView):
 
         issues = Issue.issue_objects.filter(
             workspace__slug=slug,
-            project__project_projectmember__member=self.request.user,
+            project_id__in=ProjectMember.objects.filter(
+                member=self.request.user, workspace__slug=slug
+            ).values("project_id"),
         )
 
         if workspace_search == "false":
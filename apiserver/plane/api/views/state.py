@@ -14,6 +14,7 @@ from . import BaseViewSet, BaseAPIView
 from plane.api.serializers import StateSerializer
 from plane.api.permissions import ProjectEntityPermission
 from plane.db.models import State, Issue
+from plane.utils.etag import invalidate_project_resources, project_scope
 
 
 class StateViewSet(BaseViewSet):
@@ -26,13 +27,18 @@ class StateViewSet(BaseViewSet):
     def perform_create(self, serializer):
         serializer.save(project_id=self.kwargs.get("project_id"))
 
+    def get_etag_scopes(self):
+        if self.action != "list":
+            return None
+        return [project_scope(self.kwargs.get("project_id"), "states")]
+
     def get_queryset(self):
         return self.filter_queryset(
             super()
             .get_queryset()
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=self.member_project_ids)
             .filter(~Q(name="Triage"))
             .select_related("project")
             .select_related("workspace")
@@ -67,6 +73,7 @@ class StateViewSet(BaseViewSet):
         _ = State.objects.filter(
             workspace__slug=slug, project_id=project_id, pk=pk
         ).update(default=True)
+        invalidate_project_resources([project_id], ["states"])
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     def destroy(self, request, slug, project_id, pk):
@@ -14,7 +14,7 @@ from plane.api.serializers import (
 
 from plane.api.views.base import BaseViewSet, BaseAPIView
 from plane.db.models import User, IssueActivity, WorkspaceMember
-from plane.utils.paginator import BasePaginator
+from plane.utils.paginator import BasePaginator, SeekPaginator
 
 
 class UserEndpoint(BaseViewSet):
@@ -79,6 +79,8 @@ class UserActivityEndpoint(BaseAPIView, BasePaginator):
         return self.paginate(
             request=request,
             queryset=queryset,
+            paginator_cls=SeekPaginator,
+            order_by="-created_at",
             on_results=lambda issue_activities: IssueActivitySerializer(
                 issue_activities, many=True
             ).data,
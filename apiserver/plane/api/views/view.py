@@ -27,6 +27,7 @@ from plane.api.serializers import (
     IssueViewSerializer,
     IssueLiteSerializer,
     IssueViewFavoriteSerializer,
+    project_queryset,
 )
 from plane.api.permissions import WorkspaceEntityPermission, ProjectEntityPermission
 from plane.db.models import (
@@ -40,7 +41,9 @@ from plane.db.models import (
     IssueAttachment,
 )
 from plane.utils.issue_filters import issue_filters
+from plane.utils.view_filters import filter_issues, get_saved_view
 from plane.utils.grouper import group_results
+from plane.utils.issue_counts import child_count_annotations
 
 
 class GlobalViewViewSet(BaseViewSet):
@@ -72,12 +75,7 @@ class GlobalViewIssuesViewSet(BaseViewSet):
 
     def get_queryset(self):
         return (
-            Issue.issue_objects.annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            Issue.issue_objects.annotate(**child_count_annotations("sub_issues_count"))
             .filter(workspace__slug=self.kwargs.get("slug"))
             .select_related("project")
             .select_related("workspace")
@@ -95,8 +93,6 @@ class GlobalViewIssuesViewSet(BaseViewSet):
 
     @method_decorator(gzip_page)
     def list(self, request, slug):
-        filters = issue_filters(request.query_params, "GET")
-
         # Custom ordering for priority and state
         priority_order = ["urgent", "high", "medium", "low", "none"]
         state_order = ["backlog", "unstarted", "started", "completed", "cancelled"]
@@ -104,23 +100,16 @@ class GlobalViewIssuesViewSet(BaseViewSet):
         order_by_param = request.GET.get("order_by", "-created_at")
 
         issue_queryset = (
-            self.get_queryset()
-            .filter(**filters)
-            .filter(project__project_projectmember__member=self.request.user)
+            filter_issues(
+                self.get_queryset(),
+                request,
+                view=get_saved_view(request, slug),
+                project_ids=self.member_project_ids,
+            )
+            .filter(project_id__in=self.member_project_ids)
             .annotate(cycle_id=F("issue_cycle__cycle_id"))
             .annotate(module_id=F("issue_module__module_id"))
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=IssueAttachment.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**child_count_annotations("link_count", "attachment_count"))
         )
 
         # Priority Ordering
@@ -178,7 +167,7 @@ class GlobalViewIssuesViewSet(BaseViewSet):
             )
         else:
             issue_queryset = issue_queryset.order_by(order_by_param)
-        issues = IssueLiteSerializer(issue_queryset, many=True).data
+        issues = project_queryset(IssueLiteSerializer(), issue_queryset)
 
         ## Grouping the results
         group_by = request.GET.get("group_by", False)
@@ -221,7 +210,7 @@ class IssueViewViewSet(BaseViewSet):
             .get_queryset()
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=self.member_project_ids)
             .select_related("project")
             .select_related("workspace")
             .annotate(is_favorite=Exists(subquery))
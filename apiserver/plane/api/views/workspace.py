@@ -44,6 +44,7 @@ from plane.api.serializers import (
     IssueLiteSerializer,
     WorkspaceMemberAdminSerializer,
     WorkspaceMemberMeSerializer,
+    project_queryset,
 )
 from plane.api.views.base import BaseAPIView
 from . import BaseViewSet
@@ -74,6 +75,8 @@ from plane.api.permissions import (
 from plane.bgtasks.workspace_invitation_task import workspace_invitation
 from plane.utils.issue_filters import issue_filters
 from plane.utils.grouper import group_results
+from plane.utils.issue_counts import child_count_annotations
+from plane.utils.dashboard import get_issue_stats
 
 
 class WorkSpaceViewSet(BaseViewSet):
@@ -189,15 +192,11 @@ class UserWorkSpacesEndpoint(BaseAPIView):
         )
 
         workspace = (
-            (
-                Workspace.objects.prefetch_related(
-                    Prefetch("workspace_member", queryset=WorkspaceMember.objects.all())
-                )
-                .filter(
-                    workspace_member__member=request.user,
-                )
-                .select_related("owner")
+            # Members are only counted, so none are prefetched
+            Workspace.objects.filter(
+                workspace_member__member=request.user,
             )
+            .select_related("owner")
             .annotate(total_members=member_count)
             .annotate(total_issues=issue_count)
         )
@@ -859,41 +858,7 @@ class UserWorkspaceDashboardEndpoint(BaseAPIView):
             .order_by("week_in_month")
         )
 
-        assigned_issues = Issue.issue_objects.filter(
-            workspace__slug=slug, assignees__in=[request.user]
-        ).count()
-
-        pending_issues_count = Issue.issue_objects.filter(
-            ~Q(state__group__in=["completed", "cancelled"]),
-            workspace__slug=slug,
-            assignees__in=[request.user],
-        ).count()
-
-        completed_issues_count = Issue.issue_objects.filter(
-            workspace__slug=slug,
-            assignees__in=[request.user],
-            state__group="completed",
-        ).count()
-
-        issues_due_week = (
-            Issue.issue_objects.filter(
-                workspace__slug=slug,
-                assignees__in=[request.user],
-            )
-            .annotate(target_week=ExtractWeek("target_date"))
-            .filter(target_week=timezone.now().date().isocalendar()[1])
-            .count()
-        )
-
-        state_distribution = (
-            Issue.issue_objects.filter(
-                workspace__slug=slug, assignees__in=[request.user]
-            )
-            .annotate(state_group=F("state__group"))
-            .values("state_group")
-            .annotate(state_count=Count("state_group"))
-            .order_by("state_group")
-        )
+        issue_stats = get_issue_stats(slug, request.user.id)
 
         overdue_issues = Issue.issue_objects.filter(
             ~Q(state__group__in=["completed", "cancelled"]),
@@ -915,11 +880,12 @@ class UserWorkspaceDashboardEndpoint(BaseAPIView):
             {
                 "issue_activities": issue_activities,
                 "completed_issues": completed_issues,
-                "assigned_issues_count": assigned_issues,
-                "pending_issues_count": pending_issues_count,
-                "completed_issues_count": completed_issues_count,
-                "issues_due_week_count": issues_due_week,
-                "state_distribution": state_distribution,
+                "assigned_issues_count": issue_stats["assigned"],
+                "pending_issues_count": issue_stats["pending"],
+                "completed_issues_count": issue_stats["completed"],
+                "issues_due_week_count": issue_stats["due_week"],
+                "overdue_issues_count": issue_stats["overdue"],
+                "state_distribution": issue_stats["state_distribution"],
                 "overdue_issues": overdue_issues,
                 "upcoming_issues": upcoming_issues,
             },
@@ -950,94 +916,8 @@ class WorkspaceUserProfileStatsEndpoint(BaseAPIView):
     def get(self, request, slug, user_id):
         filters = issue_filters(request.query_params, "GET")
 
-        state_distribution = (
-            Issue.issue_objects.filter(
-                workspace__slug=slug,
-                assignees__in=[user_id],
-                project__project_projectmember__member=request.user,
-            )
-            .filter(**filters)
-            .annotate(state_group=F("state__group"))
-            .values("state_group")
-            .annotate(state_count=Count("state_group"))
-            .order_by("state_group")
-        )
-
-        priority_order = ["urgent", "high", "medium", "low", "none"]
-
-        priority_distribution = (
-            Issue.issue_objects.filter(
-                workspace__slug=slug,
-                assignees__in=[user_id],
-                project__project_projectmember__member=request.user,
-            )
-            .filter(**filters)
-            .values("priority")
-            .annotate(priority_count=Count("priority"))
-            .filter(priority_count__gte=1)
-            .annotate(
-                priority_order=Case(
-                    *[
-                        When(priority=p, then=Value(i))
-                        for i, p in enumerate(priority_order)
-                    ],
-                    default=Value(len(priority_order)),
-                    output_field=IntegerField(),
-                )
-            )
-            .order_by("priority_order")
-        )
-
-        created_issues = (
-            Issue.issue_objects.filter(
-                workspace__slug=slug,
-                project__project_projectmember__member=request.user,
-                created_by_id=user_id,
-            )
-            .filter(**filters)
-            .count()
-        )
-
-        assigned_issues_count = (
-            Issue.issue_objects.filter(
-                workspace__slug=slug,
-                assignees__in=[user_id],
-                project__project_projectmember__member=request.user,
-            )
-            .filter(**filters)
-            .count()
-        )
-
-        pending_issues_count = (
-            Issue.issue_objects.filter(
-                ~Q(state__group__in=["completed", "cancelled"]),
-                workspace__slug=slug,
-                assignees__in=[user_id],
-                project__project_projectmember__member=request.user,
-            )
-            .filter(**filters)
-            .count()
-        )
-
-        completed_issues_count = (
-            Issue.issue_objects.filter(
-                workspace__slug=slug,
-                assignees__in=[user_id],
-                state__group="completed",
-                project__project_projectmember__member=request.user,
-            )
-            .filter(**filters)
-            .count()
-        )
-
-        subscribed_issues_count = (
-            IssueSubscriber.objects.filter(
-                workspace__slug=slug,
-                subscriber_id=user_id,
-                project__project_projectmember__member=request.user,
-            )
-            .filter(**filters)
-            .count()
+        issue_stats = get_issue_stats(
+            slug, user_id, project_ids=self.member_project_ids, filters=filters
         )
 
         upcoming_cycles = CycleIssue.objects.filter(
@@ -1059,13 +939,13 @@ class WorkspaceUserProfileStatsEndpoint(BaseAPIView):
 
         return Response(
             {
-                "state_distribution": state_distribution,
-                "priority_distribution": priority_distribution,
-                "created_issues": created_issues,
-                "assigned_issues": assigned_issues_count,
-                "completed_issues": completed_issues_count,
-                "pending_issues": pending_issues_count,
-                "subscribed_issues": subscribed_issues_count,
+                "state_distribution": issue_stats["state_distribution"],
+                "priority_distribution": issue_stats["priority_distribution"],
+                "created_issues": issue_stats["created"],
+                "assigned_issues": issue_stats["assigned"],
+                "completed_issues": issue_stats["completed"],
+                "pending_issues": issue_stats["pending"],
+                "subscribed_issues": issue_stats["subscribed"],
                 "present_cycles": present_cycle,
                 "upcoming_cycles": upcoming_cycles,
             }
@@ -1214,12 +1094,7 @@ class WorkspaceUserProfileIssuesEndpoint(BaseAPIView):
                 project__project_projectmember__member=request.user,
             )
             .filter(**filters)
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**child_count_annotations("sub_issues_count"))
             .select_related("project", "workspace", "state", "parent")
             .prefetch_related("assignees", "labels")
             .prefetch_related(
@@ -1229,18 +1104,7 @@ class WorkspaceUserProfileIssuesEndpoint(BaseAPIView):
                 )
             )
             .order_by("-created_at")
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=IssueAttachment.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**child_count_annotations("link_count", "attachment_count"))
         ).distinct()
 
         # Priority Ordering
@@ -1299,7 +1163,7 @@ class WorkspaceUserProfileIssuesEndpoint(BaseAPIView):
         else:
             issue_queryset = issue_queryset.order_by(order_by_param)
 
-        issues = IssueLiteSerializer(issue_queryset, many=True).data
+        issues = project_queryset(IssueLiteSerializer(), issue_queryset)
 
         ## Grouping the results
         group_by = request.GET.get("group_by", False)
@@ -1,4 +1,6 @@
 # Django imports
+from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 from django.db.models import Q
 
@@ -7,7 +9,13 @@ from rest_framework import authentication
 from rest_framework.exceptions import AuthenticationFailed
 
 # Module imports
-from plane.db.models import APIToken
+from plane.db.models import (
+    APIToken,
+    User,
+    get_api_token_cache_key,
+    API_TOKEN_LAST_USED_KEY,
+)
+from plane.settings.redis import redis_instance
 
 
 class APIKeyAuthentication(authentication.BaseAuthentication):
@@ -22,7 +30,18 @@ class APIKeyAuthentication(authentication.BaseAuthentication):
     def get_api_token(self, request):
         return request.headers.get(self.auth_header_name)
 
-    def validate_api_token(self, token):
+    def get_cached_api_token(self, token):
+        cache_key = get_api_token_cache_key(token)
+        cached_token = cache.get(cache_key)
+        if cached_token is not None:
+            if (
+                cached_token["expired_at"] is None
+                or cached_token["expired_at"] > timezone.now()
+            ):
+                return cached_token
+            cache.delete(cache_key)
+            return None
+
         try:
             api_token = APIToken.objects.get(
                 Q(Q(expired_at__gt=timezone.now()) | Q(expired_at__isnull=True)),
@@ -30,12 +49,41 @@ class APIKeyAuthentication(authentication.BaseAuthentication):
                 is_active=True,
             )
         except APIToken.DoesNotExist:
+            return None
+
+        cached_token = {
+            "id": api_token.id,
+            "user_id": api_token.user_id,
+            "token": api_token.token,
+            "expired_at": api_token.expired_at,
+        }
+        # Do not keep the token cached past its expiry
+        timeout = settings.API_TOKEN_CACHE_TTL
+        if api_token.expired_at is not None:
+            timeout = min(
+                timeout, int((api_token.expired_at - timezone.now()).total_seconds())
+            )
+        if timeout > 0:
+            cache.set(cache_key, cached_token, timeout=timeout)
+        return cached_token
+
+    def validate_api_token(self, token):
+        api_token = self.get_cached_api_token(token)
+        if api_token is None:
             raise AuthenticationFailed("Given API token is not valid")
 
-        # save api token last used
-        api_token.last_used = timezone.now()
-        api_token.save(update_fields=["last_used"])
-        return (api_token.user, api_token.token)
+        # Only the user id is cached, a deactivated user is refused at once
+        user = User.objects.filter(pk=api_token["user_id"], is_active=True).first()
+        if user is None:
+            raise AuthenticationFailed("User inactive or deleted")
+
+        # last used is flushed to the database in bulk by a periodic task
+        redis_instance().hset(
+            API_TOKEN_LAST_USED_KEY,
+            str(api_token["id"]),
+            timezone.now().isoformat(),
+        )
+        return (user, api_token["token"])
 
     def authenticate(self, request):
         token = self.get_api_token(request=request)
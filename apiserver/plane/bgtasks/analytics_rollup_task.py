@@ -0,0 +1,48 @@
+# Django imports
+from django.conf import settings
+
+# Third party imports
+from celery import shared_task
+from sentry_sdk import capture_exception
+
+# Module imports
+from plane.db.models import Project
+from plane.utils.analytics_rollup import (
+    refresh_analytics_rollups,
+    refresh_pending_rollups_of,
+)
+
+
+@shared_task
+def refresh_project_rollups(project_id):
+    try:
+        refresh_analytics_rollups(project_id)
+    except Exception as e:
+        if settings.DEBUG:
+            print(e)
+        capture_exception(e)
+        return
+
+
+@shared_task
+def refresh_pending_rollups(project_id):
+    # Days queued by schedule_issue_rollups since the last run
+    try:
+        refresh_pending_rollups_of(project_id)
+    except Exception as e:
+        if settings.DEBUG:
+            print(e)
+        capture_exception(e)
+        return
+
+
+@shared_task
+def rebuild_analytics_rollups():
+    # Picks up the writes that skip issue activity, like cascades and bulk paths
+    for project_id in Project.objects.values_list("id", flat=True).iterator():
+        try:
+            refresh_analytics_rollups(project_id)
+        except Exception as e:
+            if settings.DEBUG:
+                print(e)
+            capture_exception(e)
@@ -0,0 +1,91 @@
+# Python imports
+import json
+from datetime import timedelta
+
+# Django imports
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DataError, IntegrityError, transaction
+from django.utils import timezone
+
+# Third party imports
+from celery import shared_task
+from sentry_sdk import capture_exception
+
+# Module imports
+from plane.db.models import APIActivityLog
+from plane.settings.redis import redis_instance
+
+API_ACTIVITY_LOG_QUEUE = "api_activity_logs"
+# Batch being written, dropped only once it is in the database
+API_ACTIVITY_LOG_PROCESSING = "api_activity_logs:processing"
+API_ACTIVITY_LOG_FLUSHING = "api_activity_logs:flushing"
+
+
+def take_batch(ri, batch_size):
+    """Batch left over by an interrupted flush, else the next one queued"""
+    records = ri.lrange(API_ACTIVITY_LOG_PROCESSING, 0, -1)
+    if records:
+        return records
+
+    pipe = ri.pipeline()
+    for _ in range(batch_size):
+        pipe.lmove(API_ACTIVITY_LOG_QUEUE, API_ACTIVITY_LOG_PROCESSING)
+    return [record for record in pipe.execute() if record is not None]
+
+
+def parse_records(records):
+    api_activity_logs = []
+    for record in records:
+        try:
+            api_activity_logs.append(APIActivityLog(**json.loads(record)))
+        except (TypeError, ValueError) as e:
+            capture_exception(e)
+    return api_activity_logs
+
+
+def save_logs(api_activity_logs):
+    try:
+        APIActivityLog.objects.bulk_create(api_activity_logs, batch_size=100)
+    except (DataError, IntegrityError):
+        # A bad row fails the whole insert, write them one at a time and skip
+        # it. Other errors leave the batch for the next flush.
+        for api_activity_log in api_activity_logs:
+            try:
+                with transaction.atomic():
+                    api_activity_log.save(force_insert=True)
+            except (DataError, IntegrityError) as e:
+                capture_exception(e)
+
+
+@shared_task
+def flush_api_activity_logs():
+    ri = redis_instance()
+    batch_size = settings.API_ACTIVITY_LOG_BATCH_SIZE
+    # A single flush at a time owns the processing list
+    if not cache.add(API_ACTIVITY_LOG_FLUSHING, 1, timeout=300):
+        return
+    try:
+        while True:
+            records = take_batch(ri, batch_size)
+            if not records:
+                return
+
+            save_logs(parse_records(records))
+            ri.delete(API_ACTIVITY_LOG_PROCESSING)
+
+            if len(records) < batch_size:
+                return
+    except Exception as e:
+        capture_exception(e)
+        return
+    finally:
+        cache.delete(API_ACTIVITY_LOG_FLUSHING)
+
+
+@shared_task
+def delete_old_api_activity_logs():
+    APIActivityLog.objects.filter(
+        created_at__lte=timezone.now()
+        - timedelta(days=settings.API_ACTIVITY_LOG_RETENTION_DAYS)
+    ).delete()
@@ -0,0 +1,37 @@
+# Python imports
+from datetime import datetime
+
+# Third party imports
+from celery import shared_task
+
+# Module imports
+from plane.db.models import APIToken, API_TOKEN_LAST_USED_KEY
+from plane.settings.redis import redis_instance
+
+
+@shared_task
+def flush_api_token_last_used():
+    # last used timestamps are only recorded in redis on authentication, take
+    # the tokens used since the previous flush
+    pipe = redis_instance().pipeline()
+    pipe.hgetall(API_TOKEN_LAST_USED_KEY)
+    pipe.delete(API_TOKEN_LAST_USED_KEY)
+    last_used, _ = pipe.execute()
+    last_used = {
+        token_id.decode(): datetime.fromisoformat(used_at.decode())
+        for token_id, used_at in last_used.items()
+    }
+    if not last_used:
+        return
+
+    api_tokens_to_update = []
+    for api_token in APIToken.objects.filter(pk__in=list(last_used)).only(
+        "id", "last_used"
+    ):
+        used_at = last_used[str(api_token.id)]
+        if api_token.last_used is None or used_at > api_token.last_used:
+            api_token.last_used = used_at
+            api_tokens_to_update.append(api_token)
+
+    # Bulk update skips the save signal so the token cache is kept warm
+    APIToken.objects.bulk_update(api_tokens_to_update, ["last_used"], batch_size=100)
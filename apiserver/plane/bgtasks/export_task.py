@@ -3,16 +3,22 @@ import csv
 import io
 import json
 import boto3
+import shutil
 import zipfile
+import tempfile
 
 # Django imports
 from django.conf import settings
+from django.db.models import Q, Value
+from django.db.models.functions import Concat
+from django.contrib.postgres.aggregates import ArrayAgg
 from django.utils import timezone
 
 # Third party imports
 from celery import shared_task
 from sentry_sdk import capture_exception
 from botocore.client import Config
+from boto3.s3.transfer import TransferConfig
 from openpyxl import Workbook
 
 # Module imports
@@ -29,47 +35,49 @@ def dateConverter(time):
         return time.strftime("%a, %d %b %Y")
 
 
-def create_csv_file(data):
-    csv_buffer = io.StringIO()
-    csv_writer = csv.writer(csv_buffer, delimiter=",", quoting=csv.QUOTE_ALL)
+def write_csv_file(header, issues, entry):
+    # The zip entry is binary, csv writes through a text wrapper
+    with io.TextIOWrapper(entry, encoding="utf-8", newline="") as csv_buffer:
+        csv_writer = csv.writer(csv_buffer, delimiter=",", quoting=csv.QUOTE_ALL)
+        csv_writer.writerow(header)
+        for issue in issues:
+            csv_writer.writerow(generate_table_row(issue))
 
-    for row in data:
-        csv_writer.writerow(row)
 
-    csv_buffer.seek(0)
-    return csv_buffer.getvalue()
+def write_json_file(header, issues, entry):
+    # Same layout as json.dumps of the whole list, written one row at a time
+    entry.write(b"[")
+    for index, issue in enumerate(issues):
+        if index:
+            entry.write(b", ")
+        entry.write(json.dumps(generate_json_row(issue)).encode("utf-8"))
+    entry.write(b"]")
 
 
-def create_json_file(data):
-    return json.dumps(data)
-
-
-def create_xlsx_file(data):
-    workbook = Workbook()
-    sheet = workbook.active
-
-    for row in data:
-        sheet.append(row)
-
-    xlsx_buffer = io.BytesIO()
-    workbook.save(xlsx_buffer)
-    xlsx_buffer.seek(0)
-    return xlsx_buffer.getvalue()
-
-
-def create_zip_file(files):
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for filename, file_content in files:
-            zipf.writestr(filename, file_content)
+def write_xlsx_file(header, issues, entry):
+    # Write only workbooks keep no cells in memory, rows are flushed as appended
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(header)
+    for issue in issues:
+        sheet.append(generate_table_row(issue))
 
-    zip_buffer.seek(0)
-    return zip_buffer
+    with tempfile.SpooledTemporaryFile(
+        max_size=settings.EXPORT_SPOOL_MAX_SIZE
+    ) as xlsx_buffer:
+        workbook.save(xlsx_buffer)
+        xlsx_buffer.seek(0)
+        shutil.copyfileobj(xlsx_buffer, entry)
 
 
 def upload_to_s3(zip_file, workspace_id, token_id, slug):
     file_name = f"{workspace_id}/export-{slug}-{token_id[:6]}-{timezone.now()}.zip"
     expires_in = 7 * 24 * 60 * 60
+    # Large archives are sent as concurrent multipart chunks
+    transfer_config = TransferConfig(
+        multipart_threshold=settings.EXPORT_MULTIPART_CHUNK_SIZE,
+        multipart_chunksize=settings.EXPORT_MULTIPART_CHUNK_SIZE,
+    )
 
     if settings.DOCKERIZED and settings.USE_MINIO:
         s3 = boto3.client(
@@ -84,6 +92,7 @@ def upload_to_s3(zip_file, workspace_id, token_id, slug):
             settings.AWS_STORAGE_BUCKET_NAME,
             file_name,
             ExtraArgs={"ACL": "public-read", "ContentType": "application/zip"},
+            Config=transfer_config,
         )
         presigned_url = s3.generate_presigned_url(
             "get_object",
@@ -108,6 +117,7 @@ def upload_to_s3(zip_file, workspace_id, token_id, slug):
             settings.AWS_S3_BUCKET_NAME,
             file_name,
             ExtraArgs={"ACL": "public-read", "ContentType": "application/zip"},
+            Config=transfer_config,
         )
 
         presigned_url = s3.generate_presigned_url(
@@ -139,10 +149,8 @@ def generate_table_row(issue):
         f"{issue['created_by__first_name']} {issue['created_by__last_name']}"
         if issue["created_by__first_name"] and issue["created_by__last_name"]
         else "",
-        f"{issue['assignees__first_name']} {issue['assignees__last_name']}"
-        if issue["assignees__first_name"] and issue["assignees__last_name"]
-        else "",
-        issue["labels__name"],
+        ", ".join(issue["assignee_names"] or []),
+        ", ".join(issue["label_names"] or []),
         issue["issue_cycle__cycle__name"],
         dateConverter(issue["issue_cycle__cycle__start_date"]),
         dateConverter(issue["issue_cycle__cycle__end_date"]),
@@ -167,10 +175,8 @@ def generate_json_row(issue):
         "Created By": f"{issue['created_by__first_name']} {issue['created_by__last_name']}"
         if issue["created_by__first_name"] and issue["created_by__last_name"]
         else "",
-        "Assignee": f"{issue['assignees__first_name']} {issue['assignees__last_name']}"
-        if issue["assignees__first_name"] and issue["assignees__last_name"]
-        else "",
-        "Labels": issue["labels__name"],
+        "Assignee": ", ".join(issue["assignee_names"] or []),
+        "Labels": ", ".join(issue["label_names"] or []),
         "Cycle Name": issue["issue_cycle__cycle__name"],
         "Cycle Start Date": dateConverter(issue["issue_cycle__cycle__start_date"]),
         "Cycle End Date": dateConverter(issue["issue_cycle__cycle__end_date"]),
@@ -184,81 +190,6 @@ def generate_json_row(issue):
     }
 
 
-def update_json_row(rows, row):
-    matched_index = next(
-        (
-            index
-            for index, existing_row in enumerate(rows)
-            if existing_row["ID"] == row["ID"]
-        ),
-        None,
-    )
-
-    if matched_index is not None:
-        existing_assignees, existing_labels = (
-            rows[matched_index]["Assignee"],
-            rows[matched_index]["Labels"],
-        )
-        assignee, label = row["Assignee"], row["Labels"]
-
-        if assignee is not None and assignee not in existing_assignees:
-            rows[matched_index]["Assignee"] += f", {assignee}"
-        if label is not None and label not in existing_labels:
-            rows[matched_index]["Labels"] += f", {label}"
-    else:
-        rows.append(row)
-
-
-def update_table_row(rows, row):
-    matched_index = next(
-        (index for index, existing_row in enumerate(rows) if existing_row[0] == row[0]),
-        None,
-    )
-
-    if matched_index is not None:
-        existing_assignees, existing_labels = rows[matched_index][7:9]
-        assignee, label = row[7:9]
-
-        if assignee is not None and assignee not in existing_assignees:
-            rows[matched_index][7] += f", {assignee}"
-        if label is not None and label not in existing_labels:
-            rows[matched_index][8] += f", {label}"
-    else:
-        rows.append(row)
-
-
-def generate_csv(header, project_id, issues, files):
-    """
-    Generate CSV export for all the passed issues.
-    """
-    rows = [
-        header,
-    ]
-    for issue in issues:
-        row = generate_table_row(issue)
-        update_table_row(rows, row)
-    csv_file = create_csv_file(rows)
-    files.append((f"{project_id}.csv", csv_file))
-
-
-def generate_json(header, project_id, issues, files):
-    rows = []
-    for issue in issues:
-        row = generate_json_row(issue)
-        update_json_row(rows, row)
-    json_file = create_json_file(rows)
-    files.append((f"{project_id}.json", json_file))
-
-
-def generate_xlsx(header, project_id, issues, files):
-    rows = [header]
-    for issue in issues:
-        row = generate_table_row(issue)
-        update_table_row(rows, row)
-    xlsx_file = create_xlsx_file(rows)
-    files.append((f"{project_id}.xlsx", xlsx_file))
-
-
 @shared_task
 def issue_export_task(provider, workspace_id, project_ids, token_id, multiple, slug):
     try:
@@ -266,18 +197,14 @@ def issue_export_task(provider, workspace_id, project_ids, token_id, multiple, s
         exporter_instance.status = "processing"
         exporter_instance.save(update_fields=["status"])
 
+        # One row per issue, assignees and labels are folded into arrays in SQL
         workspace_issues = (
             (
                 Issue.objects.filter(
                     workspace__id=workspace_id,
                     project_id__in=project_ids,
                     project__project_projectmember__member=exporter_instance.initiated_by_id,
-                )
-                .select_related("project", "workspace", "state", "parent", "created_by")
-                .prefetch_related(
-                    "assignees", "labels", "issue_cycle__cycle", "issue_module__module"
-                )
-                .values(
+                ).values(
                     "id",
                     "project__identifier",
                     "project__name",
@@ -299,13 +226,25 @@ def issue_export_task(provider, workspace_id, project_ids, token_id, multiple, s
                     "issue_module__module__target_date",
                     "created_by__first_name",
                     "created_by__last_name",
-                    "assignees__first_name",
-                    "assignees__last_name",
-                    "labels__name",
                 )
             )
+            .annotate(
+                assignee_names=ArrayAgg(
+                    Concat(
+                        "assignees__first_name", Value(" "), "assignees__last_name"
+                    ),
+                    filter=Q(assignees__first_name__gt="", assignees__last_name__gt=""),
+                    distinct=True,
+                    default=None,
+                ),
+                label_names=ArrayAgg(
+                    "labels__name",
+                    filter=Q(labels__isnull=False),
+                    distinct=True,
+                    default=None,
+                ),
+            )
             .order_by("project__identifier", "sequence_id")
-            .distinct()
         )
         # CSV header
         header = [
@@ -331,36 +270,39 @@ def issue_export_task(provider, workspace_id, project_ids, token_id, multiple, s
         ]
 
         EXPORTER_MAPPER = {
-            "csv": generate_csv,
-            "json": generate_json,
-            "xlsx": generate_xlsx,
+            "csv": write_csv_file,
+            "json": write_json_file,
+            "xlsx": write_xlsx_file,
         }
 
-        files = []
         if multiple:
-            for project_id in project_ids:
-                issues = workspace_issues.filter(project__id=project_id)
-                exporter = EXPORTER_MAPPER.get(provider)
-                if exporter is not None:
-                    exporter(
-                        header,
-                        project_id,
-                        issues,
-                        files,
-                    )
-
+            exports = [
+                (project_id, workspace_issues.filter(project__id=project_id))
+                for project_id in project_ids
+            ]
         else:
-            exporter = EXPORTER_MAPPER.get(provider)
-            if exporter is not None:
-                exporter(
-                    header,
-                    workspace_id,
-                    workspace_issues,
-                    files,
-                )
+            exports = [(workspace_id, workspace_issues)]
 
-        zip_buffer = create_zip_file(files)
-        upload_to_s3(zip_buffer, workspace_id, token_id, slug)
+        # The archive stays in memory until it outgrows the spool size
+        with tempfile.SpooledTemporaryFile(
+            max_size=settings.EXPORT_SPOOL_MAX_SIZE
+        ) as zip_buffer:
+            with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zipf:
+                exporter = EXPORTER_MAPPER.get(provider)
+                if exporter is not None:
+                    for name, issues in exports:
+                        with zipf.open(
+                            f"{name}.{provider}", "w", force_zip64=True
+                        ) as entry:
+                            # Server side cursor, rows are fetched in chunks
+                            exporter(
+                                header,
+                                issues.iterator(chunk_size=2000),
+                                entry,
+                            )
+
+            zip_buffer.seek(0)
+            upload_to_s3(zip_buffer, workspace_id, token_id, slug)
 
     except Exception as e:
         exporter_instance = ExporterHistory.objects.get(token=token_id)
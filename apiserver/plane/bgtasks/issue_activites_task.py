@@ -29,7 +29,73 @@ from plane.db.models import (
     IssueComment,
 )
 from plane.api.serializers import IssueActivitySerializer
-from plane.bgtasks.notification_task import notifications
+from plane.bgtasks.notification_task import notifications, batch_notifications
+from plane.utils.analytics_rollup import (
+    ROLLUP_ACTIVITY_TYPES,
+    activity_issue_ids,
+    schedule_issue_rollups,
+)
+from plane.utils.dashboard import invalidate_issue_stats, issue_stats_users
+from plane.utils.view_filters import invalidate_project_issues
+
+
+def load_activity_data(data):
+    # Activity payloads arrive json encoded from the views
+    return json.loads(data) if isinstance(data, str) else data
+
+
+class ActivityLookup:
+    """Resolves the rows referenced by a set of issue diffs up front
+
+    Every state, label, user and parent issue named by the diffs is fetched
+    with a single `IN` query per model, so the track helpers only read from
+    dictionaries keyed by the stringified primary key.
+    """
+
+    def __init__(self, diffs):
+        state_ids, label_ids, user_ids, issue_ids = set(), set(), set(), set()
+        description_issue_ids = set()
+
+        for issue_id, requested_data, current_instance in diffs:
+            requested_data = load_activity_data(requested_data) or {}
+            current_instance = load_activity_data(current_instance) or {}
+            for data in (requested_data, current_instance):
+                state_ids.update([data.get("state"), data.get("closed_to")])
+                issue_ids.add(data.get("parent"))
+                label_ids.update(data.get("labels") or [])
+                user_ids.update(data.get("assignees") or [])
+            if "description_html" in requested_data and issue_id is not None:
+                description_issue_ids.add(issue_id)
+
+        self.states = self._by_pk(State.objects.filter(pk__in=self._ids(state_ids)))
+        self.labels = self._by_pk(Label.objects.filter(pk__in=self._ids(label_ids)))
+        self.users = self._by_pk(User.objects.filter(pk__in=self._ids(user_ids)))
+        self.issues = self._by_pk(
+            Issue.objects.filter(pk__in=self._ids(issue_ids)).select_related(
+                "project"
+            )
+        )
+        # Latest activity of every issue whose description changed
+        self.last_activities = (
+            {
+                str(activity.issue_id): activity
+                for activity in IssueActivity.objects.filter(
+                    issue_id__in=description_issue_ids
+                )
+                .order_by("issue_id", "-created_at")
+                .distinct("issue_id")
+            }
+            if description_issue_ids
+            else {}
+        )
+
+    @staticmethod
+    def _ids(values):
+        return [str(value) for value in values if value]
+
+    @staticmethod
+    def _by_pk(queryset):
+        return {str(obj.pk): obj for obj in queryset}
 
 
 # Track Changes in name
@@ -42,6 +108,7 @@ def track_name(
     actor_id,
     issue_activities,
     epoch,
+    lookup,
 ):
     if current_instance.get("name") != requested_data.get("name"):
         issue_activities.append(
@@ -70,15 +137,12 @@ def track_description(
     actor_id,
     issue_activities,
     epoch,
+    lookup,
 ):
     if current_instance.get("description_html") != requested_data.get(
         "description_html"
     ):
-        last_activity = (
-            IssueActivity.objects.filter(issue_id=issue_id)
-            .order_by("-created_at")
-            .first()
-        )
+        last_activity = lookup.last_activities.get(str(issue_id))
         if (
             last_activity is not None
             and last_activity.field == "description"
@@ -113,10 +177,11 @@ def track_parent(
     actor_id,
     issue_activities,
     epoch,
+    lookup,
 ):
     if current_instance.get("parent") != requested_data.get("parent"):
-        old_parent = Issue.objects.filter(pk=current_instance.get("parent")).first()
-        new_parent = Issue.objects.filter(pk=requested_data.get("parent")).first()
+        old_parent = lookup.issues.get(str(current_instance.get("parent")))
+        new_parent = lookup.issues.get(str(requested_data.get("parent")))
 
         issue_activities.append(
             IssueActivity(
@@ -150,6 +215,7 @@ def track_priority(
     actor_id,
     issue_activities,
     epoch,
+    lookup,
 ):
     if current_instance.get("priority") != requested_data.get("priority"):
         issue_activities.append(
@@ -178,10 +244,13 @@ def track_state(
     actor_id,
     issue_activities,
     epoch,
+    lookup,
 ):
     if current_instance.get("state") != requested_data.get("state"):
-        new_state = State.objects.get(pk=requested_data.get("state", None))
-        old_state = State.objects.get(pk=current_instance.get("state", None))
+        new_state = lookup.states.get(str(requested_data.get("state")))
+        old_state = lookup.states.get(str(current_instance.get("state")))
+        if new_state is None or old_state is None:
+            return
 
         issue_activities.append(
             IssueActivity(
@@ -211,6 +280,7 @@ def track_target_date(
     actor_id,
     issue_activities,
     epoch,
+    lookup,
 ):
     if current_instance.get("target_date") != requested_data.get("target_date"):
         issue_activities.append(
@@ -243,6 +313,7 @@ def track_start_date(
     actor_id,
     issue_activities,
     epoch,
+    lookup,
 ):
     if current_instance.get("start_date") != requested_data.get("start_date"):
         issue_activities.append(
@@ -275,6 +346,7 @@ def track_labels(
     actor_id,
     issue_activities,
     epoch,
+    lookup,
 ):
     requested_labels = set([str(lab) for lab in requested_data.get("labels", [])])
     current_labels = set([str(lab) for lab in current_instance.get("labels", [])])
@@ -284,7 +356,9 @@ def track_labels(
 
     # Set of newly added labels
     for added_label in added_labels:
-        label = Label.objects.get(pk=added_label)
+        label = lookup.labels.get(added_label)
+        if label is None:
+            continue
         issue_activities.append(
             IssueActivity(
                 issue_id=issue_id,
@@ -304,7 +378,9 @@ def track_labels(
 
     # Set of dropped labels
     for dropped_label in dropped_labels:
-        label = Label.objects.get(pk=dropped_label)
+        label = lookup.labels.get(dropped_label)
+        if label is None:
+            continue
         issue_activities.append(
             IssueActivity(
                 issue_id=issue_id,
@@ -333,6 +409,7 @@ def track_assignees(
     actor_id,
     issue_activities,
     epoch,
+    lookup,
 ):
     requested_assignees = set([str(asg) for asg in requested_data.get("assignees", [])])
     current_assignees = set([str(asg) for asg in current_instance.get("assignees", [])])
@@ -341,7 +418,9 @@ def track_assignees(
     dropped_assginees = current_assignees - requested_assignees
 
     for added_asignee in added_assignees:
-        assignee = User.objects.get(pk=added_asignee)
+        assignee = lookup.users.get(added_asignee)
+        if assignee is None:
+            continue
         issue_activities.append(
             IssueActivity(
                 issue_id=issue_id,
@@ -359,7 +438,9 @@ def track_assignees(
         )
 
     for dropped_assignee in dropped_assginees:
-        assignee = User.objects.get(pk=dropped_assignee)
+        assignee = lookup.users.get(dropped_assignee)
+        if assignee is None:
+            continue
         issue_activities.append(
             IssueActivity(
                 issue_id=issue_id,
@@ -386,6 +467,7 @@ def track_estimate_points(
     actor_id,
     issue_activities,
     epoch,
+    lookup,
 ):
     if current_instance.get("estimate_point") != requested_data.get("estimate_point"):
         issue_activities.append(
@@ -417,6 +499,7 @@ def track_archive_at(
     actor_id,
     issue_activities,
     epoch,
+    lookup,
 ):
     if current_instance.get("archived_at") != requested_data.get("archived_at"):
         if requested_data.get("archived_at") is None:
@@ -460,11 +543,12 @@ def track_closed_to(
     actor_id,
     issue_activities,
     epoch,
+    lookup,
 ):
     if requested_data.get("closed_to") is not None:
-        updated_state = State.objects.get(
-            pk=requested_data.get("closed_to"), project_id=project_id
-        )
+        updated_state = lookup.states.get(str(requested_data.get("closed_to")))
+        if updated_state is None or str(updated_state.project_id) != str(project_id):
+            return
         issue_activities.append(
             IssueActivity(
                 issue_id=issue_id,
@@ -515,6 +599,7 @@ def update_issue_activity(
     actor_id,
     issue_activities,
     epoch,
+    lookup=None,
 ):
     ISSUE_ACTIVITY_MAPPER = {
         "name": track_name,
@@ -531,10 +616,12 @@ def update_issue_activity(
         "closed_to": track_closed_to,
     }
 
-    requested_data = json.loads(requested_data) if requested_data is not None else None
-    current_instance = (
-        json.loads(current_instance) if current_instance is not None else None
-    )
+    requested_data = load_activity_data(requested_data)
+    current_instance = load_activity_data(current_instance)
+
+    # A batch shares one lookup, a single update resolves its own references
+    if lookup is None:
+        lookup = ActivityLookup([(issue_id, requested_data, current_instance)])
 
     for key in requested_data:
         func = ISSUE_ACTIVITY_MAPPER.get(key)
@@ -548,6 +635,7 @@ def update_issue_activity(
                 actor_id=actor_id,
                 issue_activities=issue_activities,
                 epoch=epoch,
+                lookup=lookup,
             )
 
 
@@ -1462,6 +1550,55 @@ def delete_draft_issue_activity(
     )
 
 
+ACTIVITY_MAPPER = {
+    "issue.activity.created": create_issue_activity,
+    "issue.activity.updated": update_issue_activity,
+    "issue.activity.deleted": delete_issue_activity,
+    "comment.activity.created": create_comment_activity,
+    "comment.activity.updated": update_comment_activity,
+    "comment.activity.deleted": delete_comment_activity,
+    "cycle.activity.created": create_cycle_issue_activity,
+    "cycle.activity.deleted": delete_cycle_issue_activity,
+    "module.activity.created": create_module_issue_activity,
+    "module.activity.deleted": delete_module_issue_activity,
+    "link.activity.created": create_link_activity,
+    "link.activity.updated": update_link_activity,
+    "link.activity.deleted": delete_link_activity,
+    "attachment.activity.created": create_attachment_activity,
+    "attachment.activity.deleted": delete_attachment_activity,
+    "issue_relation.activity.created": create_issue_relation_activity,
+    "issue_relation.activity.deleted": delete_issue_relation_activity,
+    "issue_reaction.activity.created": create_issue_reaction_activity,
+    "issue_reaction.activity.deleted": delete_issue_reaction_activity,
+    "comment_reaction.activity.created": create_comment_reaction_activity,
+    "comment_reaction.activity.deleted": delete_comment_reaction_activity,
+    "issue_vote.activity.created": create_issue_vote_activity,
+    "issue_vote.activity.deleted": delete_issue_vote_activity,
+    "issue_draft.activity.created": create_draft_issue_activity,
+    "issue_draft.activity.updated": update_draft_issue_activity,
+    "issue_draft.activity.deleted": delete_draft_issue_activity,
+}
+
+
+def post_activity_hooks(issue_activities_created):
+    # Post the updates to segway for integrations and webhooks
+    try:
+        if settings.PROXY_BASE_URL:
+            for issue_activity in issue_activities_created:
+                headers = {"Content-Type": "application/json"}
+                issue_activity_json = json.dumps(
+                    IssueActivitySerializer(issue_activity).data,
+                    cls=DjangoJSONEncoder,
+                )
+                _ = requests.post(
+                    f"{settings.PROXY_BASE_URL}/hooks/workspaces/{str(issue_activity.workspace_id)}/projects/{str(issue_activity.project_id)}/issues/{str(issue_activity.issue_id)}/issue-activity-hooks/",
+                    json=issue_activity_json,
+                    headers=headers,
+                )
+    except Exception as e:
+        capture_exception(e)
+
+
 # Receive message from room group
 @shared_task
 def issue_activity(
@@ -1477,46 +1614,12 @@ def issue_activity(
     try:
         issue_activities = []
 
-        project = Project.objects.get(pk=project_id)
-        workspace_id = project.workspace_id
+        workspace_id = Project.objects.values_list("workspace_id", flat=True).get(
+            pk=project_id
+        )
 
         if issue_id is not None:
-            issue = Issue.objects.filter(pk=issue_id).first()
-            if issue:
-                try:
-                    issue.updated_at = timezone.now()
-                    issue.save(update_fields=["updated_at"])
-                except Exception as e:
-                    pass
-
-        ACTIVITY_MAPPER = {
-            "issue.activity.created": create_issue_activity,
-            "issue.activity.updated": update_issue_activity,
-            "issue.activity.deleted": delete_issue_activity,
-            "comment.activity.created": create_comment_activity,
-            "comment.activity.updated": update_comment_activity,
-            "comment.activity.deleted": delete_comment_activity,
-            "cycle.activity.created": create_cycle_issue_activity,
-            "cycle.activity.deleted": delete_cycle_issue_activity,
-            "module.activity.created": create_module_issue_activity,
-            "module.activity.deleted": delete_module_issue_activity,
-            "link.activity.created": create_link_activity,
-            "link.activity.updated": update_link_activity,
-            "link.activity.deleted": delete_link_activity,
-            "attachment.activity.created": create_attachment_activity,
-            "attachment.activity.deleted": delete_attachment_activity,
-            "issue_relation.activity.created": create_issue_relation_activity,
-            "issue_relation.activity.deleted": delete_issue_relation_activity,
-            "issue_reaction.activity.created": create_issue_reaction_activity,
-            "issue_reaction.activity.deleted": delete_issue_reaction_activity,
-            "comment_reaction.activity.created": create_comment_reaction_activity,
-            "comment_reaction.activity.deleted": delete_comment_reaction_activity,
-            "issue_vote.activity.created": create_issue_vote_activity,
-            "issue_vote.activity.deleted": delete_issue_vote_activity,
-            "issue_draft.activity.created": create_draft_issue_activity,
-            "issue_draft.activity.updated": update_draft_issue_activity,
-            "issue_draft.activity.deleted": delete_draft_issue_activity,
-        }
+            Issue.objects.filter(pk=issue_id).update(updated_at=timezone.now())
 
         func = ACTIVITY_MAPPER.get(type)
         if func is not None:
@@ -1533,24 +1636,10 @@ def issue_activity(
 
         # Save all the values to database
         issue_activities_created = IssueActivity.objects.bulk_create(issue_activities)
-        # Post the updates to segway for integrations and webhooks
+        # Cycle, module and bulk label or assignee changes skip the model signals
+        invalidate_project_issues([project_id])
         if len(issue_activities_created):
-            # Don't send activities if the actor is a bot
-            try:
-                if settings.PROXY_BASE_URL:
-                    for issue_activity in issue_activities_created:
-                        headers = {"Content-Type": "application/json"}
-                        issue_activity_json = json.dumps(
-                            IssueActivitySerializer(issue_activity).data,
-                            cls=DjangoJSONEncoder,
-                        )
-                        _ = requests.post(
-                            f"{settings.PROXY_BASE_URL}/hooks/workspaces/{str(issue_activity.workspace_id)}/projects/{str(issue_activity.project_id)}/issues/{str(issue_activity.issue_id)}/issue-activity-hooks/",
-                            json=issue_activity_json,
-                            headers=headers,
-                        )
-            except Exception as e:
-                capture_exception(e)
+            post_activity_hooks(issue_activities_created)
 
         notifications.delay(
             type=type,
@@ -1566,6 +1655,127 @@ def issue_activity(
             current_instance=current_instance,
         )
 
+        if type in ROLLUP_ACTIVITY_TYPES:
+            issue_ids = activity_issue_ids(
+                issue_id, load_activity_data(requested_data) or {}
+            )
+            schedule_issue_rollups(
+                project_id, issue_ids, [load_activity_data(current_instance)]
+            )
+            # Assignees added in bulk skip the model signals
+            invalidate_issue_stats(issue_stats_users(issue_ids))
+
+        return
+    except Exception as e:
+        # Print logs if in DEBUG mode
+        if settings.DEBUG:
+            print(e)
+        capture_exception(e)
+        return
+
+
+@shared_task
+def issue_activity_batch(
+    type,
+    diffs,
+    actor_id,
+    project_id,
+    epoch,
+    subscriber=True,
+):
+    """Track one activity type for many issues of a project in a single task
+
+    Args:
+        diffs (list): dicts with issue_id, requested_data and current_instance
+    """
+    try:
+        issue_activities = []
+        # Slice of issue_activities produced by each diff
+        bounds = []
+
+        workspace_id = Project.objects.values_list("workspace_id", flat=True).get(
+            pk=project_id
+        )
+
+        issue_ids = [diff["issue_id"] for diff in diffs if diff.get("issue_id")]
+        if issue_ids:
+            Issue.objects.filter(pk__in=issue_ids).update(updated_at=timezone.now())
+
+        func = ACTIVITY_MAPPER.get(type)
+        extra = {}
+        if func is update_issue_activity:
+            extra["lookup"] = ActivityLookup(
+                [
+                    (
+                        diff.get("issue_id"),
+                        diff.get("requested_data"),
+                        diff.get("current_instance"),
+                    )
+                    for diff in diffs
+                ]
+            )
+
+        for diff in diffs:
+            start = len(issue_activities)
+            if func is not None:
+                func(
+                    requested_data=diff.get("requested_data"),
+                    current_instance=diff.get("current_instance"),
+                    issue_id=diff.get("issue_id"),
+                    project_id=project_id,
+                    workspace_id=workspace_id,
+                    actor_id=actor_id,
+                    issue_activities=issue_activities,
+                    epoch=epoch,
+                    **extra,
+                )
+            bounds.append((start, len(issue_activities)))
+
+        # Save all the values to database
+        issue_activities_created = IssueActivity.objects.bulk_create(
+            issue_activities, batch_size=500
+        )
+        # Cycle, module and bulk label or assignee changes skip the model signals
+        invalidate_project_issues([project_id])
+        if len(issue_activities_created):
+            post_activity_hooks(issue_activities_created)
+
+        serialized = IssueActivitySerializer(issue_activities_created, many=True).data
+        batch_notifications.delay(
+            [
+                dict(
+                    type=type,
+                    issue_id=diff.get("issue_id"),
+                    actor_id=actor_id,
+                    project_id=project_id,
+                    subscriber=subscriber,
+                    issue_activities_created=json.dumps(
+                        serialized[start:end], cls=DjangoJSONEncoder
+                    ),
+                    requested_data=diff.get("requested_data"),
+                    current_instance=diff.get("current_instance"),
+                )
+                for diff, (start, end) in zip(diffs, bounds)
+            ]
+        )
+
+        if type in ROLLUP_ACTIVITY_TYPES:
+            issue_ids = [
+                issue_id
+                for diff in diffs
+                for issue_id in activity_issue_ids(
+                    diff.get("issue_id"),
+                    load_activity_data(diff.get("requested_data")) or {},
+                )
+            ]
+            schedule_issue_rollups(
+                project_id,
+                issue_ids,
+                [load_activity_data(diff.get("current_instance")) for diff in diffs],
+            )
+            # Assignees added in bulk skip the model signals
+            invalidate_issue_stats(issue_stats_users(issue_ids))
+
         return
     except Exception as e:
         # Print logs if in DEBUG mode
@@ -13,7 +13,9 @@ from sentry_sdk import capture_exception
 
 # Module imports
 from plane.db.models import Issue, Project, State, Page
-from plane.bgtasks.issue_activites_task import issue_activity
+from plane.bgtasks.issue_activites_task import issue_activity_batch
+from plane.utils.progress import refresh_issue_progress
+from plane.utils.issue_counts import refresh_parent_counts
 
 
 @shared_task
@@ -72,19 +74,25 @@ def archive_old_issues():
                     Issue.objects.bulk_update(
                         issues_to_update, ["archived_at"], batch_size=100
                     )
-                    _ = [
-                        issue_activity.delay(
-                            type="issue.activity.updated",
-                            requested_data=json.dumps({"archived_at": str(archive_at)}),
-                            actor_id=str(project.created_by_id),
-                            issue_id=issue.id,
-                            project_id=project_id,
-                            current_instance=json.dumps({"archived_at": None}),
-                            subscriber=False,
-                            epoch=int(timezone.now().timestamp()),
-                        )
-                        for issue in issues_to_update
-                    ]
+                    refresh_issue_progress([issue.id for issue in issues_to_update])
+                    refresh_parent_counts([issue.id for issue in issues_to_update])
+                    issue_activity_batch.delay(
+                        type="issue.activity.updated",
+                        diffs=[
+                            {
+                                "issue_id": str(issue.id),
+                                "requested_data": json.dumps(
+                                    {"archived_at": str(archive_at)}
+                                ),
+                                "current_instance": json.dumps({"archived_at": None}),
+                            }
+                            for issue in issues_to_update
+                        ],
+                        actor_id=str(project.created_by_id),
+                        project_id=str(project_id),
+                        subscriber=False,
+                        epoch=int(timezone.now().timestamp()),
+                    )
         return
     except Exception as e:
         if settings.DEBUG:
@@ -146,21 +154,24 @@ def close_old_issues():
                     Issue.objects.bulk_update(
                         issues_to_update, ["state"], batch_size=100
                     )
-                    [
-                        issue_activity.delay(
-                            type="issue.activity.updated",
-                            requested_data=json.dumps(
-                                {"closed_to": str(issue.state_id)}
-                            ),
-                            actor_id=str(project.created_by_id),
-                            issue_id=issue.id,
-                            project_id=project_id,
-                            current_instance=None,
-                            subscriber=False,
-                            epoch=int(timezone.now().timestamp()),
-                        )
-                        for issue in issues_to_update
-                    ]
+                    refresh_issue_progress([issue.id for issue in issues_to_update])
+                    issue_activity_batch.delay(
+                        type="issue.activity.updated",
+                        diffs=[
+                            {
+                                "issue_id": str(issue.id),
+                                "requested_data": json.dumps(
+                                    {"closed_to": str(issue.state_id)}
+                                ),
+                                "current_instance": None,
+                            }
+                            for issue in issues_to_update
+                        ],
+                        actor_id=str(project.created_by_id),
+                        project_id=str(project_id),
+                        subscriber=False,
+                        epoch=int(timezone.now().timestamp()),
+                    )
         return
     except Exception as e:
         if settings.DEBUG:
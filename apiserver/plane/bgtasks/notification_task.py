@@ -1,160 +1,104 @@
 # Python imports
+import re
 import json
-import uuid
+from collections import defaultdict
+
+# Django imports
+from django.db.models import Q
 
 # Module imports
 from plane.db.models import (
     IssueMention,
     IssueSubscriber,
-    Project,
     User,
     IssueAssignee,
     Issue,
     Notification,
     IssueComment,
-    IssueActivity
+    IssueActivity,
 )
 
 # Third Party imports
 from celery import shared_task
-from bs4 import BeautifulSoup
-
-
-    
-# =========== Issue Description Html Parsing and Notification Functions ======================
-
-def update_mentions_for_issue(issue, project, new_mentions, removed_mention):
-    aggregated_issue_mentions = []
-
-    for mention_id in new_mentions:
-        aggregated_issue_mentions.append(
-            IssueMention(
-                mention_id=mention_id,
-                issue=issue,
-                project=project,
-                workspace_id=project.workspace_id
-            )
-        )
-
-    IssueMention.objects.bulk_create(
-        aggregated_issue_mentions, batch_size=100)
-    IssueMention.objects.filter(
-        issue=issue, mention__in=removed_mention).delete()
-
-
-def get_new_mentions(requested_instance, current_instance):
-    # requested_data is the newer instance of the current issue
-    # current_instance is the older instance of the current issue, saved in the database
-
-    # extract mentions from both the instance of data
-    mentions_older = extract_mentions(current_instance)
-    
-    mentions_newer = extract_mentions(requested_instance)
-
-    # Getting Set Difference from mentions_newer
-    new_mentions = [
-        mention for mention in mentions_newer if mention not in mentions_older]
-
-    return new_mentions
-
-# Get Removed Mention
 
 
-def get_removed_mentions(requested_instance, current_instance):
-    # requested_data is the newer instance of the current issue
-    # current_instance is the older instance of the current issue, saved in the database
-
-    # extract mentions from both the instance of data
-    mentions_older = extract_mentions(current_instance)
-    mentions_newer = extract_mentions(requested_instance)
-
-    # Getting Set Difference from mentions_newer
-    removed_mentions = [
-        mention for mention in mentions_older if mention not in mentions_newer]
+# Activity types that never notify the issue subscribers
+SILENT_ACTIVITY_TYPES = [
+    "cycle.activity.created",
+    "cycle.activity.deleted",
+    "module.activity.created",
+    "module.activity.deleted",
+    "issue_reaction.activity.created",
+    "issue_reaction.activity.deleted",
+    "comment_reaction.activity.created",
+    "comment_reaction.activity.deleted",
+    "issue_vote.activity.created",
+    "issue_vote.activity.deleted",
+    "issue_draft.activity.created",
+    "issue_draft.activity.updated",
+    "issue_draft.activity.deleted",
+]
 
-    return removed_mentions
+MENTION_TAG_RE = re.compile(r"<mention-component\b([^>]*)>", re.IGNORECASE)
+MENTION_ATTRIBUTE_RE = re.compile(r"""([\w-]+)\s*=\s*(?:"([^"]*)"|'([^']*)')""")
 
-# Adds mentions as subscribers
 
+# =========== Html Mention Parsing ======================
 
-def extract_mentions_as_subscribers(project_id, issue_id, mentions):
-    # mentions is an array of User IDs representing the FILTERED set of mentioned users
 
-    bulk_mention_subscribers = []
+def extract_html_mentions(html):
+    # Scan the mention-component tags only instead of building a full parse tree
+    if not html or "mention-component" not in html.lower():
+        return set()
 
-    for mention_id in mentions:
-        # If the particular mention has not already been subscribed to the issue, he must be sent the mentioned notification
-        if not IssueSubscriber.objects.filter(
-            issue_id=issue_id,
-            subscriber_id=mention_id,
-            project_id=project_id,
-        ).exists() and not IssueAssignee.objects.filter(
-            project_id=project_id, issue_id=issue_id,
-            assignee_id=mention_id
-        ).exists() and not Issue.objects.filter(
-            project_id=project_id, pk=issue_id, created_by_id=mention_id
-        ).exists():
+    mentions = set()
+    for tag in MENTION_TAG_RE.finditer(html):
+        attributes = {
+            name.lower(): double if double else single
+            for name, double, single in MENTION_ATTRIBUTE_RE.findall(tag.group(1))
+        }
+        if attributes.get("target") == "users" and attributes.get("id"):
+            mentions.add(attributes["id"])
+    return mentions
 
-            project = Project.objects.get(pk=project_id)
-
-            bulk_mention_subscribers.append(IssueSubscriber(
-                workspace_id=project.workspace_id,
-                project_id=project_id,
-                issue_id=issue_id,
-                subscriber_id=mention_id,
-            ))
-    return bulk_mention_subscribers
 
 # Parse Issue Description & extracts mentions
 def extract_mentions(issue_instance):
     try:
-        # issue_instance has to be a dictionary passed, containing the description_html and other set of activity data.
-        mentions = []
-        # Convert string to dictionary
-        data = json.loads(issue_instance)
-        html = data.get("description_html")
-        soup = BeautifulSoup(html, 'html.parser')
-        mention_tags = soup.find_all(
-            'mention-component', attrs={'target': 'users'})
-
-        mentions = [mention_tag['id'] for mention_tag in mention_tags]
-
-        return list(set(mentions))
+        # issue_instance is the json encoded activity data with the description_html
+        data = (
+            json.loads(issue_instance)
+            if isinstance(issue_instance, str)
+            else issue_instance
+        )
+        return list(extract_html_mentions(data.get("description_html")))
     except Exception as e:
         return []
-    
-    
+
+
 # =========== Comment Parsing and Notification Functions ======================
 def extract_comment_mentions(comment_value):
     try:
-        mentions = []
-        soup = BeautifulSoup(comment_value, 'html.parser')
-        mentions_tags = soup.find_all(
-            'mention-component', attrs={'target': 'users'}
-        )
-        for mention_tag in mentions_tags:
-            mentions.append(mention_tag['id'])
-        return list(set(mentions))
+        return list(extract_html_mentions(comment_value))
     except Exception as e:
         return []
-    
+
+
 def get_new_comment_mentions(new_value, old_value):
-    
     mentions_newer = extract_comment_mentions(new_value)
     if old_value is None:
         return mentions_newer
-    
+
     mentions_older = extract_comment_mentions(old_value)
     # Getting Set Difference from mentions_newer
-    new_mentions = [
-        mention for mention in mentions_newer if mention not in mentions_older]
+    return [mention for mention in mentions_newer if mention not in mentions_older]
 
-    return new_mentions
 
-
-def createMentionNotification(project, notification_comment, issue, actor_id, mention_id, issue_id, activity):
+def createMentionNotification(
+    project, notification_comment, issue, actor_id, mention_id, issue_id, activity
+):
     return Notification(
-        workspace=project.workspace,
+        workspace_id=project.workspace_id,
         sender="in_app:issue_activities:mentioned",
         triggered_by_id=actor_id,
         receiver_id=mention_id,
@@ -163,14 +107,7 @@ def createMentionNotification(project, notification_comment, issue, actor_id, me
         project=project,
         message=notification_comment,
         data={
-            "issue": {
-                "id": str(issue_id),
-                "name": str(issue.name),
-                "identifier": str(issue.project.identifier),
-                "sequence_id": issue.sequence_id,
-                "state_name": issue.state.name,
-                "state_group": issue.state.group,
-            },
+            "issue": issue_notification_data(issue),
             "issue_activity": {
                 "id": str(activity.get("id")),
                 "verb": str(activity.get("verb")),
@@ -178,142 +115,212 @@ def createMentionNotification(project, notification_comment, issue, actor_id, me
                 "actor": str(activity.get("actor_id")),
                 "new_value": str(activity.get("new_value")),
                 "old_value": str(activity.get("old_value")),
-            }
+            },
         },
     )
 
 
-@shared_task
-def notifications(type, issue_id, project_id, actor_id, subscriber, issue_activities_created, requested_data, current_instance):
-    issue_activities_created = (
-        json.loads(
-            issue_activities_created) if issue_activities_created is not None else None
+def issue_notification_data(issue):
+    return {
+        "id": str(issue.id),
+        "name": str(issue.name),
+        "identifier": str(issue.project.identifier),
+        "sequence_id": issue.sequence_id,
+        "state_name": issue.state.name,
+        "state_group": issue.state.group,
+    }
+
+
+def group_pairs(queryset):
+    # (issue_id, user_id) rows to a set of user ids per issue
+    grouped = defaultdict(set)
+    for issue_id, user_id in queryset:
+        grouped[str(issue_id)].add(str(user_id))
+    return grouped
+
+
+def send_notifications(batch):
+    """Fan out the notifications of a batch of issue activities
+
+    Subscribers, assignees, comments, actors and last activities of every
+    issue in the batch are loaded with one query each, the html of each
+    instance is scanned once, and all the notifications, subscribers and
+    mentions are written with bulk queries.
+    """
+    batch = [
+        payload
+        for payload in batch
+        if payload.get("type") not in SILENT_ACTIVITY_TYPES
+        and payload.get("issue_id") is not None
+    ]
+    if not batch:
+        return
+
+    # Parse every payload once
+    for payload in batch:
+        payload["issue_id"] = str(payload["issue_id"])
+        payload["actor_id"] = str(payload["actor_id"])
+        payload["activities"] = (
+            json.loads(payload["issue_activities_created"])
+            if payload.get("issue_activities_created") is not None
+            else []
+        )
+        mentions_newer = set(extract_mentions(payload.get("requested_data")))
+        mentions_older = set(extract_mentions(payload.get("current_instance")))
+        payload["requested_mentions"] = mentions_newer
+        payload["new_mentions"] = mentions_newer - mentions_older
+        payload["removed_mentions"] = mentions_older - mentions_newer
+
+        all_comment_mentions, comment_mentions = set(), set()
+        for issue_activity in payload["activities"]:
+            if issue_activity.get("issue_comment") is not None:
+                all_comment_mentions.update(
+                    extract_comment_mentions(issue_activity.get("new_value"))
+                )
+                comment_mentions.update(
+                    get_new_comment_mentions(
+                        new_value=issue_activity.get("new_value"),
+                        old_value=issue_activity.get("old_value"),
+                    )
+                )
+        payload["all_comment_mentions"] = all_comment_mentions
+        payload["comment_mentions"] = comment_mentions
+
+    issue_ids = {payload["issue_id"] for payload in batch}
+    issues = {
+        str(issue.id): issue
+        for issue in Issue.objects.filter(pk__in=issue_ids).select_related(
+            "project", "state"
+        )
+    }
+    subscribers = group_pairs(
+        IssueSubscriber.objects.filter(issue_id__in=issue_ids).values_list(
+            "issue_id", "subscriber_id"
+        )
+    )
+    assignees = group_pairs(
+        IssueAssignee.objects.filter(issue_id__in=issue_ids).values_list(
+            "issue_id", "assignee_id"
+        )
+    )
+    comment_ids = {
+        issue_activity.get("issue_comment")
+        for payload in batch
+        for issue_activity in payload["activities"]
+        if issue_activity.get("issue_comment") is not None
+    }
+    comments = (
+        {
+            str(comment_id): comment_stripped
+            for comment_id, comment_stripped in IssueComment.objects.filter(
+                pk__in=comment_ids
+            ).values_list("id", "comment_stripped")
+        }
+        if comment_ids
+        else {}
+    )
+    actors = {
+        str(user_id): display_name
+        for user_id, display_name in User.objects.filter(
+            pk__in={payload["actor_id"] for payload in batch}
+        ).values_list("id", "display_name")
+    }
+    mentioned_issue_ids = {
+        payload["issue_id"] for payload in batch if payload["new_mentions"]
+    }
+    last_activities = (
+        {
+            str(activity.issue_id): activity
+            for activity in IssueActivity.objects.filter(
+                issue_id__in=mentioned_issue_ids
+            )
+            .order_by("issue_id", "-created_at")
+            .distinct("issue_id")
+        }
+        if mentioned_issue_ids
+        else {}
     )
-    if type not in [
-        "cycle.activity.created",
-        "cycle.activity.deleted",
-        "module.activity.created",
-        "module.activity.deleted",
-        "issue_reaction.activity.created",
-        "issue_reaction.activity.deleted",
-        "comment_reaction.activity.created",
-        "comment_reaction.activity.deleted",
-        "issue_vote.activity.created",
-        "issue_vote.activity.deleted",
-        "issue_draft.activity.created",
-        "issue_draft.activity.updated",
-        "issue_draft.activity.deleted",
-    ]:
-        # Create Notifications
-        bulk_notifications = []
 
-        """
-        Mention Tasks
-        1. Perform Diffing and Extract the mentions, that mention notification needs to be sent
-        2. From the latest set of mentions, extract the users which are not a subscribers & make them subscribers
-        """
+    bulk_notifications = []
+    bulk_subscribers = {}
+    bulk_mentions = {}
+    removed_mentions = Q()
+
+    def add_subscriber(issue, subscriber_id):
+        bulk_subscribers[(str(issue.id), str(subscriber_id))] = IssueSubscriber(
+            workspace_id=issue.workspace_id,
+            project_id=issue.project_id,
+            issue_id=issue.id,
+            subscriber_id=subscriber_id,
+        )
+
+    for payload in batch:
+        issue = issues.get(payload["issue_id"])
+        if issue is None:
+            continue
+
+        issue_id = payload["issue_id"]
+        actor_id = payload["actor_id"]
+        project = issue.project
+        creator_id = (
+            str(issue.created_by_id) if issue.created_by_id is not None else None
+        )
+        new_mentions = payload["new_mentions"]
+        comment_mentions = payload["comment_mentions"]
+        issue_activities_created = payload["activities"]
+
+        # Mentioned users who do not already follow the issue become subscribers
+        followers = subscribers[issue_id] | assignees[issue_id] | {creator_id}
+        for mention_id in (
+            payload["requested_mentions"] | payload["all_comment_mentions"]
+        ) - followers:
+            add_subscriber(issue, mention_id)
 
-        # Get new mentions from the newer instance
-        new_mentions = get_new_mentions(
-            requested_instance=requested_data, current_instance=current_instance)
-        removed_mention = get_removed_mentions(
-            requested_instance=requested_data, current_instance=current_instance)
-        
-        comment_mentions = []
-        all_comment_mentions = []
-
-        # Get New Subscribers from the mentions of the newer instance
-        requested_mentions = extract_mentions(
-            issue_instance=requested_data)
-        mention_subscribers = extract_mentions_as_subscribers(
-            project_id=project_id, issue_id=issue_id, mentions=requested_mentions)
-        
-        for issue_activity in issue_activities_created:
-            issue_comment = issue_activity.get("issue_comment")
-            issue_comment_new_value = issue_activity.get("new_value")
-            issue_comment_old_value = issue_activity.get("old_value")
-            if issue_comment is not None:
-                # TODO: Maybe save the comment mentions, so that in future, we can filter out the issues based on comment mentions as well.
-                
-                all_comment_mentions = all_comment_mentions + extract_comment_mentions(issue_comment_new_value)
-                
-                new_comment_mentions = get_new_comment_mentions(old_value=issue_comment_old_value, new_value=issue_comment_new_value)
-                comment_mentions = comment_mentions + new_comment_mentions
-                
-        comment_mention_subscribers = extract_mentions_as_subscribers( project_id=project_id, issue_id=issue_id, mentions=all_comment_mentions)
         """
         We will not send subscription activity notification to the below mentioned user sets
         - Those who have been newly mentioned in the issue description, we will send mention notification to them.
         - When the activity is a comment_created and there exist a mention in the comment, then we have to send the "mention_in_comment" notification
         - When the activity is a comment_updated and there exist a mention change, then also we have to send the "mention_in_comment" notification
         """
-        
-        issue_assignees = list(
-            IssueAssignee.objects.filter(
-                project_id=project_id, issue_id=issue_id)
-            .exclude(assignee_id__in=list(new_mentions + comment_mentions))
-            .values_list("assignee", flat=True)
-        )
-        
-        issue_subscribers = list(
-            IssueSubscriber.objects.filter(
-                project_id=project_id, issue_id=issue_id)
-            .exclude(subscriber_id__in=list(new_mentions + comment_mentions + [actor_id]))
-            .values_list("subscriber", flat=True)
+        issue_assignees = assignees[issue_id] - new_mentions - comment_mentions
+        issue_subscribers = (
+            subscribers[issue_id] - new_mentions - comment_mentions - {actor_id}
         )
-
-        issue = Issue.objects.filter(pk=issue_id).first()
-
-        if (issue.created_by_id is not None and str(issue.created_by_id) != str(actor_id)):
-            issue_subscribers = issue_subscribers + [issue.created_by_id]
-
-        if subscriber:
-            # add the user to issue subscriber
-            try:
-                if str(issue.created_by_id) != str(actor_id) and uuid.UUID(actor_id) not in issue_assignees:
-                    _ = IssueSubscriber.objects.get_or_create(
-                        project_id=project_id, issue_id=issue_id, subscriber_id=actor_id
-                    )
-            except Exception as e:
-                pass
-
-        project = Project.objects.get(pk=project_id)
-
-        issue_subscribers = list(set(issue_subscribers + issue_assignees) - {uuid.UUID(actor_id)})
-
-        for subscriber in issue_subscribers:
-            if subscriber in issue_subscribers:
-                sender = "in_app:issue_activities:subscribed"
-            if issue.created_by_id is not None and subscriber == issue.created_by_id:
+        if creator_id is not None and creator_id != actor_id:
+            issue_subscribers.add(creator_id)
+
+        # add the user to issue subscriber
+        if (
+            payload.get("subscriber")
+            and creator_id != actor_id
+            and actor_id not in issue_assignees
+            and actor_id not in subscribers[issue_id]
+        ):
+            add_subscriber(issue, actor_id)
+
+        issue_data = issue_notification_data(issue)
+
+        for receiver_id in (issue_subscribers | issue_assignees) - {actor_id}:
+            sender = "in_app:issue_activities:subscribed"
+            if receiver_id == creator_id:
                 sender = "in_app:issue_activities:created"
-            if subscriber in issue_assignees:
+            if receiver_id in issue_assignees:
                 sender = "in_app:issue_activities:assigned"
 
             for issue_activity in issue_activities_created:
                 issue_comment = issue_activity.get("issue_comment")
-                if issue_comment is not None:
-                    issue_comment = IssueComment.objects.get(
-                        id=issue_comment, issue_id=issue_id, project_id=project_id, workspace_id=project.workspace_id)
-                    
                 bulk_notifications.append(
                     Notification(
-                        workspace=project.workspace,
+                        workspace_id=project.workspace_id,
                         sender=sender,
                         triggered_by_id=actor_id,
-                        receiver_id=subscriber,
+                        receiver_id=receiver_id,
                         entity_identifier=issue_id,
                         entity_name="issue",
                         project=project,
                         title=issue_activity.get("comment"),
                         data={
-                            "issue": {
-                                "id": str(issue_id),
-                                "name": str(issue.name),
-                                "identifier": str(issue.project.identifier),
-                                "sequence_id": issue.sequence_id,
-                                "state_name": issue.state.name,
-                                "state_group": issue.state.group,
-                            },
+                            "issue": issue_data,
                             "issue_activity": {
                                 "id": str(issue_activity.get("id")),
                                 "verb": str(issue_activity.get("verb")),
@@ -322,8 +329,8 @@ def notifications(type, issue_id, project_id, actor_id, subscriber, issue_activi
                                 "new_value": str(issue_activity.get("new_value")),
                                 "old_value": str(issue_activity.get("old_value")),
                                 "issue_comment": str(
-                                    issue_comment.comment_stripped
-                                    if issue_activity.get("issue_comment") is not None
+                                    comments.get(str(issue_comment), "")
+                                    if issue_comment is not None
                                     else ""
                                 ),
                             },
@@ -331,88 +338,118 @@ def notifications(type, issue_id, project_id, actor_id, subscriber, issue_activi
                     )
                 )
 
-        # Add Mentioned as Issue Subscribers
-        IssueSubscriber.objects.bulk_create(
-            mention_subscribers + comment_mention_subscribers, batch_size=100)
-
-        last_activity = (
-            IssueActivity.objects.filter(issue_id=issue_id)
-            .order_by("-created_at")
-            .first()
-        )
-        
-        actor = User.objects.get(pk=actor_id)
-        
-        for mention_id in comment_mentions:
-            if (mention_id != actor_id):
-                for issue_activity in issue_activities_created:
-                    notification = createMentionNotification(
+        for mention_id in comment_mentions - {actor_id}:
+            for issue_activity in issue_activities_created:
+                bulk_notifications.append(
+                    createMentionNotification(
                         project=project,
                         issue=issue,
-                        notification_comment=f"{actor.display_name} has mentioned you in a comment in issue {issue.name}",
+                        notification_comment=f"{actors.get(actor_id)} has mentioned you in a comment in issue {issue.name}",
                         actor_id=actor_id,
                         mention_id=mention_id,
                         issue_id=issue_id,
-                        activity=issue_activity
+                        activity=issue_activity,
                     )
-                    bulk_notifications.append(notification)
-                    
+                )
 
-        for mention_id in new_mentions:
-            if (mention_id != actor_id):
-                if (
-                    last_activity is not None
-                    and last_activity.field == "description"
-                    and actor_id == str(last_activity.actor_id)
-                ):
+        last_activity = last_activities.get(issue_id)
+        for mention_id in new_mentions - {actor_id}:
+            if (
+                last_activity is not None
+                and last_activity.field == "description"
+                and actor_id == str(last_activity.actor_id)
+            ):
+                bulk_notifications.append(
+                    Notification(
+                        workspace_id=project.workspace_id,
+                        sender="in_app:issue_activities:mentioned",
+                        triggered_by_id=actor_id,
+                        receiver_id=mention_id,
+                        entity_identifier=issue_id,
+                        entity_name="issue",
+                        project=project,
+                        message=f"You have been mentioned in the issue {issue.name}",
+                        data={
+                            "issue": issue_data,
+                            "issue_activity": {
+                                "id": str(last_activity.id),
+                                "verb": str(last_activity.verb),
+                                "field": str(last_activity.field),
+                                "actor": str(last_activity.actor_id),
+                                "new_value": str(last_activity.new_value),
+                                "old_value": str(last_activity.old_value),
+                            },
+                        },
+                    )
+                )
+            else:
+                for issue_activity in issue_activities_created:
                     bulk_notifications.append(
-                         Notification(
-                             workspace=project.workspace,
-                            sender="in_app:issue_activities:mentioned",
-                            triggered_by_id=actor_id,
-                            receiver_id=mention_id,
-                            entity_identifier=issue_id,
-                            entity_name="issue",
-                            project=project,
-                            message=f"You have been mentioned in the issue {issue.name}",
-                            data={
-                                "issue": {
-                                    "id": str(issue_id),
-                                    "name": str(issue.name),
-                                    "identifier": str(issue.project.identifier),
-                                    "sequence_id": issue.sequence_id,
-                                    "state_name": issue.state.name,
-                                     "state_group": issue.state.group,
-                                 },
-                                 "issue_activity": {
-                                     "id": str(last_activity.id),
-                                     "verb": str(last_activity.verb),
-                                     "field": str(last_activity.field),
-                                     "actor": str(last_activity.actor_id),
-                                     "new_value": str(last_activity.new_value),
-                                     "old_value": str(last_activity.old_value),
-                                 },
-                             },
-                         )
-                     )
-                else:
-                    for issue_activity in issue_activities_created:
-                        notification = createMentionNotification(
+                        createMentionNotification(
                             project=project,
                             issue=issue,
                             notification_comment=f"You have been mentioned in the issue {issue.name}",
                             actor_id=actor_id,
                             mention_id=mention_id,
                             issue_id=issue_id,
-                            activity=issue_activity
+                            activity=issue_activity,
                         )
-                        bulk_notifications.append(notification)
+                    )
 
         # save new mentions for the particular issue and remove the mentions that has been deleted from the description
-        update_mentions_for_issue(issue=issue, project=project, new_mentions=new_mentions, 
-                                  removed_mention=removed_mention)
-        
-        # Bulk create notifications
-        Notification.objects.bulk_create(bulk_notifications, batch_size=100)
-        
-        
+        for mention_id in new_mentions:
+            bulk_mentions[(issue_id, mention_id)] = IssueMention(
+                mention_id=mention_id,
+                issue_id=issue.id,
+                project_id=issue.project_id,
+                workspace_id=issue.workspace_id,
+            )
+        if payload["removed_mentions"]:
+            removed_mentions |= Q(
+                issue_id=issue_id, mention_id__in=payload["removed_mentions"]
+            )
+
+    IssueSubscriber.objects.bulk_create(
+        list(bulk_subscribers.values()), batch_size=100, ignore_conflicts=True
+    )
+    IssueMention.objects.bulk_create(
+        list(bulk_mentions.values()), batch_size=100, ignore_conflicts=True
+    )
+    if removed_mentions:
+        IssueMention.objects.filter(removed_mentions).delete()
+
+    # Bulk create notifications
+    Notification.objects.bulk_create(bulk_notifications, batch_size=100)
+
+
+@shared_task
+def notifications(
+    type,
+    issue_id,
+    project_id,
+    actor_id,
+    subscriber,
+    issue_activities_created,
+    requested_data,
+    current_instance,
+):
+    send_notifications(
+        [
+            dict(
+                type=type,
+                issue_id=issue_id,
+                project_id=project_id,
+                actor_id=actor_id,
+                subscriber=subscriber,
+                issue_activities_created=issue_activities_created,
+                requested_data=requested_data,
+                current_instance=current_instance,
+            )
+        ]
+    )
+
+
+@shared_task
+def batch_notifications(batch):
+    # Fan out the notifications of an activity batch from a single task
+    send_notifications(batch)
@@ -2,105 +2,299 @@ import requests
 import uuid
 import hashlib
 import json
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
 
 # Django imports
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
 
 # Third party imports
 from celery import shared_task
+from celery.exceptions import Retry
 from sentry_sdk import capture_exception
+from requests.adapters import HTTPAdapter
 
 from plane.db.models import Webhook, WebhookLog
+from plane.settings.redis import redis_instance
 
+WEBHOOK_ACTIONS = {
+    "POST": "create",
+    "PATCH": "update",
+    "PUT": "update",
+    "DELETE": "delete",
+}
 
-@shared_task(
-    bind=True,
-    autoretry_for=(requests.RequestException,),
-    retry_backoff=600,
-    max_retries=5,
-    retry_jitter=True,
-)
-def webhook_task(self, webhook, slug, event, event_data, action):
-    try:
-        webhook = Webhook.objects.get(id=webhook, workspace__slug=slug)
+# Keep alive sessions of this worker process, one per receiving origin
+_sessions = {}
 
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "Autopilot",
-            "X-Plane-Delivery": str(uuid.uuid4()),
-            "X-Plane-Event": event,
-        }
 
-        # Your secret key
-        if webhook.secret_key:
-            # Concatenate the data and the secret key
-            message = event_data + webhook.secret_key
+def get_session(url):
+    parts = urlsplit(url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    session = _sessions.get(origin)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=settings.WEBHOOK_MAX_WORKERS
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session = _sessions.setdefault(origin, session)
+    return session
+
 
-            # Create a SHA-256 hash of the message
-            sha256 = hashlib.sha256()
-            sha256.update(message.encode("utf-8"))
-            signature = sha256.hexdigest()
-            headers["X-Plane-Signature"] = signature
+def event_payload(webhook, event, event_data, action):
+    return {
+        "event": event,
+        "action": WEBHOOK_ACTIONS.get(action, action),
+        "webhook_id": str(webhook.id),
+        "workspace_id": str(webhook.workspace_id),
+        "data": json.loads(event_data) if event_data is not None else None,
+    }
 
-        event_data = json.loads(event_data) if event_data is not None else None
 
-        action = {
-            "POST": "create",
-            "PATCH": "update",
-            "PUT": "update",
-            "DELETE": "delete",
-        }.get(action, action)
+def build_request(webhook, events):
+    """Headers and body of a delivery holding one or many events
 
+    A single event keeps the original payload and is signed over its event
+    data, a batch is sent as an "events" list and signed over the body.
+    """
+    if len(events) == 1:
+        event, event_data, action = events[0]
+        payload = event_payload(webhook, event, event_data, action)
+        signed = event_data or ""
+    else:
+        event = "batch"
         payload = {
             "event": event,
-            "action": action,
             "webhook_id": str(webhook.id),
             "workspace_id": str(webhook.workspace_id),
-            "data": event_data,
+            "events": [
+                event_payload(webhook, *queued_event) for queued_event in events
+            ],
         }
+    body = json.dumps(payload, cls=DjangoJSONEncoder)
+    if len(events) > 1:
+        signed = body
+
+    headers = {
+        "Content-Type": "application/json",
+        "User-Agent": "Autopilot",
+        "X-Plane-Delivery": str(uuid.uuid4()),
+        "X-Plane-Event": event,
+    }
+
+    # Your secret key
+    if webhook.secret_key:
+        # Create a SHA-256 hash of the message and the secret key
+        sha256 = hashlib.sha256()
+        sha256.update((signed + webhook.secret_key).encode("utf-8"))
+        headers["X-Plane-Signature"] = sha256.hexdigest()
+
+    return headers, body
 
-        # Send the webhook event
-        response = requests.post(
-            webhook.url,
+
+def post_webhook(url, headers, body):
+    # Runs on the delivery threads, so no database access here
+    try:
+        return get_session(url).post(
+            url,
             headers=headers,
-            json=payload,
-            timeout=30,
+            data=body,
+            timeout=(5, settings.WEBHOOK_TIMEOUT),
         )
+    except requests.RequestException as e:
+        return e
 
-        # Log the webhook request
-        WebhookLog.objects.create(
-            workspace_id=str(webhook.workspace_id),
-            webhook_id=str(webhook.id),
-            event_type=str(event),
-            request_method=str(action),
-            request_headers=str(headers),
-            request_body=str(payload),
-            response_status=str(response.status_code),
-            response_headers=str(response.headers),
-            response_body=str(response.text),
-            retry_count=str(self.request.retries),
+
+def circuit_key(webhook_id):
+    return f"webhook:circuit:{webhook_id}"
+
+
+def circuit_open(ri, webhook_id):
+    return bool(ri.exists(circuit_key(webhook_id)))
+
+
+def record_delivery(ri, webhook_id, success):
+    """Count consecutive failures and open the circuit past the threshold"""
+    failures_key = f"webhook:failures:{webhook_id}"
+    if success:
+        ri.delete(failures_key)
+        return
+
+    pipe = ri.pipeline()
+    pipe.incr(failures_key)
+    pipe.expire(failures_key, settings.WEBHOOK_CIRCUIT_COOLDOWN)
+    failures, _ = pipe.execute()
+    if failures >= settings.WEBHOOK_CIRCUIT_THRESHOLD:
+        ri.set(circuit_key(webhook_id), 1, ex=settings.WEBHOOK_CIRCUIT_COOLDOWN)
+        ri.delete(failures_key)
+
+
+def webhook_log(webhook, event, action, headers, body, response, retry_count):
+    failed = isinstance(response, Exception)
+    return WebhookLog(
+        workspace_id=webhook.workspace_id,
+        webhook_id=webhook.id,
+        event_type=str(event),
+        request_method=str(WEBHOOK_ACTIONS.get(action, action)),
+        request_headers=json.dumps(headers),
+        request_body=body,
+        response_status=500 if failed else str(response.status_code),
+        response_headers="" if failed else json.dumps(dict(response.headers)),
+        response_body=str(response) if failed else str(response.text),
+        retry_count=retry_count,
+    )
+
+
+def deliver_webhooks(deliveries):
+    """Send (webhook, events) deliveries concurrently over pooled sessions
+
+    Endpoints with an open circuit are not called, their events and the
+    failed ones go back to webhook_task, which retries them with backoff.
+    """
+    ri = redis_instance()
+    retries = []
+    requests_to_send = []
+
+    for webhook, events in deliveries:
+        if circuit_open(ri, webhook.id):
+            retries.extend((webhook, event) for event in events)
+        else:
+            headers, body = build_request(webhook, events)
+            requests_to_send.append((webhook, events, headers, body))
+
+    with ThreadPoolExecutor(max_workers=settings.WEBHOOK_MAX_WORKERS) as executor:
+        responses = list(
+            executor.map(
+                lambda request: post_webhook(request[0].url, request[2], request[3]),
+                requests_to_send,
+            )
         )
 
-    except requests.RequestException as e:
-        # Log the failed webhook request
-        WebhookLog.objects.create(
-            workspace_id=str(webhook.workspace_id),
-            webhook_id=str(webhook.id),
-            event_type=str(event),
-            request_method=str(action),
-            request_headers=str(headers),
-            request_body=str(payload),
-            response_status=500,
-            response_headers="",
-            response_body=str(e),
-            retry_count=str(self.request.retries),
+    webhook_logs = []
+    for (webhook, events, headers, body), response in zip(
+        requests_to_send, responses
+    ):
+        failed = isinstance(response, Exception)
+        record_delivery(ri, webhook.id, not failed)
+        webhook_logs.append(
+            webhook_log(
+                webhook,
+                headers["X-Plane-Event"],
+                events[0][2] if len(events) == 1 else "POST",
+                headers,
+                body,
+                response,
+                0,
+            )
+        )
+        if failed:
+            retries.extend((webhook, event) for event in events)
+
+    WebhookLog.objects.bulk_create(webhook_logs, batch_size=100)
+
+    for webhook, (event, event_data, action) in retries:
+        webhook_task.apply_async(
+            args=[str(webhook.id), None, event, event_data, action],
+            countdown=settings.WEBHOOK_CIRCUIT_COOLDOWN,
         )
 
-        # Retry logic
-        if self.request.retries >= self.max_retries:
-            Webhook.objects.filter(pk=webhook.id).update(is_active=False)
+
+@shared_task(
+    bind=True,
+    autoretry_for=(requests.RequestException,),
+    retry_backoff=600,
+    max_retries=5,
+    retry_jitter=True,
+)
+def webhook_task(self, webhook, slug, event, event_data, action):
+    try:
+        webhooks = Webhook.objects.filter(id=webhook)
+        # Retries queued by deliver_webhooks carry no slug
+        if slug is not None:
+            webhooks = webhooks.filter(workspace__slug=slug)
+        webhook = webhooks.get()
+
+        ri = redis_instance()
+        if circuit_open(ri, webhook.id):
+            # Nothing was sent, so nothing is logged and the endpoint is not
+            # held responsible, the event waits out the cooldown
+            raise self.retry(countdown=settings.WEBHOOK_CIRCUIT_COOLDOWN)
+
+        headers, body = build_request(webhook, [(event, event_data, action)])
+        response = post_webhook(webhook.url, headers, body)
+        record_delivery(
+            ri, webhook.id, not isinstance(response, requests.RequestException)
+        )
+
+        # Log the webhook request
+        WebhookLog.objects.bulk_create(
+            [
+                webhook_log(
+                    webhook,
+                    event,
+                    action,
+                    headers,
+                    body,
+                    response,
+                    self.request.retries,
+                )
+            ]
+        )
+
+        if isinstance(response, requests.RequestException):
+            # Retry logic
+            if self.request.retries >= self.max_retries:
+                Webhook.objects.filter(pk=webhook.id).update(is_active=False)
+                return
+            raise requests.RequestException()
+
+    except (requests.RequestException, Retry):
+        raise
+
+    except Exception as e:
+        if settings.DEBUG:
+            print(e)
+        capture_exception(e)
+        return
+
+
+def webhook_events_key(webhook_id):
+    return f"webhook:events:{webhook_id}"
+
+
+@shared_task
+def flush_webhook_events(webhook_id):
+    """Deliver the events queued for an endpoint during the batch window"""
+    try:
+        ri = redis_instance()
+        batch_size = settings.WEBHOOK_BATCH_SIZE
+
+        # Events queued from now on schedule the next flush
+        ri.delete(f"webhook:scheduled:{webhook_id}")
+
+        webhook = Webhook.objects.filter(pk=webhook_id, is_active=True).first()
+        if webhook is None:
+            ri.delete(webhook_events_key(webhook_id))
             return
-        raise requests.RequestException()
+
+        deliveries = []
+        while True:
+            # Take a batch off the queue atomically
+            pipe = ri.pipeline()
+            pipe.lrange(webhook_events_key(webhook_id), 0, batch_size - 1)
+            pipe.ltrim(webhook_events_key(webhook_id), batch_size, -1)
+            records, _ = pipe.execute()
+            if records:
+                deliveries.append(
+                    (webhook, [tuple(json.loads(record)) for record in records])
+                )
+            if len(records) < batch_size:
+                break
+
+        deliver_webhooks(deliveries)
 
     except Exception as e:
         if settings.DEBUG:
@@ -129,8 +323,32 @@ def send_webhook(event, event_data, action, slug):
         if event == "issue-comment":
             webhooks = webhooks.filter(issue_comment=True)
 
+        webhooks = list(webhooks.only("id", "url", "secret_key", "workspace_id"))
+        if not webhooks:
+            return
+
+        if not settings.WEBHOOK_BATCH_WINDOW:
+            deliver_webhooks(
+                [(webhook, [(event, event_data, action)]) for webhook in webhooks]
+            )
+            return
+
+        # Queue the event, the first one of a window schedules the flush
+        ri = redis_instance()
         for webhook in webhooks:
-            webhook_task.delay(webhook.id, slug, event, event_data, action)
+            ri.rpush(
+                webhook_events_key(webhook.id),
+                json.dumps([event, event_data, action]),
+            )
+            if ri.set(
+                f"webhook:scheduled:{webhook.id}",
+                1,
+                nx=True,
+                ex=settings.WEBHOOK_BATCH_WINDOW * 10,
+            ):
+                flush_webhook_events.apply_async(
+                    args=[str(webhook.id)], countdown=settings.WEBHOOK_BATCH_WINDOW
+                )
 
     except Exception as e:
         if settings.DEBUG:
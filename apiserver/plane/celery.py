@@ -1,13 +1,11 @@
 import os
 from celery import Celery
-from plane.settings.redis import redis_instance
+from celery.signals import task_postrun, task_prerun
 from celery.schedules import crontab
 
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "plane.settings.production")
 
-ri = redis_instance()
-
 app = Celery("plane")
 
 # Using a string here means the worker will not have to
@@ -24,8 +22,40 @@ app.conf.beat_schedule = {
         "task": "plane.bgtasks.exporter_expired_task.delete_old_s3_link",
         "schedule": crontab(hour=0, minute=0),
     },
+    "check-every-day-to-delete-api-activity-logs": {
+        "task": "plane.bgtasks.api_log_task.delete_old_api_activity_logs",
+        "schedule": crontab(hour=0, minute=0),
+    },
+    "check-every-day-to-rebuild-analytics-rollups": {
+        "task": "plane.bgtasks.analytics_rollup_task.rebuild_analytics_rollups",
+        "schedule": crontab(hour=1, minute=0),
+    },
+    # Executes every minute
+    "flush-api-token-last-used": {
+        "task": "plane.bgtasks.api_token_task.flush_api_token_last_used",
+        "schedule": crontab(),
+    },
+    "flush-api-activity-logs": {
+        "task": "plane.bgtasks.api_log_task.flush_api_activity_logs",
+        "schedule": crontab(),
+    },
 }
 
+
+@task_prerun.connect
+def start_task_instrumentation(task_id=None, **kwargs):
+    from plane.utils.instrumentation import start_task
+
+    start_task(task_id)
+
+
+@task_postrun.connect
+def finish_task_instrumentation(task_id=None, task=None, state=None, **kwargs):
+    from plane.utils.instrumentation import finish_task
+
+    finish_task(task_id, task.name, state)
+
+
 # Load task modules from all registered Django app configs.
 app.autodiscover_tasks()
 
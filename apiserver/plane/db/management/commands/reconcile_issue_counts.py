@@ -0,0 +1,25 @@
+from django.core.management import BaseCommand
+
+from plane.utils.issue_counts import reconcile_issue_counts
+
+
+class Command(BaseCommand):
+    """Django command to recount the maintained issue child counts"""
+
+    help = "Recount sub-issues, links, attachments, comments and reactions"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--project", default=None, help="Only recount the issues of a project"
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="Issues recounted per batch"
+        )
+
+    def handle(self, *args, **options):
+        issue_count = reconcile_issue_counts(
+            project_id=options["project"], batch_size=options["batch_size"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"Recounted the children of {issue_count} issues")
+        )
@@ -0,0 +1,147 @@
+# Generated by Django 4.2.7 on 2026-10-18 05:08
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+import django.db.models.deletion
+import uuid
+
+STATE_GROUPS = ["completed", "cancelled", "started", "unstarted", "backlog"]
+
+
+def progress_annotations(relation):
+    active = Q(
+        **{
+            f"{relation}__issue__archived_at__isnull": True,
+            f"{relation}__issue__is_draft": False,
+        }
+    )
+    annotations = {"total_issues": Count(relation, filter=active)}
+    for group in STATE_GROUPS:
+        annotations[f"{group}_issues"] = Count(
+            f"{relation}__issue__state__group",
+            filter=active & Q(**{f"{relation}__issue__state__group": group}),
+        )
+    return annotations
+
+
+def backfill_progress(apps, schema_editor):
+    Cycle = apps.get_model("db", "Cycle")
+    CycleProgress = apps.get_model("db", "CycleProgress")
+    Module = apps.get_model("db", "Module")
+    ModuleProgress = apps.get_model("db", "ModuleProgress")
+
+    active = Q(
+        issue_cycle__issue__archived_at__isnull=True,
+        issue_cycle__issue__is_draft=False,
+    )
+    cycles = (
+        Cycle.objects.order_by()
+        .values("id", "project_id", "workspace_id")
+        .annotate(
+            **progress_annotations("issue_cycle"),
+            total_estimates=Sum("issue_cycle__issue__estimate_point"),
+            completed_estimates=Sum(
+                "issue_cycle__issue__estimate_point",
+                filter=active & Q(issue_cycle__issue__state__group="completed"),
+            ),
+            started_estimates=Sum(
+                "issue_cycle__issue__estimate_point",
+                filter=active & Q(issue_cycle__issue__state__group="started"),
+            ),
+        )
+    )
+    CycleProgress.objects.bulk_create(
+        [
+            CycleProgress(
+                cycle_id=cycle.pop("id"),
+                project_id=cycle.pop("project_id"),
+                workspace_id=cycle.pop("workspace_id"),
+                **cycle,
+            )
+            for cycle in cycles
+        ],
+        batch_size=1000,
+    )
+
+    modules = (
+        Module.objects.order_by()
+        .values("id", "project_id", "workspace_id")
+        .annotate(**progress_annotations("issue_module"))
+    )
+    ModuleProgress.objects.bulk_create(
+        [
+            ModuleProgress(
+                module_id=module.pop("id"),
+                project_id=module.pop("project_id"),
+                workspace_id=module.pop("workspace_id"),
+                **module,
+            )
+            for module in modules
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0049_auto_20231116_0713'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ModuleProgress',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('total_issues', models.PositiveIntegerField(default=0)),
+                ('completed_issues', models.PositiveIntegerField(default=0)),
+                ('cancelled_issues', models.PositiveIntegerField(default=0)),
+                ('started_issues', models.PositiveIntegerField(default=0)),
+                ('unstarted_issues', models.PositiveIntegerField(default=0)),
+                ('backlog_issues', models.PositiveIntegerField(default=0)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('module', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='module_progress', to='db.module')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_%(class)s', to='db.project')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='workspace_%(class)s', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'Module Progress',
+                'verbose_name_plural': 'Module Progress',
+                'db_table': 'module_progress',
+                'ordering': ('-created_at',),
+            },
+        ),
+        migrations.CreateModel(
+            name='CycleProgress',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('total_issues', models.PositiveIntegerField(default=0)),
+                ('completed_issues', models.PositiveIntegerField(default=0)),
+                ('cancelled_issues', models.PositiveIntegerField(default=0)),
+                ('started_issues', models.PositiveIntegerField(default=0)),
+                ('unstarted_issues', models.PositiveIntegerField(default=0)),
+                ('backlog_issues', models.PositiveIntegerField(default=0)),
+                ('total_estimates', models.PositiveIntegerField(null=True)),
+                ('completed_estimates', models.PositiveIntegerField(null=True)),
+                ('started_estimates', models.PositiveIntegerField(null=True)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('cycle', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='cycle_progress', to='db.cycle')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_%(class)s', to='db.project')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='workspace_%(class)s', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'Cycle Progress',
+                'verbose_name_plural': 'Cycle Progress',
+                'db_table': 'cycle_progress',
+                'ordering': ('-created_at',),
+            },
+        ),
+        migrations.RunPython(backfill_progress, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 4.2.7 on 2026-10-18 05:16
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+from django.db.models import F, Func, Value
+from django.db.models.functions import Coalesce
+
+SEARCH_FIELDS = {
+    "Issue": [("name", "A"), ("description_stripped", "B")],
+    "Page": [("name", "A"), ("description_stripped", "B")],
+    "IssueComment": [("comment_stripped", "B")],
+}
+
+
+def backfill_search_vectors(apps, schema_editor):
+    # Pages never stored their stripped description before
+    apps.get_model("db", "Page").objects.exclude(description_html="").update(
+        description_stripped=Func(
+            F("description_html"),
+            Value("<[^>]*>"),
+            Value(" "),
+            Value("g"),
+            function="regexp_replace",
+        )
+    )
+    for model_name, fields in SEARCH_FIELDS.items():
+        vector = None
+        for field, weight in fields:
+            part = SearchVector(
+                Coalesce(field, Value("")), weight=weight, config="simple"
+            )
+            vector = part if vector is None else vector + part
+        apps.get_model("db", model_name).objects.update(search_vector=vector)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0050_cycleprogress_moduleprogress'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='issue',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='issuecomment',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='page',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='issues_search_vector_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='issuecomment',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='comments_search_vector_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='page',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='pages_search_vector_idx'),
+        ),
+        migrations.RunPython(backfill_search_vectors, migrations.RunPython.noop),
+    ]
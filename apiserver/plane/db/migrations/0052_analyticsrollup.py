@@ -0,0 +1,88 @@
+# Generated by Django 4.2.7 on 2026-10-18 05:24
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import TruncDate
+import django.db.models.deletion
+import uuid
+
+ROLLUP_DIMENSIONS = [
+    "state_id",
+    "state__group",
+    "labels__id",
+    "assignees__id",
+    "estimate_point",
+    "issue_cycle__cycle_id",
+    "issue_module__module_id",
+    "priority",
+]
+
+
+def backfill_analytics_rollups(apps, schema_editor):
+    Issue = apps.get_model("db", "Issue")
+    AnalyticsRollup = apps.get_model("db", "AnalyticsRollup")
+
+    # Same rows as Issue.issue_objects, managers are not available here
+    issues = Issue.objects.filter(
+        Q(issue_inbox__status__in=[1, -1, 2]) | Q(issue_inbox__isnull=True),
+        archived_at__isnull=True,
+        is_draft=False,
+    )
+    for dimension in ROLLUP_DIMENSIONS:
+        rows = (
+            issues.annotate(date=TruncDate("created_at"))
+            .values("workspace_id", "project_id", "date", value=F(dimension))
+            .annotate(issue_count=Count("id"), estimate_sum=Sum("estimate_point"))
+            .order_by()
+        )
+        AnalyticsRollup.objects.bulk_create(
+            (
+                AnalyticsRollup(
+                    workspace_id=row["workspace_id"],
+                    project_id=row["project_id"],
+                    date=row["date"],
+                    dimension=dimension,
+                    value=str(row["value"]) if row["value"] is not None else None,
+                    issue_count=row["issue_count"],
+                    estimate_sum=row["estimate_sum"],
+                )
+                for row in rows.iterator()
+            ),
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0051_search_vectors'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnalyticsRollup',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('date', models.DateField()),
+                ('dimension', models.CharField(max_length=64)),
+                ('value', models.CharField(max_length=255, null=True)),
+                ('issue_count', models.PositiveIntegerField(default=0)),
+                ('estimate_sum', models.PositiveIntegerField(null=True)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='analytics_rollups', to='db.project')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='analytics_rollups', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'Analytics Rollup',
+                'verbose_name_plural': 'Analytics Rollups',
+                'db_table': 'analytics_rollups',
+                'ordering': ('-created_at',),
+                'indexes': [models.Index(fields=['workspace', 'dimension', 'date'], name='analytics_rollup_dim_idx'), models.Index(fields=['project', 'date'], name='analytics_rollup_day_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_analytics_rollups, migrations.RunPython.noop),
+    ]
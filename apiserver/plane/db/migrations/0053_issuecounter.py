@@ -0,0 +1,76 @@
+# Generated by Django 4.2.7 on 2026-10-18 05:27
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+def backfill_issue_counters(apps, schema_editor):
+    Project = apps.get_model("db", "Project")
+    IssueCounter = apps.get_model("db", "IssueCounter")
+
+    projects = Project.objects.annotate(
+        last_sequence=models.Subquery(
+            apps.get_model("db", "IssueSequence")
+            .objects.filter(project_id=models.OuterRef("id"))
+            .order_by()
+            .values("project_id")
+            .annotate(largest=models.Max("sequence"))
+            .values("largest")
+        ),
+        largest_sort_order=models.Subquery(
+            apps.get_model("db", "Issue")
+            .objects.filter(project_id=models.OuterRef("id"))
+            .order_by()
+            .values("project_id")
+            .annotate(largest=models.Max("sort_order"))
+            .values("largest")
+        ),
+    ).values("id", "workspace_id", "last_sequence", "largest_sort_order")
+
+    IssueCounter.objects.bulk_create(
+        [
+            IssueCounter(
+                project_id=project["id"],
+                workspace_id=project["workspace_id"],
+                last_sequence=project["last_sequence"] or 0,
+                largest_sort_order=project["largest_sort_order"],
+            )
+            for project in projects.iterator()
+        ],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0052_analyticsrollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IssueCounter',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('last_sequence', models.PositiveBigIntegerField(default=0)),
+                ('largest_sort_order', models.FloatField(null=True)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_%(class)s', to='db.project')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='workspace_%(class)s', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'Issue Counter',
+                'verbose_name_plural': 'Issue Counters',
+                'db_table': 'issue_counters',
+                'ordering': ('-created_at',),
+                'unique_together': {('project',)},
+            },
+        ),
+        migrations.RunPython(backfill_issue_counters, migrations.RunPython.noop),
+    ]
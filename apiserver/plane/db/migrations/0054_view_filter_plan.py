@@ -0,0 +1,33 @@
+# Generated by Django 4.2.7 on 2026-10-18 05:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0053_issuecounter'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='globalview',
+            name='cache_results',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='globalview',
+            name='filter_plan',
+            field=models.JSONField(default=dict),
+        ),
+        migrations.AddField(
+            model_name='issueview',
+            name='cache_results',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='issueview',
+            name='filter_plan',
+            field=models.JSONField(default=dict),
+        ),
+    ]
@@ -0,0 +1,88 @@
+# Generated by Django 4.2.7 on 2026-10-18 05:37
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+def backfill_issue_child_counts(apps, schema_editor):
+    tables = {
+        name: apps.get_model("db", model)._meta.db_table
+        for name, model in [
+            ("counts", "IssueChildCount"),
+            ("issues", "Issue"),
+            ("inbox", "InboxIssue"),
+            ("links", "IssueLink"),
+            ("attachments", "IssueAttachment"),
+            ("comments", "IssueComment"),
+            ("reactions", "IssueReaction"),
+        ]
+    }
+
+    def count(table, column):
+        return f"(SELECT COUNT(*) FROM {tables[table]} c WHERE c.{column} = i.id)"
+
+    # Sub-issues are counted like Issue.issue_objects
+    schema_editor.execute(
+        f"""
+        INSERT INTO {tables["counts"]} (
+            id, created_at, updated_at, issue_id, project_id, workspace_id,
+            sub_issues_count, link_count, attachment_count, comment_count,
+            reaction_count
+        )
+        SELECT
+            md5(random()::text || i.id::text)::uuid, now(), now(), i.id,
+            i.project_id, i.workspace_id,
+            (
+                SELECT COUNT(*) FROM {tables["issues"]} c
+                WHERE c.parent_id = i.id
+                    AND c.archived_at IS NULL
+                    AND NOT c.is_draft
+                    AND NOT EXISTS (
+                        SELECT 1 FROM {tables["inbox"]} ii
+                        WHERE ii.issue_id = c.id AND ii.status NOT IN (-1, 1, 2)
+                    )
+            ),
+            {count("links", "issue_id")},
+            {count("attachments", "issue_id")},
+            {count("comments", "issue_id")},
+            {count("reactions", "issue_id")}
+        FROM {tables["issues"]} i
+        """
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0054_view_filter_plan'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IssueChildCount',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('sub_issues_count', models.PositiveIntegerField(default=0)),
+                ('link_count', models.PositiveIntegerField(default=0)),
+                ('attachment_count', models.PositiveIntegerField(default=0)),
+                ('comment_count', models.PositiveIntegerField(default=0)),
+                ('reaction_count', models.PositiveIntegerField(default=0)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('issue', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='child_counts', to='db.issue')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_%(class)s', to='db.project')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='workspace_%(class)s', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'Issue Child Count',
+                'verbose_name_plural': 'Issue Child Counts',
+                'db_table': 'issue_child_counts',
+                'ordering': ('-created_at',),
+            },
+        ),
+        migrations.RunPython(backfill_issue_child_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 4.2.7 on 2026-10-18 06:02
+
+from django.db import migrations, models
+
+
+def delete_duplicate_rollups(apps, schema_editor):
+    table = apps.get_model("db", "AnalyticsRollup")._meta.db_table
+    # Concurrent refreshes could leave a row twice, the newest one is kept
+    schema_editor.execute(
+        f"""
+        DELETE FROM {table} r
+        USING {table} newer
+        WHERE r.project_id = newer.project_id
+            AND r.date = newer.date
+            AND r.dimension = newer.dimension
+            AND r.value IS NOT DISTINCT FROM newer.value
+            AND (r.created_at, r.id) < (newer.created_at, newer.id)
+        """
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0055_issue_child_counts'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            delete_duplicate_rollups, reverse_code=migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name='analyticsrollup',
+            constraint=models.UniqueConstraint(fields=('project', 'date', 'dimension', 'value'), name='analytics_rollup_unique_value'),
+        ),
+        migrations.AddConstraint(
+            model_name='analyticsrollup',
+            constraint=models.UniqueConstraint(condition=models.Q(('value__isnull', True)), fields=('project', 'date', 'dimension'), name='analytics_rollup_unique_null_value'),
+        ),
+    ]
@@ -35,6 +35,8 @@ from .issue import (
     IssueMention,
     IssueLink,
     IssueSequence,
+    IssueCounter,
+    IssueChildCount,
     IssueAttachment,
     IssueSubscriber,
     IssueReaction,
@@ -48,13 +50,25 @@ from .social_connection import SocialLoginConnection
 
 from .state import State
 
-from .cycle import Cycle, CycleIssue, CycleFavorite
+from .cycle import Cycle, CycleIssue, CycleFavorite, CycleProgress
 
 from .view import GlobalView, IssueView, IssueViewFavorite
 
-from .module import Module, ModuleMember, ModuleIssue, ModuleLink, ModuleFavorite
+from .module import (
+    Module,
+    ModuleMember,
+    ModuleIssue,
+    ModuleLink,
+    ModuleFavorite,
+    ModuleProgress,
+)
 
-from .api import APIToken, APIActivityLog
+from .api import (
+    APIToken,
+    APIActivityLog,
+    get_api_token_cache_key,
+    API_TOKEN_LAST_USED_KEY,
+)
 
 from .integration import (
     WorkspaceIntegration,
@@ -74,7 +88,7 @@ from .estimate import Estimate, EstimatePoint
 
 from .inbox import Inbox, InboxIssue
 
-from .analytic import AnalyticView
+from .analytic import AnalyticView, AnalyticsRollup
 
 from .notification import Notification
 
@@ -23,3 +23,50 @@ class AnalyticView(BaseModel):
     def __str__(self):
         """Return name of the analytic view"""
         return f"{self.name} <{self.workspace.name}>"
+
+
+class AnalyticsRollup(BaseModel):
+    """
+    Analytics Rollup (model): Issue count and estimate sum of the issues of a
+    project created on a day, grouped by one analytics dimension value
+    """
+
+    workspace = models.ForeignKey(
+        "db.Workspace", related_name="analytics_rollups", on_delete=models.CASCADE
+    )
+    project = models.ForeignKey(
+        "db.Project", related_name="analytics_rollups", on_delete=models.CASCADE
+    )
+    date = models.DateField()
+    dimension = models.CharField(max_length=64)
+    value = models.CharField(max_length=255, null=True)
+    issue_count = models.PositiveIntegerField(default=0)
+    estimate_sum = models.PositiveIntegerField(null=True)
+
+    class Meta:
+        verbose_name = "Analytics Rollup"
+        verbose_name_plural = "Analytics Rollups"
+        db_table = "analytics_rollups"
+        ordering = ("-created_at",)
+        indexes = [
+            models.Index(
+                fields=["workspace", "dimension", "date"],
+                name="analytics_rollup_dim_idx",
+            ),
+            models.Index(fields=["project", "date"], name="analytics_rollup_day_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["project", "date", "dimension", "value"],
+                name="analytics_rollup_unique_value",
+            ),
+            # Null values never collide in a unique index
+            models.UniqueConstraint(
+                fields=["project", "date", "dimension"],
+                condition=models.Q(value__isnull=True),
+                name="analytics_rollup_unique_null_value",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.dimension}={self.value} {self.date} <{self.issue_count}>"
@@ -1,9 +1,12 @@
 # Django imports
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 
 # Module imports
 from . import ProjectBaseModel
+from .workspace import invalidate_workspace_resource_cache
 
 
 class Cycle(ProjectBaseModel):
@@ -63,6 +66,35 @@ class CycleIssue(ProjectBaseModel):
         return f"{self.cycle}"
 
 
+class CycleProgress(ProjectBaseModel):
+    """
+    Cycle Progress (model): Maintained issue counts and estimate sums of a
+    cycle, refreshed whenever its cycle issues or their issues change
+    """
+
+    cycle = models.OneToOneField(
+        Cycle, on_delete=models.CASCADE, related_name="cycle_progress"
+    )
+    total_issues = models.PositiveIntegerField(default=0)
+    completed_issues = models.PositiveIntegerField(default=0)
+    cancelled_issues = models.PositiveIntegerField(default=0)
+    started_issues = models.PositiveIntegerField(default=0)
+    unstarted_issues = models.PositiveIntegerField(default=0)
+    backlog_issues = models.PositiveIntegerField(default=0)
+    total_estimates = models.PositiveIntegerField(null=True)
+    completed_estimates = models.PositiveIntegerField(null=True)
+    started_estimates = models.PositiveIntegerField(null=True)
+
+    class Meta:
+        verbose_name = "Cycle Progress"
+        verbose_name_plural = "Cycle Progress"
+        db_table = "cycle_progress"
+        ordering = ("-created_at",)
+
+    def __str__(self):
+        return f"{self.cycle_id} {self.completed_issues}/{self.total_issues}"
+
+
 class CycleFavorite(ProjectBaseModel):
     """_summary_
     CycleFavorite (model): To store all the cycle favorite of the user
@@ -87,3 +119,28 @@ class CycleFavorite(ProjectBaseModel):
     def __str__(self):
         """Return user and the cycle"""
         return f"{self.user.email} <{self.cycle.name}>"
+
+
+@receiver(post_save, sender=CycleIssue)
+@receiver(post_delete, sender=CycleIssue)
+def update_cycle_progress(sender, instance, **kwargs):
+    from plane.utils.progress import refresh_cycle_progress
+
+    transaction.on_commit(lambda: refresh_cycle_progress([instance.cycle_id]))
+
+
+@receiver(post_save, sender=CycleIssue)
+@receiver(post_delete, sender=CycleIssue)
+def invalidate_view_results(sender, instance, **kwargs):
+    from plane.utils.view_filters import invalidate_project_issues
+
+    # The issue list shows the cycle_id of every issue
+    transaction.on_commit(lambda: invalidate_project_issues([instance.project_id]))
+
+
+@receiver(post_save, sender=Cycle)
+@receiver(post_delete, sender=Cycle)
+def invalidate_project_list_etags(sender, instance, created=True, **kwargs):
+    # The project list only counts them
+    if created:
+        invalidate_workspace_resource_cache([instance.workspace_id], ["projects"])
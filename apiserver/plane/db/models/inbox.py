@@ -1,5 +1,7 @@
 # Django imports
-from django.db import models
+from django.db import models, transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 
 # Module imports
 from plane.db.models import ProjectBaseModel
@@ -49,3 +51,15 @@ class InboxIssue(ProjectBaseModel):
     def __str__(self):
         """Return name of the Issue"""
         return f"{self.issue.name} <{self.inbox.name}>"
+
+
+@receiver(post_save, sender=InboxIssue)
+@receiver(post_delete, sender=InboxIssue)
+def update_inbox_parent_child_counts(sender, instance, **kwargs):
+    # Pending inbox issues are not counted as sub-issues of their parent, nor
+    # listed with the issues of the project
+    from plane.utils.issue_counts import refresh_parent_counts
+    from plane.utils.view_filters import invalidate_project_issues
+
+    refresh_parent_counts([instance.issue_id])
+    transaction.on_commit(lambda: invalidate_project_issues([instance.project_id]))
@@ -3,9 +3,11 @@ from uuid import uuid4
 
 # Django imports
 from django.contrib.postgres.fields import ArrayField
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import connection, models, transaction
 from django.conf import settings
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
@@ -13,6 +15,7 @@ from django.core.exceptions import ValidationError
 
 # Module imports
 from . import ProjectBaseModel
+from .workspace import invalidate_project_resource_cache
 from plane.utils.html_processor import strip_tags
 
 
@@ -34,6 +37,35 @@ def get_default_properties():
     }
 
 
+# Fields whose loaded value is kept to tell what a save changed
+TRACKED_FIELDS = [
+    "parent_id",
+    "sort_order",
+    "archived_at",
+    "is_draft",
+    "state_id",
+    "target_date",
+    "priority",
+    "created_by_id",
+    "completed_at",
+]
+
+# Issue fields the dashboard issue stats are computed from
+ISSUE_STATS_FIELDS = [
+    "state_id",
+    "target_date",
+    "priority",
+    "created_by_id",
+    "completed_at",
+    "archived_at",
+    "is_draft",
+]
+
+
+def loaded_values(values):
+    return {field: values[field] for field in TRACKED_FIELDS if field in values}
+
+
 # TODO: Handle identifiers for Bulk Inserts - nk
 class IssueManager(models.Manager):
     def get_queryset(self):
@@ -51,6 +83,84 @@ class IssueManager(models.Manager):
         )
 
 
+# Gap left between the sort orders of consecutive new issues
+SORT_ORDER_STEP = 10000
+DEFAULT_SORT_ORDER = 65535
+
+
+class IssueCounterManager(models.Manager):
+    def seed(self, project_id):
+        """create the counter of a project from its current issues"""
+        from plane.db.models import Project
+
+        self.bulk_create(
+            [
+                IssueCounter(
+                    project_id=project_id,
+                    workspace_id=Project.objects.values_list(
+                        "workspace_id", flat=True
+                    ).get(pk=project_id),
+                    last_sequence=IssueSequence.objects.filter(
+                        project_id=project_id
+                    ).aggregate(largest=models.Max("sequence"))["largest"]
+                    or 0,
+                    largest_sort_order=Issue.objects.filter(
+                        project_id=project_id
+                    ).aggregate(largest=models.Max("sort_order"))["largest"],
+                )
+            ],
+            ignore_conflicts=True,
+        )
+
+    def allocate(self, project_id, count=1):
+        """reserve sequence ids and sort orders for new issues of a project
+
+        The counter row is advanced with a single UPDATE ... RETURNING, so
+        concurrent creates queue on one row lock instead of scanning the
+        project issues, and a bulk insert reserves its whole range at once.
+
+        Returns:
+            tuple: lists of count sequence ids and sort orders
+        """
+        sql = f"""
+            UPDATE {IssueCounter._meta.db_table}
+            SET last_sequence = last_sequence + %s,
+                largest_sort_order = COALESCE(largest_sort_order, %s) + %s,
+                updated_at = now()
+            WHERE project_id = %s
+            RETURNING last_sequence, largest_sort_order
+        """
+        params = [
+            count,
+            DEFAULT_SORT_ORDER - SORT_ORDER_STEP,
+            count * SORT_ORDER_STEP,
+            project_id,
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            row = cursor.fetchone()
+            if row is None:
+                # First issue since the counters were introduced
+                self.seed(project_id)
+                cursor.execute(sql, params)
+                row = cursor.fetchone()
+
+        last_sequence, largest_sort_order = row
+        return (
+            list(range(last_sequence - count + 1, last_sequence + 1)),
+            [
+                largest_sort_order - (count - 1 - index) * SORT_ORDER_STEP
+                for index in range(count)
+            ],
+        )
+
+    def reserve_sort_order(self, project_id, sort_order):
+        # Issues moved past the counter keep new issues below them
+        self.filter(project_id=project_id, largest_sort_order__lt=sort_order).update(
+            largest_sort_order=sort_order
+        )
+
+
 class Issue(ProjectBaseModel):
     PRIORITY_CHOICES = (
         ("urgent", "Urgent"),
@@ -103,6 +213,7 @@ class Issue(ProjectBaseModel):
     completed_at = models.DateTimeField(null=True)
     archived_at = models.DateField(null=True)
     is_draft = models.BooleanField(default=False)
+    search_vector = SearchVectorField(null=True, editable=False)
 
     objects = models.Manager()
     issue_objects = IssueManager()
@@ -112,6 +223,9 @@ class Issue(ProjectBaseModel):
         verbose_name_plural = "Issues"
         db_table = "issues"
         ordering = ("-created_at",)
+        indexes = [
+            GinIndex(fields=["search_vector"], name="issues_search_vector_idx"),
+        ]
 
     def save(self, *args, **kwargs):
         # This means that the model isn't saved to the database yet
@@ -134,20 +248,17 @@ class Issue(ProjectBaseModel):
                 pass
 
         if self._state.adding:
-            # Get the maximum display_id value from the database
-            last_id = IssueSequence.objects.filter(project=self.project).aggregate(
-                largest=models.Max("sequence")
-            )["largest"]
-            # aggregate can return None! Check it first.
-            # If it isn't none, just use the last ID specified (which should be the greatest) and add one to it
-            if last_id is not None:
-                self.sequence_id = last_id + 1
-
-            largest_sort_order = Issue.objects.filter(
-                project=self.project, state=self.state
-            ).aggregate(largest=models.Max("sort_order"))["largest"]
-            if largest_sort_order is not None:
-                self.sort_order = largest_sort_order + 10000
+            # Reserve the next display id and a sort order below every issue
+            sequence_ids, sort_orders = IssueCounter.objects.allocate(
+                self.project_id
+            )
+            self.sequence_id = sequence_ids[0]
+            self.sort_order = sort_orders[0]
+        elif self.tracked_changed("sort_order") and (
+            kwargs.get("update_fields") is None
+            or "sort_order" in kwargs.get("update_fields")
+        ):
+            IssueCounter.objects.reserve_sort_order(self.project_id, self.sort_order)
 
         # Strip the html tags using html parser
         self.description_stripped = (
@@ -156,6 +267,23 @@ class Issue(ProjectBaseModel):
             else strip_tags(self.description_html)
         )
         super(Issue, self).save(*args, **kwargs)
+        self._loaded = loaded_values(self.__dict__)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Kept so a re-parented issue can recount its previous parent, and
+        # saves that keep the sort order, the sub-issue fields or the issue
+        # stats fields skip the matching update
+        instance._loaded = loaded_values(dict(zip(field_names, values)))
+        return instance
+
+    def loaded_value(self, field):
+        return getattr(self, "_loaded", {}).get(field)
+
+    def tracked_changed(self, field):
+        loaded = getattr(self, "_loaded", {})
+        return field not in loaded or getattr(self, field) != loaded[field]
 
     def __str__(self):
         """Return name of the issue"""
@@ -364,6 +492,7 @@ class IssueComment(ProjectBaseModel):
         default="INTERNAL",
         max_length=100,
     )
+    search_vector = SearchVectorField(null=True, editable=False)
 
     def save(self, *args, **kwargs):
         self.comment_stripped = (
@@ -376,6 +505,9 @@ class IssueComment(ProjectBaseModel):
         verbose_name_plural = "Issue Comments"
         db_table = "issue_comments"
         ordering = ("-created_at",)
+        indexes = [
+            GinIndex(fields=["search_vector"], name="comments_search_vector_idx"),
+        ]
 
     def __str__(self):
         """Return issue of the comment"""
@@ -470,6 +602,53 @@ class IssueSequence(ProjectBaseModel):
         ordering = ("-created_at",)
 
 
+class IssueCounter(ProjectBaseModel):
+    """
+    Issue Counter (model): Last sequence id and largest sort order handed
+    out to the issues of a project
+    """
+
+    last_sequence = models.PositiveBigIntegerField(default=0)
+    largest_sort_order = models.FloatField(null=True)
+
+    objects = IssueCounterManager()
+
+    class Meta:
+        unique_together = ["project"]
+        verbose_name = "Issue Counter"
+        verbose_name_plural = "Issue Counters"
+        db_table = "issue_counters"
+        ordering = ("-created_at",)
+
+    def __str__(self):
+        return f"{self.project_id} <{self.last_sequence}>"
+
+
+class IssueChildCount(ProjectBaseModel):
+    """
+    Issue Child Count (model): Maintained counts of the sub-issues, links,
+    attachments, comments and reactions of an issue
+    """
+
+    issue = models.OneToOneField(
+        Issue, on_delete=models.CASCADE, related_name="child_counts"
+    )
+    sub_issues_count = models.PositiveIntegerField(default=0)
+    link_count = models.PositiveIntegerField(default=0)
+    attachment_count = models.PositiveIntegerField(default=0)
+    comment_count = models.PositiveIntegerField(default=0)
+    reaction_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Issue Child Count"
+        verbose_name_plural = "Issue Child Counts"
+        db_table = "issue_child_counts"
+        ordering = ("-created_at",)
+
+    def __str__(self):
+        return f"{self.issue_id} <{self.sub_issues_count}>"
+
+
 class IssueSubscriber(ProjectBaseModel):
     issue = models.ForeignKey(
         Issue, on_delete=models.CASCADE, related_name="issue_subscribers"
@@ -569,3 +748,176 @@ def create_issue_sequence(sender, instance, created, **kwargs):
         IssueSequence.objects.create(
             issue=instance, sequence=instance.sequence_id, project=instance.project
         )
+
+
+# Fields feeding the cycle and module progress counters
+PROGRESS_FIELDS = {"state", "state_id", "estimate_point", "archived_at", "is_draft"}
+
+
+@receiver(post_save, sender=Issue)
+def update_issue_progress(sender, instance, created, update_fields=None, **kwargs):
+    # A new issue is not part of any cycle or module yet
+    if created or (update_fields and not PROGRESS_FIELDS.intersection(update_fields)):
+        return
+
+    from plane.utils.progress import refresh_issue_progress
+
+    transaction.on_commit(lambda: refresh_issue_progress([instance.id]))
+
+
+# Fields feeding the issue and comment search vectors
+ISSUE_SEARCH_FIELDS = {"name", "description_html", "description_stripped"}
+COMMENT_SEARCH_FIELDS = {"comment_html", "comment_stripped"}
+
+
+@receiver(post_save, sender=Issue)
+def update_issue_search_vector(sender, instance, update_fields=None, **kwargs):
+    if update_fields and not ISSUE_SEARCH_FIELDS.intersection(update_fields):
+        return
+
+    from plane.utils.search import update_search_vectors
+
+    update_search_vectors(Issue, [instance.id])
+
+
+@receiver(post_save, sender=IssueComment)
+def update_comment_search_vector(sender, instance, update_fields=None, **kwargs):
+    if update_fields and not COMMENT_SEARCH_FIELDS.intersection(update_fields):
+        return
+
+    from plane.utils.search import update_search_vectors
+
+    update_search_vectors(IssueComment, [instance.id])
+
+
+@receiver(post_save, sender=Issue)
+def invalidate_issue_stats_of_issue(sender, instance, created, **kwargs):
+    if not any(instance.tracked_changed(field) for field in ISSUE_STATS_FIELDS):
+        return
+
+    from plane.utils.dashboard import invalidate_issue_stats, issue_stats_users
+
+    # A new issue has no assignees or subscribers yet, they signal themselves
+    user_ids = {instance.created_by_id, instance.loaded_value("created_by_id")}
+    if created:
+        transaction.on_commit(lambda: invalidate_issue_stats(user_ids))
+        return
+
+    transaction.on_commit(
+        lambda: invalidate_issue_stats(user_ids | issue_stats_users([instance.id]))
+    )
+
+
+@receiver(post_delete, sender=Issue)
+def invalidate_issue_stats_of_deleted_issue(sender, instance, **kwargs):
+    from plane.utils.dashboard import invalidate_issue_stats
+
+    # Assignees and subscribers are deleted with the issue and signal themselves
+    transaction.on_commit(lambda: invalidate_issue_stats([instance.created_by_id]))
+
+
+@receiver(post_save, sender=IssueAssignee)
+@receiver(post_delete, sender=IssueAssignee)
+def invalidate_issue_stats_of_assignee(sender, instance, **kwargs):
+    from plane.utils.dashboard import invalidate_issue_stats
+
+    transaction.on_commit(lambda: invalidate_issue_stats([instance.assignee_id]))
+
+
+@receiver(post_save, sender=IssueSubscriber)
+@receiver(post_delete, sender=IssueSubscriber)
+def invalidate_issue_stats_of_subscriber(sender, instance, **kwargs):
+    from plane.utils.dashboard import invalidate_issue_stats
+
+    transaction.on_commit(lambda: invalidate_issue_stats([instance.subscriber_id]))
+
+
+@receiver(post_save, sender=Issue)
+@receiver(post_delete, sender=Issue)
+@receiver(post_save, sender=IssueAssignee)
+@receiver(post_delete, sender=IssueAssignee)
+@receiver(post_save, sender=IssueLabel)
+@receiver(post_delete, sender=IssueLabel)
+@receiver(post_save, sender=IssueSubscriber)
+@receiver(post_delete, sender=IssueSubscriber)
+@receiver(post_save, sender=IssueMention)
+@receiver(post_delete, sender=IssueMention)
+def invalidate_view_results(sender, instance, **kwargs):
+    from plane.utils.view_filters import invalidate_project_issues
+
+    transaction.on_commit(lambda: invalidate_project_issues([instance.project_id]))
+
+
+def deleted_directly(sender, origin):
+    # Rows deleted along with their issue or project need no recount
+    model = origin.model if isinstance(origin, models.QuerySet) else type(origin)
+    return model is sender
+
+
+# Fields deciding whether an issue counts as a sub-issue of its parent
+SUB_ISSUE_FIELDS = {"parent", "parent_id", "archived_at", "is_draft"}
+
+
+@receiver(post_save, sender=Issue)
+def update_parent_child_counts(sender, instance, update_fields=None, **kwargs):
+    if update_fields and not SUB_ISSUE_FIELDS.intersection(update_fields):
+        return
+    if not any(
+        instance.tracked_changed(field)
+        for field in ["parent_id", "archived_at", "is_draft"]
+    ):
+        return
+
+    from plane.utils.issue_counts import refresh_issue_counts
+
+    # Save moves the loaded parent on only after the signals ran
+    refresh_issue_counts(
+        [instance.parent_id, instance.loaded_value("parent_id")]
+    )
+
+
+@receiver(post_delete, sender=Issue)
+def update_deleted_parent_child_counts(sender, instance, origin=None, **kwargs):
+    if not deleted_directly(sender, origin):
+        return
+
+    from plane.utils.issue_counts import refresh_issue_counts
+
+    refresh_issue_counts([instance.parent_id])
+
+
+@receiver(post_save, sender=IssueLink)
+@receiver(post_delete, sender=IssueLink)
+@receiver(post_save, sender=IssueAttachment)
+@receiver(post_delete, sender=IssueAttachment)
+@receiver(post_save, sender=IssueComment)
+@receiver(post_delete, sender=IssueComment)
+@receiver(post_save, sender=IssueReaction)
+@receiver(post_delete, sender=IssueReaction)
+def update_child_counts(sender, instance, created=True, origin=None, **kwargs):
+    # Updates keep the count, deletes through the issue leave nothing to count
+    if not created or (origin is not None and not deleted_directly(sender, origin)):
+        return
+
+    from plane.utils.issue_counts import refresh_issue_counts
+
+    refresh_issue_counts([instance.issue_id])
+
+
+@receiver(post_save, sender=Label)
+@receiver(post_delete, sender=Label)
+def invalidate_label_etags(sender, instance, **kwargs):
+    invalidate_project_resource_cache([instance.project_id], ["labels"])
+
+
+@receiver(post_save, sender=IssueLink)
+@receiver(post_delete, sender=IssueLink)
+@receiver(post_save, sender=IssueAttachment)
+@receiver(post_delete, sender=IssueAttachment)
+@receiver(post_save, sender=IssueReaction)
+@receiver(post_delete, sender=IssueReaction)
+def invalidate_issue_child_etags(sender, instance, origin=None, **kwargs):
+    # Rows deleted with their issue go along with a change to the issue list
+    if origin is not None and not deleted_directly(sender, origin):
+        return
+    invalidate_project_resource_cache([instance.project_id], ["issue_children"])
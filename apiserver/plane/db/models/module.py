@@ -1,9 +1,12 @@
 # Django imports
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 
 # Module imports
 from . import ProjectBaseModel
+from .workspace import invalidate_workspace_resource_cache
 
 
 class Module(ProjectBaseModel):
@@ -97,6 +100,32 @@ class ModuleIssue(ProjectBaseModel):
         return f"{self.module.name} {self.issue.name}"
 
 
+class ModuleProgress(ProjectBaseModel):
+    """
+    Module Progress (model): Maintained issue counts of a module, refreshed
+    whenever its module issues or their issues change
+    """
+
+    module = models.OneToOneField(
+        Module, on_delete=models.CASCADE, related_name="module_progress"
+    )
+    total_issues = models.PositiveIntegerField(default=0)
+    completed_issues = models.PositiveIntegerField(default=0)
+    cancelled_issues = models.PositiveIntegerField(default=0)
+    started_issues = models.PositiveIntegerField(default=0)
+    unstarted_issues = models.PositiveIntegerField(default=0)
+    backlog_issues = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Module Progress"
+        verbose_name_plural = "Module Progress"
+        db_table = "module_progress"
+        ordering = ("-created_at",)
+
+    def __str__(self):
+        return f"{self.module_id} {self.completed_issues}/{self.total_issues}"
+
+
 class ModuleLink(ProjectBaseModel):
     title = models.CharField(max_length=255, blank=True, null=True)
     url = models.URLField()
@@ -139,3 +168,28 @@ class ModuleFavorite(ProjectBaseModel):
     def __str__(self):
         """Return user and the module"""
         return f"{self.user.email} <{self.module.name}>"
+
+
+@receiver(post_save, sender=ModuleIssue)
+@receiver(post_delete, sender=ModuleIssue)
+def update_module_progress(sender, instance, **kwargs):
+    from plane.utils.progress import refresh_module_progress
+
+    transaction.on_commit(lambda: refresh_module_progress([instance.module_id]))
+
+
+@receiver(post_save, sender=ModuleIssue)
+@receiver(post_delete, sender=ModuleIssue)
+def invalidate_view_results(sender, instance, **kwargs):
+    from plane.utils.view_filters import invalidate_project_issues
+
+    # The issue list shows the module_id of every issue
+    transaction.on_commit(lambda: invalidate_project_issues([instance.project_id]))
+
+
+@receiver(post_save, sender=Module)
+@receiver(post_delete, sender=Module)
+def invalidate_project_list_etags(sender, instance, created=True, **kwargs):
+    # The project list only counts them
+    if created:
+        invalidate_workspace_resource_cache([instance.workspace_id], ["projects"])
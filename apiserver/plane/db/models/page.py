@@ -3,6 +3,10 @@ import uuid
 # Django imports
 from django.db import models
 from django.conf import settings
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 
 # Module imports
 from . import ProjectBaseModel
@@ -33,12 +37,25 @@ class Page(ProjectBaseModel):
     )
     archived_at = models.DateField(null=True)
     is_locked = models.BooleanField(default=False)
+    search_vector = SearchVectorField(null=True, editable=False)
 
     class Meta:
         verbose_name = "Page"
         verbose_name_plural = "Pages"
         db_table = "pages"
         ordering = ("-created_at",)
+        indexes = [
+            GinIndex(fields=["search_vector"], name="pages_search_vector_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        # Strip the html tags using html parser
+        self.description_stripped = (
+            None
+            if (self.description_html == "" or self.description_html is None)
+            else strip_tags(self.description_html)
+        )
+        super(Page, self).save(*args, **kwargs)
 
     def __str__(self):
         """Return owner email and page name"""
@@ -171,3 +188,17 @@ class PageLabel(ProjectBaseModel):
 
     def __str__(self):
         return f"{self.page.name} {self.label.name}"
+
+
+# Fields feeding the page search vector
+PAGE_SEARCH_FIELDS = {"name", "description_html", "description_stripped"}
+
+
+@receiver(post_save, sender=Page)
+def update_page_search_vector(sender, instance, update_fields=None, **kwargs):
+    if update_fields and not PAGE_SEARCH_FIELDS.intersection(update_fields):
+        return
+
+    from plane.utils.search import update_search_vectors
+
+    update_search_vectors(Page, [instance.id])
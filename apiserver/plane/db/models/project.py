@@ -4,6 +4,8 @@ from uuid import uuid4
 # Django imports
 from django.db import models
 from django.conf import settings
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.core.validators import MinValueValidator, MaxValueValidator
 
 # Modeule imports
@@ -11,6 +13,13 @@ from plane.db.mixins import AuditModel
 
 # Module imports
 from . import BaseModel
+from .workspace import (
+    MemberQuerySet,
+    MEMBERSHIP_FIELDS,
+    invalidate_member_cache,
+    invalidate_project_resource_cache,
+    invalidate_workspace_resource_cache,
+)
 
 ROLE_CHOICES = (
     (20, "Admin"),
@@ -152,6 +161,44 @@ class ProjectMemberInvite(ProjectBaseModel):
         return f"{self.project.name} {self.email} {self.accepted}"
 
 
+def invalidate_project_member_resources(project_members):
+    # project_members are (project_id, workspace_id) pairs
+    project_members = set(project_members)
+    invalidate_project_resource_cache(
+        [project_id for project_id, _ in project_members], ["members"]
+    )
+    invalidate_workspace_resource_cache(
+        [workspace_id for _, workspace_id in project_members], ["projects"]
+    )
+
+
+class ProjectMemberQuerySet(MemberQuerySet):
+    """Also moves the ETags of the member lists on bulk writes"""
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = super().bulk_create(objs, *args, **kwargs)
+        invalidate_project_member_resources(
+            (obj.project_id, obj.workspace_id) for obj in objs
+        )
+        return objs
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs = list(objs)
+        rows = super().bulk_update(objs, fields, *args, **kwargs)
+        invalidate_project_member_resources(
+            (obj.project_id, obj.workspace_id) for obj in objs
+        )
+        return rows
+
+    def update(self, **kwargs):
+        project_members = list(
+            self.order_by().values_list("project_id", "workspace_id").distinct()
+        )
+        rows = super().update(**kwargs)
+        invalidate_project_member_resources(project_members)
+        return rows
+
+
 class ProjectMember(ProjectBaseModel):
     member = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -168,6 +215,8 @@ class ProjectMember(ProjectBaseModel):
     sort_order = models.FloatField(default=65535)
     is_active = models.BooleanField(default=True)
 
+    objects = ProjectMemberQuerySet.as_manager()
+
     def save(self, *args, **kwargs):
         if self._state.adding:
             smallest_sort_order = ProjectMember.objects.filter(
@@ -280,3 +329,34 @@ class ProjectPublicMember(ProjectBaseModel):
         verbose_name_plural = "Project Public Members"
         db_table = "project_public_members"
         ordering = ("-created_at",)
+
+
+@receiver(post_save, sender=ProjectMember)
+@receiver(post_delete, sender=ProjectMember)
+def invalidate_project_member_cache(
+    sender, instance, update_fields=None, **kwargs
+):
+    if update_fields and not MEMBERSHIP_FIELDS.intersection(update_fields):
+        return
+    invalidate_member_cache([instance.member_id])
+
+
+@receiver(post_save, sender=ProjectMember)
+@receiver(post_delete, sender=ProjectMember)
+def invalidate_project_member_etags(sender, instance, **kwargs):
+    invalidate_project_member_resources([(instance.project_id, instance.workspace_id)])
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def invalidate_project_etags(sender, instance, **kwargs):
+    invalidate_project_resource_cache([instance.id], ["project"])
+    invalidate_workspace_resource_cache([instance.workspace_id], ["projects"])
+
+
+@receiver(post_save, sender=ProjectFavorite)
+@receiver(post_delete, sender=ProjectFavorite)
+@receiver(post_save, sender=ProjectDeployBoard)
+@receiver(post_delete, sender=ProjectDeployBoard)
+def invalidate_project_list_etags(sender, instance, **kwargs):
+    invalidate_workspace_resource_cache([instance.workspace_id], ["projects"])
@@ -1,9 +1,12 @@
 # Django imports
-from django.db import models
+from django.db import models, transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.template.defaultfilters import slugify
 
 # Module imports
 from . import ProjectBaseModel
+from .workspace import invalidate_project_resource_cache
 
 
 class State(ProjectBaseModel):
@@ -47,4 +50,37 @@ class State(ProjectBaseModel):
             if last_id is not None:
                 self.sequence = last_id + 15000
 
-        return super().save(*args, **kwargs)
+        super().save(*args, **kwargs)
+        self._loaded_group = self.group
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Cycle and module progress is counted per state group
+        instance._loaded_group = dict(zip(field_names, values)).get("group")
+        return instance
+
+    def group_changed(self):
+        return getattr(self, "_loaded_group", None) != self.group
+
+
+@receiver(post_save, sender=State)
+@receiver(post_delete, sender=State)
+def invalidate_state_etags(sender, instance, **kwargs):
+    invalidate_project_resource_cache([instance.project_id], ["states"])
+
+
+@receiver(post_save, sender=State)
+def update_state_issue_progress(sender, instance, created, **kwargs):
+    # A new state holds no issues yet
+    if created or not instance.group_changed():
+        return
+
+    from plane.db.models import Issue
+    from plane.utils.progress import refresh_issue_progress
+
+    transaction.on_commit(
+        lambda: refresh_issue_progress(
+            Issue.objects.filter(state_id=instance.id).values_list("id", flat=True)
+        )
+    )
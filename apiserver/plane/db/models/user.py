@@ -5,7 +5,7 @@ import random
 import pytz
 
 # Django imports
-from django.db import models
+from django.db import models, transaction
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.contrib.auth.models import AbstractBaseUser, UserManager, PermissionsMixin
@@ -27,6 +27,21 @@ def get_default_onboarding():
     }
 
 
+# Fields shown wherever users are embedded
+DISPLAY_FIELDS = [
+    "first_name",
+    "last_name",
+    "display_name",
+    "avatar",
+    "email",
+    "is_bot",
+]
+
+
+def loaded_display(values):
+    return {field: values[field] for field in DISPLAY_FIELDS if field in values}
+
+
 class User(AbstractBaseUser, PermissionsMixin):
     id = models.UUIDField(
         default=uuid.uuid4, unique=True, editable=False, db_index=True, primary_key=True
@@ -121,6 +136,32 @@ class User(AbstractBaseUser, PermissionsMixin):
             self.is_staff = True
 
         super(User, self).save(*args, **kwargs)
+        self._loaded_display = loaded_display(self.__dict__)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Kept so saves like the login ones, which change no display field,
+        # leave the ETags of the lists showing the user alone
+        instance._loaded_display = loaded_display(dict(zip(field_names, values)))
+        return instance
+
+    def display_changed(self):
+        loaded = getattr(self, "_loaded_display", None)
+        return loaded is None or any(
+            getattr(self, field) != value for field, value in loaded.items()
+        )
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_etags(sender, instance, created, **kwargs):
+    # New users are in no list yet
+    if created or not instance.display_changed():
+        return
+
+    from plane.utils.etag import invalidate_user_resources
+
+    transaction.on_commit(lambda: invalidate_user_resources([instance.id]))
 
 
 @receiver(post_save, sender=User)
@@ -17,6 +17,8 @@ class GlobalView(BaseModel):
         default=1, choices=((0, "Private"), (1, "Public"))
     )
     query_data = models.JSONField(default=dict)
+    filter_plan = models.JSONField(default=dict)
+    cache_results = models.BooleanField(default=False)
     sort_order = models.FloatField(default=65535)
 
     class Meta:
@@ -48,6 +50,8 @@ class IssueView(ProjectBaseModel):
         default=1, choices=((0, "Private"), (1, "Public"))
     )
     query_data = models.JSONField(default=dict)
+    filter_plan = models.JSONField(default=dict)
+    cache_results = models.BooleanField(default=False)
 
     class Meta:
         verbose_name = "Issue View"
@@ -1,6 +1,8 @@
 # Django imports
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 
 # Module imports
 from . import BaseModel
@@ -78,6 +80,20 @@ class Workspace(BaseModel):
         """Return name of the Workspace"""
         return self.name
 
+    def save(self, *args, **kwargs):
+        super(Workspace, self).save(*args, **kwargs)
+        self._loaded_slug = self.slug
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # The cached roles of the members are keyed by the slug
+        instance._loaded_slug = dict(zip(field_names, values)).get("slug")
+        return instance
+
+    def slug_changed(self):
+        return getattr(self, "_loaded_slug", None) != self.slug
+
     class Meta:
         verbose_name = "Workspace"
         verbose_name_plural = "Workspaces"
@@ -85,6 +101,69 @@ class Workspace(BaseModel):
         ordering = ("-created_at",)
 
 
+# Fields that change what a membership grants
+MEMBERSHIP_FIELDS = {
+    "role",
+    "is_active",
+    "member",
+    "member_id",
+    "workspace",
+    "workspace_id",
+    "project",
+    "project_id",
+}
+
+
+def invalidate_member_cache(member_ids):
+    from plane.utils.membership import invalidate_memberships
+
+    member_ids = set(member_ids)
+    transaction.on_commit(lambda: invalidate_memberships(member_ids))
+
+
+def invalidate_project_resource_cache(project_ids, resources):
+    from plane.utils.etag import invalidate_project_resources
+
+    project_ids = set(project_ids)
+    transaction.on_commit(
+        lambda: invalidate_project_resources(project_ids, resources)
+    )
+
+
+def invalidate_workspace_resource_cache(workspace_ids, resources):
+    from plane.utils.etag import invalidate_workspace_resources
+
+    workspace_ids = set(workspace_ids)
+    transaction.on_commit(
+        lambda: invalidate_workspace_resources(workspace_ids, resources)
+    )
+
+
+class MemberQuerySet(models.QuerySet):
+    """Membership queryset that also drops the cached roles on bulk writes,
+    which skip the model signals"""
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = super().bulk_create(objs, *args, **kwargs)
+        invalidate_member_cache(obj.member_id for obj in objs)
+        return objs
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs = list(objs)
+        rows = super().bulk_update(objs, fields, *args, **kwargs)
+        if MEMBERSHIP_FIELDS.intersection(fields):
+            invalidate_member_cache(obj.member_id for obj in objs)
+        return rows
+
+    def update(self, **kwargs):
+        if not MEMBERSHIP_FIELDS.intersection(kwargs):
+            return super().update(**kwargs)
+        member_ids = list(self.values_list("member_id", flat=True))
+        rows = super().update(**kwargs)
+        invalidate_member_cache(member_ids)
+        return rows
+
+
 class WorkspaceMember(BaseModel):
     workspace = models.ForeignKey(
         "db.Workspace", on_delete=models.CASCADE, related_name="workspace_member"
@@ -101,6 +180,8 @@ class WorkspaceMember(BaseModel):
     issue_props = models.JSONField(default=get_issue_props)
     is_active = models.BooleanField(default=True)
 
+    objects = MemberQuerySet.as_manager()
+
     class Meta:
         unique_together = ["workspace", "member"]
         verbose_name = "Workspace Member"
@@ -200,3 +281,31 @@ class WorkspaceTheme(BaseModel):
         verbose_name_plural = "Workspace Themes"
         db_table = "workspace_themes"
         ordering = ("-created_at",)
+
+
+@receiver(post_save, sender=WorkspaceMember)
+@receiver(post_delete, sender=WorkspaceMember)
+def invalidate_workspace_member_cache(
+    sender, instance, update_fields=None, **kwargs
+):
+    if update_fields and not MEMBERSHIP_FIELDS.intersection(update_fields):
+        return
+    invalidate_member_cache([instance.member_id])
+
+
+@receiver(post_save, sender=Workspace)
+def invalidate_workspace_resources_of_workspace(sender, instance, **kwargs):
+    invalidate_workspace_resource_cache([instance.id], ["workspace"])
+
+
+@receiver(post_save, sender=Workspace)
+def invalidate_workspace_member_roles(sender, instance, created, **kwargs):
+    # A renamed workspace frees its slug for another one, the roles cached
+    # under the old slug must not outlive the rename
+    if created or not instance.slug_changed():
+        return
+    invalidate_member_cache(
+        WorkspaceMember.objects.filter(workspace_id=instance.id).values_list(
+            "member_id", flat=True
+        )
+    )
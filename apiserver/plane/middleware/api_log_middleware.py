@@ -1,40 +1,74 @@
-from plane.db.models import APIToken, APIActivityLog
+# Python imports
+import json
+import random
+
+# Django imports
+from django.conf import settings
+
+# Third party imports
+from sentry_sdk import capture_exception
+
+# Module imports
+from plane.settings.redis import redis_instance
+from plane.bgtasks.api_log_task import (
+    API_ACTIVITY_LOG_QUEUE,
+    flush_api_activity_logs,
+)
 
 
 class APITokenLogMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
+        # One client per process, the logs are only queued on the hot path
+        self.ri = redis_instance()
 
     def __call__(self, request):
-        request_body = request.body
+        api_key = request.headers.get("X-Api-Key")
+        # Only api key requests are logged, do not read other bodies
+        request_body = request.body if api_key else None
         response = self.get_response(request)
-        self.process_request(request, response, request_body)
+        if api_key:
+            self.process_request(request, response, request_body, api_key)
         return response
 
-    def process_request(self, request, response, request_body):
-        api_key_header = "X-Api-Key"
-        api_key = request.headers.get(api_key_header)
-        # If the API key is present, log the request
-        if api_key:
-            try:
-                APIActivityLog.objects.create(
-                    token_identifier=api_key,
-                    path=request.path,
-                    method=request.method,
-                    query_params=request.META.get("QUERY_STRING", ""),
-                    headers=str(request.headers),
-                    body=(request_body.decode('utf-8') if request_body else None),
-                    response_body=(
-                        response.content.decode("utf-8") if response.content else None
-                    ),
-                    response_code=response.status_code,
-                    ip_address=request.META.get("REMOTE_ADDR", None),
-                    user_agent=request.META.get("HTTP_USER_AGENT", None),
-                )
+    def _truncate(self, content):
+        limit = settings.API_ACTIVITY_LOG_BODY_LIMIT
+        if not content or limit == 0:
+            return None
+        return content[:limit].decode("utf-8", errors="ignore")
 
-            except Exception as e:
-                print(e)
-                # If the token does not exist, you can decide whether to log this as an invalid attempt
-                pass
+    def process_request(self, request, response, request_body, api_key):
+        if random.random() >= settings.API_ACTIVITY_LOG_SAMPLE_RATE:
+            return None
+
+        try:
+            record = {
+                "token_identifier": api_key,
+                "path": request.path,
+                "method": request.method,
+                "query_params": request.META.get("QUERY_STRING", ""),
+                "headers": str(request.headers),
+                "body": self._truncate(request_body),
+                "response_body": (
+                    None
+                    if getattr(response, "streaming", False)
+                    else self._truncate(response.content)
+                ),
+                "response_code": response.status_code,
+                "ip_address": request.META.get("REMOTE_ADDR", None),
+                "user_agent": request.META.get("HTTP_USER_AGENT", None),
+            }
+            queued = self.ri.rpush(API_ACTIVITY_LOG_QUEUE, json.dumps(record))
+            # Logs are dropped rather than filling redis while nothing flushes
+            if queued > settings.API_ACTIVITY_LOG_QUEUE_LIMIT:
+                self.ri.ltrim(
+                    API_ACTIVITY_LOG_QUEUE, 0, settings.API_ACTIVITY_LOG_QUEUE_LIMIT - 1
+                )
+            # Flush early when a full batch is waiting, the periodic task
+            # picks up the rest
+            if queued % settings.API_ACTIVITY_LOG_BATCH_SIZE == 0:
+                flush_api_activity_logs.delay()
+        except Exception as e:
+            capture_exception(e)
 
         return None
@@ -0,0 +1,40 @@
+# Django imports
+from django.conf import settings
+
+# Module imports
+from plane.utils.instrumentation import instrument, record_request, server_timing
+
+
+def view_name(request):
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "unresolved"
+    # Url names are shared between views, the DRF view class is not
+    view_class = getattr(match.func, "cls", None)
+    return view_class.__name__ if view_class is not None else match.view_name
+
+
+class RequestInstrumentationMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with instrument() as metrics:
+            response = self.get_response(request)
+            if metrics is None:
+                return response
+
+            response_bytes = (
+                0 if getattr(response, "streaming", False) else len(response.content)
+            )
+            if settings.INSTRUMENTATION_SERVER_TIMING:
+                response["Server-Timing"] = server_timing(metrics)
+
+        record_request(
+            view_name(request),
+            request.method,
+            response.status_code,
+            metrics,
+            response_bytes,
+        )
+        return response
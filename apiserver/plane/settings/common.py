@@ -29,9 +29,62 @@ ALLOWED_HOSTS = ["*"]
 # To access webhook
 ENABLE_WEBHOOK = os.environ.get("ENABLE_WEBHOOK", "1") == "1"
 
+# Webhook delivery, concurrent requests per task, read timeout in seconds,
+# the batch window in seconds (0 sends every event on its own) and the
+# failures that open an endpoint circuit for the cooldown seconds
+WEBHOOK_MAX_WORKERS = int(os.environ.get("WEBHOOK_MAX_WORKERS", 8))
+WEBHOOK_TIMEOUT = int(os.environ.get("WEBHOOK_TIMEOUT", 10))
+WEBHOOK_BATCH_WINDOW = int(os.environ.get("WEBHOOK_BATCH_WINDOW", 0))
+WEBHOOK_BATCH_SIZE = int(os.environ.get("WEBHOOK_BATCH_SIZE", 50))
+WEBHOOK_CIRCUIT_THRESHOLD = int(os.environ.get("WEBHOOK_CIRCUIT_THRESHOLD", 5))
+WEBHOOK_CIRCUIT_COOLDOWN = int(os.environ.get("WEBHOOK_CIRCUIT_COOLDOWN", 300))
+
 # To access plane api through api tokens
 ENABLE_API = os.environ.get("ENABLE_API", "1") == "1"
 
+# Seconds an api token stays cached after it is validated
+API_TOKEN_CACHE_TTL = int(os.environ.get("API_TOKEN_CACHE_TTL", 60))
+
+# Seconds the workspace and project roles of a user stay cached
+MEMBERSHIP_CACHE_TTL = int(os.environ.get("MEMBERSHIP_CACHE_TTL", 300))
+
+# Seconds the dashboard and profile issue stats of a user stay cached
+DASHBOARD_CACHE_TTL = int(os.environ.get("DASHBOARD_CACHE_TTL", 60))
+
+# Seconds the result ids of saved views with cache_results stay cached
+VIEW_RESULTS_CACHE_TTL = int(os.environ.get("VIEW_RESULTS_CACHE_TTL", 300))
+
+# Api activity logs, bodies are truncated to the limit (0 skips them),
+# requests are sampled at the rate and kept for the retention days, at most
+# the queue limit wait in redis for the next flush
+API_ACTIVITY_LOG_BODY_LIMIT = int(os.environ.get("API_ACTIVITY_LOG_BODY_LIMIT", 4096))
+API_ACTIVITY_LOG_SAMPLE_RATE = float(
+    os.environ.get("API_ACTIVITY_LOG_SAMPLE_RATE", 1.0)
+)
+API_ACTIVITY_LOG_BATCH_SIZE = int(os.environ.get("API_ACTIVITY_LOG_BATCH_SIZE", 500))
+API_ACTIVITY_LOG_QUEUE_LIMIT = int(
+    os.environ.get("API_ACTIVITY_LOG_QUEUE_LIMIT", 100000)
+)
+API_ACTIVITY_LOG_RETENTION_DAYS = int(
+    os.environ.get("API_ACTIVITY_LOG_RETENTION_DAYS", 30)
+)
+
+# Share of requests and celery tasks whose SQL and timings are recorded
+# (0 turns it off). Sampled requests get a Server-Timing header when enabled,
+# it shows the query counts and timings to any client so it is off by default
+INSTRUMENTATION_SAMPLE_RATE = float(
+    os.environ.get("INSTRUMENTATION_SAMPLE_RATE", 0.05)
+)
+INSTRUMENTATION_SERVER_TIMING = (
+    os.environ.get("INSTRUMENTATION_SERVER_TIMING", "0") == "1"
+)
+
+# Token the metrics endpoint expects as a bearer token, it is off when unset
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", None)
+
+# Dispatch plane api calls to the internal views in the same process
+API_INPROCESS_DISPATCH = os.environ.get("API_INPROCESS_DISPATCH", "1") == "1"
+
 # Redirect if / is not present
 APPEND_SLASH = True
 
@@ -61,6 +114,7 @@ INSTALLED_APPS = [
 
 # Middlewares
 MIDDLEWARE = [
+    "plane.middleware.instrumentation_middleware.RequestInstrumentationMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -294,6 +348,9 @@ else:
 CELERY_IMPORTS = (
     "plane.bgtasks.issue_automation_task",
     "plane.bgtasks.exporter_expired_task",
+    "plane.bgtasks.api_token_task",
+    "plane.bgtasks.api_log_task",
+    "plane.bgtasks.analytics_rollup_task",
 )
 
 # Sentry Settings
@@ -317,6 +374,9 @@ if bool(os.environ.get("SENTRY_DSN", False)):
 PROXY_BASE_URL = os.environ.get("PROXY_BASE_URL", False)  # For External
 SLACK_BOT_TOKEN = os.environ.get("SLACK_BOT_TOKEN", False)
 FILE_SIZE_LIMIT = int(os.environ.get("FILE_SIZE_LIMIT", 5242880))
+# Exports are spooled to disk past this size and uploaded in chunks of this size
+EXPORT_SPOOL_MAX_SIZE = int(os.environ.get("EXPORT_SPOOL_MAX_SIZE", 33554432))
+EXPORT_MULTIPART_CHUNK_SIZE = int(os.environ.get("EXPORT_MULTIPART_CHUNK_SIZE", 8388608))
 ENABLE_SIGNUP = os.environ.get("ENABLE_SIGNUP", "1") == "1"
 
 # Unsplash Access key
@@ -327,6 +387,8 @@ GITHUB_ACCESS_TOKEN = os.environ.get("GITHUB_ACCESS_TOKEN", False)
 # Analytics
 ANALYTICS_SECRET_KEY = os.environ.get("ANALYTICS_SECRET_KEY", False)
 ANALYTICS_BASE_API = os.environ.get("ANALYTICS_BASE_API", False)
+# Seconds issue activities are gathered before a project's rollups refresh
+ANALYTICS_ROLLUP_DEBOUNCE = int(os.environ.get("ANALYTICS_ROLLUP_DEBOUNCE", 30))
 
 # Open AI Settings
 OPENAI_API_BASE = os.environ.get("OPENAI_API_BASE", "https://api.openai.com/v1")
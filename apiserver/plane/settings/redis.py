@@ -1,10 +1,12 @@
-import os
 import redis
 from django.conf import settings
+from django_redis import get_redis_connection
 from urllib.parse import urlparse
 
+_client = None
 
-def redis_instance():
+
+def build_client():
     # connect to redis
     if settings.REDIS_SSL:
         url = urlparse(settings.REDIS_URL)
@@ -19,3 +21,43 @@ def redis_instance():
         ri = redis.Redis.from_url(settings.REDIS_URL, db=0)
 
     return ri
+
+
+def redis_instance():
+    """process wide redis client
+
+    It is bound to the connection pool django-redis keeps for the default
+    cache, so requests, tasks and the cache share the same connections.
+    """
+    global _client
+    if _client is None:
+        try:
+            _client = get_redis_connection("default")
+        except NotImplementedError:
+            # The default cache is not redis, like the locmem one of local
+            _client = build_client()
+    return _client
+
+
+def connection_pool_stats():
+    """connections of this process' pool, by state
+
+    The counts are read from the pool internals, which differ between pool
+    classes, so the states a pool does not keep are left out.
+    """
+    pool = redis_instance().connection_pool
+    stats = {"max": getattr(pool, "max_connections", None)}
+    try:
+        if isinstance(pool, redis.BlockingConnectionPool):
+            # Every created connection is listed, the idle ones wait in the queue
+            available = sum(1 for c in list(pool.pool.queue) if c is not None)
+            stats["created"] = len(pool._connections)
+            stats["in_use"] = stats["created"] - available
+            stats["available"] = available
+        else:
+            stats["created"] = pool._created_connections
+            stats["in_use"] = len(pool._in_use_connections)
+            stats["available"] = len(pool._available_connections)
+    except (AttributeError, TypeError):
+        pass
+    return {state: count for state, count in stats.items() if count is not None}
@@ -0,0 +1,182 @@
+# Third party import
+from rest_framework import status
+
+# Module imports
+from .base import AuthenticatedAPITest
+from plane.db.models import (
+    Cycle,
+    CycleIssue,
+    Inbox,
+    InboxIssue,
+    Issue,
+    IssueAssignee,
+    IssueAttachment,
+    IssueLabel,
+    IssueLink,
+    IssueMention,
+    IssueReaction,
+    IssueSubscriber,
+    Label,
+    Module,
+    ModuleIssue,
+    Project,
+    ProjectDeployBoard,
+    ProjectFavorite,
+    ProjectMember,
+    State,
+    Workspace,
+    WorkspaceMember,
+)
+
+
+class ETagInvalidationTest(AuthenticatedAPITest):
+    """A write to anything a list is built from must change its ETag"""
+
+    def setUp(self):
+        super().setUp()
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        WorkspaceMember.objects.create(
+            workspace=self.workspace, member=self.user, role=20
+        )
+        self.project = Project.objects.create(
+            workspace=self.workspace, name="ETag", identifier="ETAG"
+        )
+        self.project_member = ProjectMember.objects.create(
+            project=self.project, member=self.user, role=20
+        )
+        self.state = State.objects.create(
+            project=self.project, name="Todo", group="unstarted", color="#858E96"
+        )
+        self.label = Label.objects.create(project=self.project, name="bug")
+        self.issue = Issue.objects.create(project=self.project, name="Issue")
+        self.cycle = Cycle.objects.create(
+            project=self.project, name="Cycle", owned_by=self.user
+        )
+        self.module = Module.objects.create(project=self.project, name="Module")
+
+        project_url = f"/api/workspaces/plane/projects/{self.project.id}"
+        self.issues_url = f"{project_url}/issues/"
+        self.states_url = f"{project_url}/states/"
+        self.labels_url = f"{project_url}/issue-labels/"
+        self.members_url = f"{project_url}/members/"
+        self.projects_url = "/api/workspaces/plane/projects/"
+
+    def assertETagChanges(self, url, write):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response["ETag"]
+        self.assertEqual(
+            self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code,
+            status.HTTP_304_NOT_MODIFIED,
+        )
+
+        # The counters are bumped once the write commits
+        with self.captureOnCommitCallbacks(execute=True):
+            write()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_issue_list(self):
+        writes = {
+            "issue": lambda: Issue.objects.create(
+                project=self.project, name="New issue"
+            ),
+            "issue update": lambda: self.issue.save(),
+            "assignee": lambda: IssueAssignee.objects.create(
+                project=self.project, issue=self.issue, assignee=self.user
+            ),
+            "issue label": lambda: IssueLabel.objects.create(
+                project=self.project, issue=self.issue, label=self.label
+            ),
+            "cycle issue": lambda: CycleIssue.objects.create(
+                project=self.project, issue=self.issue, cycle=self.cycle
+            ),
+            "module issue": lambda: ModuleIssue.objects.create(
+                project=self.project, issue=self.issue, module=self.module
+            ),
+            "link": lambda: IssueLink.objects.create(
+                project=self.project, issue=self.issue, url="https://plane.so"
+            ),
+            "attachment": lambda: IssueAttachment.objects.create(
+                project=self.project, issue=self.issue, asset="attachment.png"
+            ),
+            "reaction": lambda: IssueReaction.objects.create(
+                project=self.project, issue=self.issue, actor=self.user, reaction="+1"
+            ),
+            "subscriber": lambda: IssueSubscriber.objects.create(
+                project=self.project, issue=self.issue, subscriber=self.user
+            ),
+            "mention": lambda: IssueMention.objects.create(
+                project=self.project, issue=self.issue, mention=self.user
+            ),
+            "state": lambda: State.objects.create(
+                project=self.project, name="Done", group="completed", color="#000"
+            ),
+            "label": lambda: Label.objects.create(project=self.project, name="ui"),
+            "inbox status": lambda: self.decline_issue(),
+            "project member": lambda: self.project_member.save(),
+            "project": lambda: self.project.save(),
+            "workspace": lambda: self.workspace.save(),
+            "user": lambda: self.rename_user(),
+        }
+        for name, write in writes.items():
+            with self.subTest(name):
+                self.assertETagChanges(self.issues_url, write)
+
+    def test_state_list(self):
+        self.assertETagChanges(
+            self.states_url,
+            lambda: State.objects.create(
+                project=self.project, name="Done", group="completed", color="#000"
+            ),
+        )
+
+    def test_label_list(self):
+        self.assertETagChanges(
+            self.labels_url,
+            lambda: Label.objects.create(project=self.project, name="ui"),
+        )
+
+    def test_member_list(self):
+        for name, write in {
+            "project member": lambda: self.project_member.save(),
+            "user": lambda: self.rename_user(),
+        }.items():
+            with self.subTest(name):
+                self.assertETagChanges(self.members_url, write)
+
+    def test_project_list(self):
+        for name, write in {
+            "project": lambda: self.project.save(),
+            "favorite": lambda: ProjectFavorite.objects.create(
+                project=self.project, user=self.user
+            ),
+            "deploy board": lambda: ProjectDeployBoard.objects.create(
+                project=self.project
+            ),
+            "cycle": lambda: Cycle.objects.create(
+                project=self.project, name="Next cycle", owned_by=self.user
+            ),
+            "module": lambda: Module.objects.create(
+                project=self.project, name="Next module"
+            ),
+        }.items():
+            with self.subTest(name):
+                self.assertETagChanges(self.projects_url, write)
+
+    def decline_issue(self):
+        inbox = Inbox.objects.create(project=self.project, name="Inbox")
+        inbox_issue = InboxIssue.objects.create(
+            project=self.project, inbox=inbox, issue=self.issue, status=-2
+        )
+        inbox_issue.status = -1
+        inbox_issue.save()
+
+    def rename_user(self):
+        self.user.refresh_from_db()
+        self.user.display_name = f"{self.user.display_name}-renamed"
+        self.user.save()
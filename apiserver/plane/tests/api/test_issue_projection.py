@@ -0,0 +1,101 @@
+# Django imports
+from django.db.models import F
+
+# Module imports
+from .base import AuthenticatedAPITest
+from plane.api.serializers import IssueLiteSerializer, project_queryset
+from plane.db.models import (
+    Issue,
+    IssueAssignee,
+    IssueLabel,
+    IssueReaction,
+    Label,
+    Project,
+    State,
+    Workspace,
+)
+from plane.utils.issue_counts import child_count_annotations
+
+
+class IssueProjectionTest(AuthenticatedAPITest):
+    """project_queryset must give the same output as the serializer"""
+
+    def setUp(self):
+        super().setUp()
+        workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        self.project = Project.objects.create(
+            workspace=workspace, name="Projection", identifier="PROJ"
+        )
+
+        # Created before the project has a state, so it is left without one,
+        # and without labels, assignees or reactions
+        parent = Issue.objects.create(project=self.project, name="Bare issue")
+
+        state = State.objects.create(
+            project=self.project, name="Todo", group="unstarted", color="#858E96"
+        )
+        labels = [
+            Label.objects.create(project=self.project, name=name)
+            for name in ["bug", "ui"]
+        ]
+        issue = Issue.objects.create(
+            project=self.project,
+            name="Full issue",
+            description_html="<p>Full issue</p>",
+            state=state,
+            priority="high",
+            parent=parent,
+            estimate_point=3,
+        )
+        IssueAssignee.objects.create(
+            project=self.project, issue=issue, assignee=self.user
+        )
+        for label in labels:
+            IssueLabel.objects.create(project=self.project, issue=issue, label=label)
+        for reaction in ["+1", "eyes"]:
+            IssueReaction.objects.create(
+                project=self.project, issue=issue, actor=self.user, reaction=reaction
+            )
+
+    def get_queryset(self):
+        # Shaped like the issue list of IssueViewSet
+        return (
+            Issue.issue_objects.filter(project=self.project)
+            .annotate(**child_count_annotations("sub_issues_count"))
+            .select_related("project")
+            .select_related("workspace")
+            .select_related("state")
+            .select_related("parent")
+            .prefetch_related("assignees")
+            .prefetch_related("labels")
+            .prefetch_related("issue_reactions")
+            .annotate(cycle_id=F("issue_cycle__cycle_id"))
+            .annotate(module_id=F("issue_module__module_id"))
+            .annotate(**child_count_annotations("link_count", "attachment_count"))
+            .order_by("created_at")
+            .distinct()
+        )
+
+    def assertProjected(self, **kwargs):
+        expected = IssueLiteSerializer(self.get_queryset(), many=True, **kwargs).data
+        projected = project_queryset(IssueLiteSerializer(**kwargs), self.get_queryset())
+        self.assertEqual(len(expected), 2)
+        self.assertEqual(projected, [dict(issue) for issue in expected])
+
+    def test_project_all_fields(self):
+        self.assertProjected()
+
+    def test_project_selected_fields(self):
+        self.assertProjected(
+            fields=[
+                "id",
+                "name",
+                "state_detail",
+                "label_details",
+                "assignee_details",
+                "issue_reactions",
+                "sub_issues_count",
+            ]
+        )
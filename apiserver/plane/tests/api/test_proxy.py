@@ -0,0 +1,50 @@
+# Python imports
+import gzip
+import json
+
+# Third party import
+from rest_framework import status
+
+# Module imports
+from .base import AuthenticatedAPITest
+from plane.db.models import (
+    APIToken,
+    Issue,
+    Project,
+    ProjectMember,
+    Workspace,
+    WorkspaceMember,
+)
+
+
+class ProxyDispatchTest(AuthenticatedAPITest):
+    def setUp(self):
+        super().setUp()
+        workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        WorkspaceMember.objects.create(workspace=workspace, member=self.user, role=20)
+        self.project = Project.objects.create(
+            workspace=workspace, name="Proxy", identifier="PROXY"
+        )
+        ProjectMember.objects.create(project=self.project, member=self.user, role=20)
+        self.issue = Issue.objects.create(project=self.project, name="Issue")
+
+        api_token = APIToken.objects.create(user=self.user, workspace=workspace)
+        self.client.credentials(HTTP_X_API_KEY=api_token.token)
+
+    def test_stream_issues_with_gzip_accepted(self):
+        response = self.client.get(
+            f"/api/v1/workspaces/plane/projects/{self.project.id}/issues/",
+            {"stream": "true"},
+            HTTP_ACCEPT_ENCODING="gzip, deflate",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # The proxy response itself may be compressed by GZipMiddleware
+        content = response.content
+        if response.get("Content-Encoding") == "gzip":
+            content = gzip.decompress(content)
+        self.assertEqual(
+            [issue["id"] for issue in json.loads(content)], [str(self.issue.id)]
+        )
@@ -1 +1,39 @@
-# TODO: Wrote test for state endpoints
\ No newline at end of file
+# TODO: Wrote test for state endpoints
+
+# Module imports
+from .base import AuthenticatedAPITest
+from plane.db.models import (
+    Cycle,
+    CycleIssue,
+    CycleProgress,
+    Issue,
+    Project,
+    State,
+    Workspace,
+)
+
+
+class StateGroupChangeTest(AuthenticatedAPITest):
+    def test_cycle_progress_follows_group(self):
+        workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        project = Project.objects.create(
+            workspace=workspace, name="State", identifier="STATE"
+        )
+        state = State.objects.create(
+            project=project, name="Review", group="started", color="#000"
+        )
+        cycle = Cycle.objects.create(project=project, name="Cycle", owned_by=self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            issue = Issue.objects.create(project=project, name="Issue", state=state)
+            CycleIssue.objects.create(project=project, issue=issue, cycle=cycle)
+        self.assertEqual(CycleProgress.objects.get(cycle=cycle).started_issues, 1)
+
+        state.group = "completed"
+        with self.captureOnCommitCallbacks(execute=True):
+            state.save()
+
+        progress = CycleProgress.objects.get(cycle=cycle)
+        self.assertEqual(progress.started_issues, 0)
+        self.assertEqual(progress.completed_issues, 1)
@@ -7,6 +7,7 @@ from rest_framework import status
 # Module imports
 from .base import AuthenticatedAPITest
 from plane.db.models import Workspace, WorkspaceMember
+from plane.utils.membership import load_membership
 
 
 class WorkSpaceCreateReadUpdateDelete(AuthenticatedAPITest):
@@ -41,3 +42,20 @@ class WorkSpaceCreateReadUpdateDelete(AuthenticatedAPITest):
             url, {"name": "Plane", "slug": "pla-ne"}, format="json"
         )
         self.assertEqual(response.status_code, status.HTTP_410_GONE)
+
+
+class WorkspaceSlugChangeTest(AuthenticatedAPITest):
+    def test_cached_roles_follow_slug(self):
+        workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        WorkspaceMember.objects.create(workspace=workspace, member=self.user, role=20)
+        self.assertEqual(load_membership(self.user_id).workspace_role("plane"), 20)
+
+        workspace.slug = "plane-renamed"
+        with self.captureOnCommitCallbacks(execute=True):
+            workspace.save()
+
+        membership = load_membership(self.user_id)
+        self.assertIsNone(membership.workspace_role("plane"))
+        self.assertEqual(membership.workspace_role("plane-renamed"), 20)
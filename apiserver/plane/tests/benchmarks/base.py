@@ -0,0 +1,146 @@
+# Python imports
+import json
+import os
+import statistics
+import time
+import tracemalloc
+
+# Django imports
+from django.db import connection
+from django.test import tag
+from django.test.utils import CaptureQueriesContext
+
+# Third party imports
+from rest_framework.test import APITestCase, APIClient
+
+# Module imports
+from plane.db.models import User
+from plane.api.views.authentication import get_tokens_for_user
+from .generator import build_large_workspace
+
+# Timed runs per endpoint, the median is compared against the baseline
+ROUNDS = int(os.environ.get("BENCHMARK_ROUNDS", 5))
+
+# Latencies depend on the machine, they are only reported unless this is set
+ASSERT_LATENCY = os.environ.get("BENCHMARK_ASSERT_LATENCY", "0") == "1"
+
+# Slack given to the latency baselines, slower CI machines raise it
+LATENCY_FACTOR = float(os.environ.get("BENCHMARK_LATENCY_FACTOR", 1))
+
+# Multiplies the generated workspace size
+SCALE = int(os.environ.get("BENCHMARK_SCALE", 1))
+
+# File the measurements are written to as JSON, when set
+REPORT_PATH = os.environ.get("BENCHMARK_REPORT")
+
+
+class Measurement:
+    def __init__(self, name, status_code, queries, latencies, peak_memory):
+        self.name = name
+        self.status_code = status_code
+        self.queries = queries
+        self.latencies = latencies
+        self.peak_memory = peak_memory
+
+    @property
+    def latency(self):
+        return statistics.median(self.latencies)
+
+    def as_dict(self):
+        return {
+            "name": self.name,
+            "status_code": self.status_code,
+            "queries": self.queries,
+            "latency_ms": round(self.latency * 1000, 2),
+            "peak_memory_kb": round(self.peak_memory / 1024, 2),
+        }
+
+
+@tag("benchmark")
+class BenchmarkAPITest(APITestCase):
+    """Hot endpoints measured against a large generated workspace
+
+    Run them alone with `python manage.py test --tag benchmark`, or leave
+    them out of the functional run with `--exclude-tag benchmark`. Query
+    budgets always fail the run, latencies only with BENCHMARK_ASSERT_LATENCY=1
+    and are otherwise read from the BENCHMARK_REPORT file.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.measurements = []
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(
+            email="benchmark@plane.so", username="benchmark"
+        )
+        cls.data = build_large_workspace(
+            cls.user,
+            members=50 * SCALE,
+            labels=40,
+            cycles=12 * SCALE,
+            issues=2500 * SCALE,
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        if REPORT_PATH and cls.measurements:
+            with open(REPORT_PATH, "w") as report:
+                json.dump(
+                    [measurement.as_dict() for measurement in cls.measurements],
+                    report,
+                    indent=2,
+                )
+        super().tearDownClass()
+
+    def setUp(self):
+        self.client = APIClient(HTTP_USER_AGENT="plane/test", REMOTE_ADDR="10.10.10.10")
+        access_token, _ = get_tokens_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + access_token)
+
+    def measure(self, name, url, params=None):
+        # The first call warms the caches so every timed round sees the same state
+        self.client.get(url, params)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+
+        latencies = []
+        for _ in range(ROUNDS):
+            started_at = time.perf_counter()
+            self.client.get(url, params)
+            latencies.append(time.perf_counter() - started_at)
+
+        # Tracing slows every allocation down, so memory gets a run of its own
+        tracemalloc.start()
+        try:
+            self.client.get(url, params)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        measurement = Measurement(
+            name, response.status_code, len(queries), latencies, peak_memory
+        )
+        self.measurements.append(measurement)
+        return measurement
+
+    def assertWithinBudget(self, measurement, budget):
+        self.assertEqual(measurement.status_code, 200)
+        self.assertLessEqual(
+            measurement.queries,
+            budget["queries"],
+            f"{measurement.name} ran {measurement.queries} queries, "
+            f"the budget is {budget['queries']}",
+        )
+        if not ASSERT_LATENCY:
+            return
+        baseline = budget["latency_ms"] * LATENCY_FACTOR
+        self.assertLessEqual(
+            measurement.latency * 1000,
+            baseline,
+            f"{measurement.name} took {measurement.latency * 1000:.0f}ms, "
+            f"the baseline is {baseline:.0f}ms",
+        )
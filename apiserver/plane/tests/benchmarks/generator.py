@@ -0,0 +1,356 @@
+# Python imports
+import random
+from datetime import timedelta
+
+# Django imports
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import (
+    Cycle,
+    CycleIssue,
+    Issue,
+    IssueActivity,
+    IssueAssignee,
+    IssueCounter,
+    IssueLabel,
+    IssueSequence,
+    IssueSubscriber,
+    Label,
+    Notification,
+    Project,
+    ProjectMember,
+    State,
+    User,
+    Workspace,
+    WorkspaceMember,
+)
+from plane.db.models.issue import SORT_ORDER_STEP
+from plane.utils.issue_counts import refresh_issue_counts
+from plane.utils.progress import refresh_cycle_progress
+
+STATES = [
+    ("Backlog", "backlog"),
+    ("Todo", "unstarted"),
+    ("In Progress", "started"),
+    ("Done", "completed"),
+    ("Cancelled", "cancelled"),
+]
+
+PRIORITIES = ["urgent", "high", "medium", "low", "none"]
+
+BATCH_SIZE = 1000
+
+
+class LargeWorkspace:
+    """Rows built by build_large_workspace, kept for the benchmarks to use"""
+
+    def __init__(self, workspace, projects, members, cycles, issues):
+        self.workspace = workspace
+        self.projects = projects
+        self.members = members
+        self.cycles = cycles
+        self.issues = issues
+
+    @property
+    def slug(self):
+        return self.workspace.slug
+
+    @property
+    def project(self):
+        return self.projects[0]
+
+
+def build_members(workspace, owner, count):
+    members = [owner] + User.objects.bulk_create(
+        [
+            User(
+                email=f"member-{index}@{workspace.slug}.plane.so",
+                username=f"{workspace.slug}-member-{index}",
+                display_name=f"member-{index}",
+            )
+            for index in range(count)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    WorkspaceMember.objects.bulk_create(
+        [
+            WorkspaceMember(
+                workspace=workspace, member=member, role=20 if member == owner else 15
+            )
+            for member in members
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    return members
+
+
+def build_project(workspace, owner, members, index):
+    project = Project.objects.create(
+        workspace=workspace,
+        name=f"Project {index}",
+        identifier=f"BENCH{index}",
+        project_lead=owner,
+    )
+    ProjectMember.objects.bulk_create(
+        [
+            ProjectMember(
+                workspace=workspace,
+                project=project,
+                member=member,
+                role=20 if member == owner else 15,
+                sort_order=65535 - index * SORT_ORDER_STEP,
+            )
+            for member in members
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    states = State.objects.bulk_create(
+        [
+            State(
+                workspace=workspace,
+                project=project,
+                name=name,
+                group=group,
+                color="#858E96",
+                sequence=(position + 1) * 15000,
+                default=group == "backlog",
+            )
+            for position, (name, group) in enumerate(STATES)
+        ]
+    )
+    return project, states
+
+
+def build_issues(project, owner, members, states, labels, cycles, count, rng):
+    """bulk insert count issues with their assignees, labels, cycles and activity
+
+    Issue.save and the signals are skipped on purpose, the counters they keep
+    are seeded afterwards the same way the migrations backfill them.
+    """
+    now = timezone.now()
+    issues = Issue.objects.bulk_create(
+        [
+            Issue(
+                workspace_id=project.workspace_id,
+                project=project,
+                name=f"Issue {sequence} of {project.name}",
+                description_html=f"<p>Benchmark issue {sequence}</p>",
+                description_stripped=f"Benchmark issue {sequence}",
+                state=rng.choice(states),
+                priority=rng.choice(PRIORITIES),
+                estimate_point=rng.choice([None, 0, 1, 2, 3, 5]),
+                start_date=(now - timedelta(days=rng.randint(0, 60))).date(),
+                target_date=(now + timedelta(days=rng.randint(-30, 60))).date(),
+                sequence_id=sequence,
+                sort_order=65535 + sequence * SORT_ORDER_STEP,
+                created_by=rng.choice(members),
+            )
+            for sequence in range(1, count + 1)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+
+    # A tenth of the issues are sub-issues of the issue before them
+    for previous, issue in zip(issues[::10], issues[1::10]):
+        issue.parent = previous
+    Issue.objects.bulk_update(issues[1::10], ["parent"], batch_size=BATCH_SIZE)
+
+    IssueSequence.objects.bulk_create(
+        [
+            IssueSequence(
+                workspace_id=project.workspace_id,
+                project=project,
+                issue=issue,
+                sequence=issue.sequence_id,
+            )
+            for issue in issues
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    IssueCounter.objects.seed(project.id)
+
+    IssueAssignee.objects.bulk_create(
+        [
+            IssueAssignee(
+                workspace_id=project.workspace_id,
+                project=project,
+                issue=issue,
+                assignee=assignee,
+            )
+            for issue in issues
+            for assignee in rng.sample(members, min(len(members), rng.randint(0, 3)))
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    IssueLabel.objects.bulk_create(
+        [
+            IssueLabel(
+                workspace_id=project.workspace_id,
+                project=project,
+                issue=issue,
+                label=label,
+            )
+            for issue in issues
+            for label in rng.sample(labels, min(len(labels), rng.randint(0, 4)))
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    IssueSubscriber.objects.bulk_create(
+        [
+            IssueSubscriber(
+                workspace_id=project.workspace_id,
+                project=project,
+                issue=issue,
+                subscriber=owner,
+            )
+            for issue in issues[::3]
+        ],
+        batch_size=BATCH_SIZE,
+    )
+
+    # Every cycle gets a share of the issues, the rest stay out of cycles
+    if cycles:
+        CycleIssue.objects.bulk_create(
+            [
+                CycleIssue(
+                    workspace_id=project.workspace_id,
+                    project=project,
+                    issue=issue,
+                    cycle=cycles[index % len(cycles)],
+                )
+                for index, issue in enumerate(issues[::2])
+            ],
+            batch_size=BATCH_SIZE,
+        )
+
+    IssueActivity.objects.bulk_create(
+        [
+            IssueActivity(
+                workspace_id=project.workspace_id,
+                project=project,
+                issue=issue,
+                verb=verb,
+                field=field,
+                new_value=value,
+                actor=rng.choice(members),
+                epoch=now.timestamp(),
+            )
+            for issue in issues
+            for verb, field, value in [
+                ("created", None, None),
+                ("updated", "priority", issue.priority),
+                ("updated", "state", issue.state.name),
+            ]
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    refresh_issue_counts([issue.id for issue in issues])
+    return issues
+
+
+def build_notifications(project, receiver, members, issues):
+    Notification.objects.bulk_create(
+        [
+            Notification(
+                workspace_id=project.workspace_id,
+                project=project,
+                receiver=receiver,
+                triggered_by=members[index % len(members)],
+                entity_identifier=issue.id,
+                entity_name="issue",
+                title=f"updated {issue.name}",
+                data={
+                    "issue": {
+                        "id": str(issue.id),
+                        "name": issue.name,
+                        "identifier": project.identifier,
+                        "sequence_id": issue.sequence_id,
+                    },
+                },
+                sender="in_app:issue_activities:updated",
+            )
+            for index, issue in enumerate(issues)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+
+
+def build_large_workspace(
+    owner,
+    slug="benchmark",
+    projects=2,
+    members=50,
+    labels=40,
+    cycles=12,
+    issues=2500,
+    seed=0,
+):
+    """a workspace sized like a busy production one, built with bulk inserts
+
+    Args:
+        owner (User): admin of the workspace and receiver of the notifications
+        projects (int): projects to create
+        members (int): members besides the owner, added to every project
+        labels (int): labels per project
+        cycles (int): cycles per project, spread around today
+        issues (int): issues per project
+        seed (int): seed of the random assignment, runs are repeatable
+    """
+    rng = random.Random(seed)
+    today = timezone.now().date()
+
+    workspace = Workspace.objects.create(name=slug, slug=slug, owner=owner)
+    workspace_members = build_members(workspace, owner, members)
+
+    built_projects = []
+    built_cycles = []
+    built_issues = []
+    for index in range(projects):
+        project, states = build_project(workspace, owner, workspace_members, index)
+        project_labels = Label.objects.bulk_create(
+            [
+                Label(
+                    workspace=workspace,
+                    project=project,
+                    name=f"label-{position}",
+                    color="#F2C94C",
+                    sort_order=65535 + position * SORT_ORDER_STEP,
+                )
+                for position in range(labels)
+            ]
+        )
+        project_cycles = Cycle.objects.bulk_create(
+            [
+                Cycle(
+                    workspace=workspace,
+                    project=project,
+                    name=f"Cycle {position}",
+                    owned_by=owner,
+                    start_date=today + timedelta(days=(position - cycles // 2) * 14),
+                    end_date=today
+                    + timedelta(days=(position - cycles // 2) * 14 + 13),
+                )
+                for position in range(cycles)
+            ]
+        )
+        project_issues = build_issues(
+            project,
+            owner,
+            workspace_members,
+            states,
+            project_labels,
+            project_cycles,
+            issues,
+            rng,
+        )
+        build_notifications(project, owner, workspace_members, project_issues)
+
+        built_projects.append(project)
+        built_cycles += project_cycles
+        built_issues += project_issues
+
+    refresh_cycle_progress([cycle.id for cycle in built_cycles])
+    return LargeWorkspace(
+        workspace, built_projects, workspace_members, built_cycles, built_issues
+    )
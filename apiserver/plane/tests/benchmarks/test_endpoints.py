@@ -0,0 +1,82 @@
+# Django imports
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+# Module imports
+from .base import BenchmarkAPITest
+
+# Query counts must not grow with the workspace, a budget overrun is an N+1
+# Latencies are medians on the default workspace size, in milliseconds
+BUDGETS = {
+    "issue-list": {"queries": 20, "latency_ms": 4000},
+    "cycle-list": {"queries": 15, "latency_ms": 1000},
+    "project-list": {"queries": 15, "latency_ms": 500},
+    "notification-list": {"queries": 10, "latency_ms": 2000},
+    # Authentication only, the ETag check itself is a single cache read
+    "not-modified": {"queries": 3},
+}
+
+
+class HotEndpointBenchmark(BenchmarkAPITest):
+    def test_issue_list(self):
+        measurement = self.measure(
+            "issue-list",
+            f"/api/workspaces/{self.data.slug}/projects/{self.data.project.id}/issues/",
+        )
+        self.assertWithinBudget(measurement, BUDGETS["issue-list"])
+
+    def test_issue_list_grouped(self):
+        measurement = self.measure(
+            "issue-list-grouped",
+            f"/api/workspaces/{self.data.slug}/projects/{self.data.project.id}/issues/",
+            {"group_by": "state", "order_by": "-priority"},
+        )
+        self.assertWithinBudget(measurement, BUDGETS["issue-list"])
+
+    def test_cycle_list(self):
+        measurement = self.measure(
+            "cycle-list",
+            f"/api/workspaces/{self.data.slug}/projects/{self.data.project.id}/cycles/",
+        )
+        self.assertWithinBudget(measurement, BUDGETS["cycle-list"])
+
+    def test_project_list(self):
+        measurement = self.measure(
+            "project-list", f"/api/workspaces/{self.data.slug}/projects/"
+        )
+        self.assertWithinBudget(measurement, BUDGETS["project-list"])
+
+    def test_project_list_member_ids(self):
+        measurement = self.measure(
+            "project-list-member-ids",
+            f"/api/workspaces/{self.data.slug}/projects/",
+            {"members": "ids"},
+        )
+        self.assertWithinBudget(measurement, BUDGETS["project-list"])
+
+    def test_notification_list(self):
+        measurement = self.measure(
+            "notification-list",
+            f"/api/workspaces/{self.data.slug}/users/notifications/",
+        )
+        self.assertWithinBudget(measurement, BUDGETS["notification-list"])
+
+    def test_conditional_get(self):
+        project_url = (
+            f"/api/workspaces/{self.data.slug}/projects/{self.data.project.id}"
+        )
+        for url in [
+            f"{project_url}/issues/",
+            f"{project_url}/states/",
+            f"{project_url}/issue-labels/",
+            f"{project_url}/members/",
+            f"/api/workspaces/{self.data.slug}/projects/",
+        ]:
+            etag = self.client.get(url)["ETag"]
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+            self.assertEqual(response.status_code, 304, url)
+            self.assertLessEqual(
+                len(queries), BUDGETS["not-modified"]["queries"], url
+            )
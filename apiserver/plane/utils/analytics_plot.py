@@ -9,7 +9,7 @@ from django.db.models import Count, F, Sum, Value, Case, When, CharField
 from django.db.models.functions import Coalesce, ExtractMonth, ExtractYear, Concat
 
 # Module imports
-from plane.db.models import Issue
+from plane.db.models import Issue, State, Label, User, Cycle, Module
 
 
 def annotate_with_monthly_dimension(queryset, field_name, attribute):
@@ -77,6 +77,70 @@ def build_graph_plot(queryset, x_axis, y_axis, segment=None):
 
     return sort_data(grouped_data, temp_axis)
 
+# Detail rows of the id axes: response key, model and alias to field names
+GRAPH_DETAILS = {
+    "state_id": (
+        "state_details",
+        State,
+        {"state_id": "id", "state__name": "name", "state__color": "color"},
+    ),
+    "labels__id": (
+        "label_details",
+        Label,
+        {"labels__id": "id", "labels__color": "color", "labels__name": "name"},
+    ),
+    "assignees__id": (
+        "assignee_details",
+        User,
+        {
+            "assignees__avatar": "avatar",
+            "assignees__display_name": "display_name",
+            "assignees__first_name": "first_name",
+            "assignees__last_name": "last_name",
+            "assignees__id": "id",
+        },
+    ),
+    "issue_cycle__cycle_id": (
+        "cycle_details",
+        Cycle,
+        {"issue_cycle__cycle_id": "id", "issue_cycle__cycle__name": "name"},
+    ),
+    "issue_module__module_id": (
+        "module_details",
+        Module,
+        {"issue_module__module_id": "id", "issue_module__module__name": "name"},
+    ),
+}
+
+
+def build_graph_details(distribution, x_axis, segment=None):
+    """names and colors of the ids plotted on the x axis and segment
+
+    Looks the ids of the distribution up directly instead of grouping the
+    issues again for every axis
+    """
+    axis_ids = {x_axis: set(), segment: set()}
+    for items in distribution.values():
+        for item in items:
+            axis_ids[x_axis].add(item["dimension"])
+            if segment:
+                axis_ids[segment].add(item.get("segment"))
+
+    details = {key: {} for key, _, _ in GRAPH_DETAILS.values()}
+    for axis, ids in axis_ids.items():
+        if axis not in GRAPH_DETAILS:
+            continue
+        key, model, fields = GRAPH_DETAILS[axis]
+        rows = model.objects.filter(pk__in=[pk for pk in ids if pk is not None])
+        if axis == "assignees__id":
+            rows = rows.filter(avatar__isnull=False)
+        details[key] = [
+            {alias: row[field] for alias, field in fields.items()}
+            for row in rows.order_by("id").values(*fields.values())
+        ]
+    return details
+
+
 def burndown_plot(queryset, slug, project_id, cycle_id=None, module_id=None):
     # Total Issues in Cycle or Module
     total_issues = queryset.total_issues
@@ -0,0 +1,258 @@
+# Python imports
+import datetime
+
+# Django imports
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+# Module imports
+from plane.db.models import AnalyticsRollup, Issue, Project
+from plane.settings.redis import redis_instance
+from plane.utils.analytics_plot import annotate_with_monthly_dimension, sort_data
+
+# Analytics axes kept in the rollups, one row set per dimension
+ROLLUP_DIMENSIONS = [
+    "state_id",
+    "state__group",
+    "labels__id",
+    "assignees__id",
+    "estimate_point",
+    "issue_cycle__cycle_id",
+    "issue_module__module_id",
+    "priority",
+]
+
+# Every issue has exactly one priority row, so it doubles as the issue total
+TOTAL_DIMENSION = "priority"
+
+ROLLUP_AXES = ROLLUP_DIMENSIONS + ["created_at"]
+
+# Issue filters the rollups can still answer
+ROLLUP_FILTERS = {"project__in"}
+
+# Activities that can move an issue between rollup rows
+ROLLUP_ACTIVITY_TYPES = {
+    "issue.activity.created",
+    "issue.activity.updated",
+    "issue.activity.deleted",
+    "issue_draft.activity.updated",
+    "cycle.activity.created",
+    "cycle.activity.deleted",
+    "module.activity.created",
+    "module.activity.deleted",
+}
+
+
+def refresh_analytics_rollups(project_id, dates=None):
+    """recompute the rollups of a project, only for the given days when set
+
+    Args:
+        project_id (uuid): project to refresh
+        dates (iterable): issue creation days to refresh, None for all of them
+    """
+    issues = Issue.issue_objects.filter(project_id=project_id)
+    rollups = AnalyticsRollup.objects.filter(project_id=project_id)
+    if dates is not None:
+        dates = {date for date in dates if date is not None}
+        if not dates:
+            return
+        issues = issues.filter(created_at__date__in=dates)
+        rollups = rollups.filter(date__in=dates)
+
+    with transaction.atomic():
+        # One refresh per project at a time, counted inside the lock so an
+        # older snapshot never replaces a newer one. No key update leaves the
+        # issue inserts referencing the project unblocked.
+        list(
+            Project.objects.select_for_update(no_key=True)
+            .filter(pk=project_id)
+            .values_list("id", flat=True)
+        )
+        rollups.delete()
+        AnalyticsRollup.objects.bulk_create(
+            count_rollups(project_id, issues), batch_size=1000
+        )
+
+
+def count_rollups(project_id, issues):
+    bulk_rollups = []
+    for dimension in ROLLUP_DIMENSIONS:
+        rows = (
+            issues.annotate(date=TruncDate("created_at"))
+            .values("workspace_id", "date", value=F(dimension))
+            .annotate(issue_count=Count("id"), estimate_sum=Sum("estimate_point"))
+            .order_by()
+        )
+        bulk_rollups += [
+            AnalyticsRollup(
+                workspace_id=row["workspace_id"],
+                project_id=project_id,
+                date=row["date"],
+                dimension=dimension,
+                value=str(row["value"]) if row["value"] is not None else None,
+                issue_count=row["issue_count"],
+                estimate_sum=row["estimate_sum"],
+            )
+            for row in rows
+        ]
+    return bulk_rollups
+
+
+def rollup_dates(issue_ids, current_instances=()):
+    """creation days of the given issues
+
+    Deleted issues are only known by their last serialized state, their
+    creation day is read from current_instances
+    """
+    issue_ids = [issue_id for issue_id in issue_ids if issue_id is not None]
+    dates = set(
+        Issue.objects.filter(pk__in=issue_ids)
+        .annotate(date=TruncDate("created_at"))
+        .values_list("date", flat=True)
+    )
+    for current_instance in current_instances:
+        created_at = parse_datetime(str((current_instance or {}).get("created_at")))
+        if created_at is not None:
+            dates.add(timezone.localdate(created_at))
+    return dates
+
+
+def pending_dates_key(project_id):
+    return f"analytics_rollup_dates:{project_id}"
+
+
+def pending_refresh_key(project_id):
+    return f"analytics_rollup_scheduled:{project_id}"
+
+
+def schedule_issue_rollups(project_id, issue_ids, current_instances=()):
+    """queue a refresh of the rollup days holding the given issues
+
+    Days pile up in a redis set and one refresh per project runs after
+    ANALYTICS_ROLLUP_DEBOUNCE seconds, however many activities came in.
+    """
+    from plane.bgtasks.analytics_rollup_task import refresh_pending_rollups
+
+    dates = rollup_dates(issue_ids, current_instances)
+    if not dates:
+        return
+
+    redis_instance().sadd(
+        pending_dates_key(project_id), *[date.isoformat() for date in dates]
+    )
+    if cache.add(
+        pending_refresh_key(project_id), 1, settings.ANALYTICS_ROLLUP_DEBOUNCE
+    ):
+        refresh_pending_rollups.apply_async(
+            args=[str(project_id)], countdown=settings.ANALYTICS_ROLLUP_DEBOUNCE
+        )
+
+
+def refresh_pending_rollups_of(project_id):
+    # Cleared first, a day queued while refreshing schedules the next run
+    cache.delete(pending_refresh_key(project_id))
+    pipe = redis_instance().pipeline()
+    pipe.smembers(pending_dates_key(project_id))
+    pipe.delete(pending_dates_key(project_id))
+    dates, _ = pipe.execute()
+    refresh_analytics_rollups(
+        project_id, {datetime.date.fromisoformat(date.decode()) for date in dates}
+    )
+
+
+def activity_issue_ids(issue_id, requested_data):
+    # Cycle and module activities carry their issues in the payload
+    return (
+        [issue_id]
+        + requested_data.get("issues", [])
+        + requested_data.get("cycles_list", [])
+        + requested_data.get("modules_list", [])
+    )
+
+
+def can_use_rollups(filters, x_axis, segment=None):
+    return not segment and x_axis in ROLLUP_AXES and ROLLUP_FILTERS.issuperset(filters)
+
+
+def rollup_queryset(slug, filters, dimension):
+    rollups = AnalyticsRollup.objects.filter(workspace__slug=slug, dimension=dimension)
+    if "project__in" in filters:
+        rollups = rollups.filter(project_id__in=filters["project__in"])
+    return rollups
+
+
+def rollup_total(slug, filters):
+    return (
+        rollup_queryset(slug, filters, TOTAL_DIMENSION).aggregate(
+            total=Sum("issue_count")
+        )["total"]
+        or 0
+    )
+
+
+def rollup_graph_plot(slug, filters, x_axis, y_axis):
+    """build_graph_plot distribution read from the rollups"""
+    metric = "count" if y_axis == "issue_count" else "estimate"
+
+    if x_axis == "created_at":
+        rows = annotate_with_monthly_dimension(
+            rollup_queryset(slug, filters, TOTAL_DIMENSION), "date", "bucket"
+        ).values("bucket")
+    else:
+        rows = (
+            rollup_queryset(slug, filters, x_axis)
+            .exclude(value__isnull=True)
+            .values(bucket=F("value"))
+        )
+    rows = rows.annotate(
+        total=Sum("issue_count" if metric == "count" else "estimate_sum")
+    ).order_by()
+
+    distribution = {}
+    for row in rows:
+        # Estimate points are stored as text like every other value
+        dimension = int(row["bucket"]) if x_axis == "estimate_point" else row["bucket"]
+        distribution[str(dimension)] = [{"dimension": dimension, metric: row["total"]}]
+
+    return sort_data(distribution, x_axis)
+
+
+def sum_or_none(values):
+    values = [value for value in values if value is not None]
+    return sum(values) if values else None
+
+
+def rollup_state_summary(slug, filters, open_issues_groups):
+    """state group totals of DefaultAnalyticsEndpoint read from the rollups"""
+    groups = sorted(
+        rollup_queryset(slug, filters, "state__group")
+        .values("value")
+        .annotate(count=Sum("issue_count"), estimate=Sum("estimate_sum"))
+        .order_by(),
+        key=lambda group: (group["value"] is None, group["value"] or ""),
+    )
+    open_groups = [group for group in groups if group["value"] in open_issues_groups]
+
+    def classified(groups):
+        # Counting the state group leaves issues without a state at zero
+        return [
+            {
+                "state_group": group["value"],
+                "state_count": group["count"] if group["value"] is not None else 0,
+            }
+            for group in groups
+        ]
+
+    return {
+        "total_issues": sum(group["count"] for group in groups),
+        "total_issues_classified": classified(groups),
+        "open_issues": sum(group["count"] for group in open_groups),
+        "open_issues_classified": classified(open_groups),
+        "open_estimate_sum": sum_or_none(group["estimate"] for group in open_groups),
+        "total_estimate_sum": sum_or_none(group["estimate"] for group in groups),
+    }
@@ -0,0 +1,71 @@
+# Django imports
+from django.core.cache import cache
+
+
+class CacheNamespace:
+    """Cache entries of one kind, invalidated a scope at a time
+
+    Entries are stored under name:scope:version:key. Invalidating a scope
+    moves it to a new version instead of deleting its keys, so a reader that
+    loaded stale rows cannot write them back under the live key. Everything
+    goes through the default cache and its shared connection pool.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def version_key(self, scope):
+        return f"{self.name}_version:{scope}"
+
+    def entry_key(self, scope, version, key):
+        return f"{self.name}:{scope}:{version}:{key}"
+
+    def versions(self, scopes):
+        """current version of each scope, read in one round trip"""
+        scopes = [str(scope) for scope in scopes]
+        found = cache.get_many([self.version_key(scope) for scope in scopes])
+        return {scope: found.get(self.version_key(scope), 0) for scope in scopes}
+
+    def invalidate(self, scopes):
+        for scope in {str(scope) for scope in scopes if scope is not None}:
+            key = self.version_key(scope)
+            cache.add(key, 0, timeout=None)
+            cache.incr(key)
+
+    def get_or_set(self, scope, key, compute, timeout):
+        """cached value of key, computed and stored for timeout when missing"""
+        return self.get_many_or_set(
+            scope, [key], lambda keys: {key: compute()}, timeout
+        )[key]
+
+    def get_many_or_set(self, scope, keys, compute_missing, timeout):
+        """cached values of keys, compute_missing(keys) fills in the misses
+
+        The missing values are stored under the version they were read at,
+        a concurrent invalidation leaves them behind on the old version.
+        """
+        version = cache.get(self.version_key(scope), 0)
+        entry_keys = {key: self.entry_key(scope, version, key) for key in keys}
+
+        found = cache.get_many(list(entry_keys.values()))
+        values = {
+            key: found[entry_key]
+            for key, entry_key in entry_keys.items()
+            if entry_key in found
+        }
+        missing = [key for key in keys if key not in values]
+        if missing:
+            computed = compute_missing(missing)
+            cache.set_many(
+                {entry_keys[key]: value for key, value in computed.items()},
+                timeout,
+            )
+            values.update(computed)
+        return values
+
+
+def scope_versions(scopes):
+    """versions of (namespace, scope) pairs of any namespaces, in one round trip"""
+    keys = [namespace.version_key(scope) for namespace, scope in scopes]
+    found = cache.get_many(keys)
+    return [found.get(key, 0) for key in keys]
@@ -0,0 +1,165 @@
+# Python imports
+import hashlib
+import json
+
+# Django imports
+from django.conf import settings
+from django.db.models import Count, Exists, OuterRef, Q
+from django.db.models.functions import ExtractWeek
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import Issue, IssueAssignee, IssueSubscriber
+from plane.utils.cache import CacheNamespace
+from plane.utils.progress import STATE_GROUPS
+
+PRIORITY_ORDER = ["urgent", "high", "medium", "low", "none"]
+
+ISSUE_STATS_CACHE = CacheNamespace("issue_stats")
+
+
+def invalidate_issue_stats(user_ids):
+    # Every cached variant of the user goes stale at once
+    ISSUE_STATS_CACHE.invalidate(user_ids)
+
+
+def issue_stats_users(issue_ids):
+    """users whose issue stats count the given issues"""
+    issue_ids = [issue_id for issue_id in issue_ids if issue_id is not None]
+    return (
+        set(
+            IssueAssignee.objects.filter(issue_id__in=issue_ids).values_list(
+                "assignee_id", flat=True
+            )
+        )
+        | set(
+            IssueSubscriber.objects.filter(issue_id__in=issue_ids).values_list(
+                "subscriber_id", flat=True
+            )
+        )
+        | set(
+            Issue.objects.filter(pk__in=issue_ids).values_list(
+                "created_by_id", flat=True
+            )
+        )
+    )
+
+
+def issue_stats_aggregates(user_id):
+    assigned = Q(is_assigned=True)
+    pending = assigned & ~Q(state__group__in=["completed", "cancelled"])
+    today = timezone.now().date()
+
+    aggregates = {
+        "assigned": Count("id", filter=assigned),
+        "pending": Count("id", filter=pending),
+        "completed": Count("id", filter=assigned & Q(state__group="completed")),
+        "overdue": Count(
+            "id",
+            filter=pending & Q(target_date__lt=today, completed_at__isnull=True),
+        ),
+        "due_week": Count(
+            "id", filter=assigned & Q(target_week=today.isocalendar()[1])
+        ),
+        "created": Count("id", filter=Q(created_by_id=user_id)),
+        "subscribed": Count("id", filter=Q(is_subscribed=True)),
+        "state_none": Count("id", filter=assigned & Q(state__isnull=True)),
+    }
+    for group in STATE_GROUPS:
+        aggregates[f"state_{group}"] = Count(
+            "id", filter=assigned & Q(state__group=group)
+        )
+    for priority in PRIORITY_ORDER:
+        aggregates[f"priority_{priority}"] = Count(
+            "id", filter=assigned & Q(priority=priority)
+        )
+    return aggregates
+
+
+def compute_issue_stats(slug, user_id, project_ids=None, filters=None):
+    issues = Issue.issue_objects.filter(workspace__slug=slug, **(filters or {}))
+    if project_ids is not None:
+        issues = issues.filter(project_id__in=project_ids)
+
+    # Exists keeps the assignee and subscriber joins from fanning the rows out
+    stats = (
+        issues.annotate(
+            is_assigned=Exists(
+                IssueAssignee.objects.filter(
+                    issue_id=OuterRef("id"), assignee_id=user_id
+                )
+            ),
+            is_subscribed=Exists(
+                IssueSubscriber.objects.filter(
+                    issue_id=OuterRef("id"), subscriber_id=user_id
+                )
+            ),
+            target_week=ExtractWeek("target_date"),
+        )
+        .filter(
+            Q(is_assigned=True) | Q(is_subscribed=True) | Q(created_by_id=user_id)
+        )
+        .aggregate(**issue_stats_aggregates(user_id))
+    )
+
+    # Same shape as the grouped queries, empty groups are left out
+    state_distribution = [
+        {"state_group": group, "state_count": stats[f"state_{group}"]}
+        for group in sorted(STATE_GROUPS)
+        if stats[f"state_{group}"]
+    ]
+    if stats["state_none"]:
+        state_distribution.append({"state_group": None, "state_count": 0})
+
+    return {
+        "assigned": stats["assigned"],
+        "pending": stats["pending"],
+        "completed": stats["completed"],
+        "overdue": stats["overdue"],
+        "due_week": stats["due_week"],
+        "created": stats["created"],
+        "subscribed": stats["subscribed"],
+        "state_distribution": state_distribution,
+        "priority_distribution": [
+            {
+                "priority": priority,
+                "priority_count": stats[f"priority_{priority}"],
+                "priority_order": order,
+            }
+            for order, priority in enumerate(PRIORITY_ORDER)
+            if stats[f"priority_{priority}"]
+        ],
+    }
+
+
+def get_issue_stats(slug, user_id, project_ids=None, filters=None):
+    """issue counts and distributions of a user in a workspace
+
+    Computed in one conditional aggregate and cached for a short while, any
+    change to an issue the user is assigned to, subscribed to or created
+    invalidates it.
+
+    Args:
+        slug (string): workspace slug
+        user_id (uuid): user whose issues are counted
+        project_ids (list): projects to count in, all of them when None
+        filters (dict): issue filters to apply
+    """
+    variant = hashlib.md5(
+        json.dumps(
+            {
+                "projects": sorted(map(str, project_ids))
+                if project_ids is not None
+                else None,
+                "filters": filters or {},
+            },
+            sort_keys=True,
+            default=str,
+        ).encode()
+    ).hexdigest()
+    return ISSUE_STATS_CACHE.get_or_set(
+        user_id,
+        f"{slug}:{variant}",
+        lambda: compute_issue_stats(slug, user_id, project_ids, filters),
+        settings.DASHBOARD_CACHE_TTL,
+    )
@@ -0,0 +1,77 @@
+# Python imports
+import hashlib
+import json
+
+# Django imports
+from django.utils.http import parse_etags
+
+# Module imports
+from plane.db.models import Workspace
+from plane.utils.cache import CacheNamespace, scope_versions
+from plane.utils.membership import load_membership
+
+# Change counters of what project and workspace resources are built from
+PROJECT_RESOURCES = CacheNamespace("project_resources")
+WORKSPACE_RESOURCES = CacheNamespace("workspace_resources")
+
+
+def project_scope(project_id, resource):
+    return (PROJECT_RESOURCES, f"{project_id}:{resource}")
+
+
+def workspace_scope(slug, resource):
+    return (WORKSPACE_RESOURCES, f"{slug}:{resource}")
+
+
+def invalidate_project_resources(project_ids, resources):
+    PROJECT_RESOURCES.invalidate(
+        f"{project_id}:{resource}"
+        for project_id in {str(pk) for pk in project_ids if pk is not None}
+        for resource in resources
+    )
+
+
+def invalidate_workspace_resources(workspace_ids, resources):
+    # Requests only carry the slug, so the counters are kept by slug
+    slugs = Workspace.objects.filter(
+        pk__in=[pk for pk in set(workspace_ids) if pk is not None]
+    ).values_list("slug", flat=True)
+    WORKSPACE_RESOURCES.invalidate(
+        f"{slug}:{resource}" for slug in slugs for resource in resources
+    )
+
+
+def invalidate_user_resources(user_ids):
+    """bump the resources showing the names and avatars of the given users"""
+    for user_id in {user_id for user_id in user_ids if user_id is not None}:
+        membership = load_membership(user_id)
+        invalidate_project_resources(membership.projects, ["members"])
+        WORKSPACE_RESOURCES.invalidate(
+            f"{slug}:projects" for slug in membership.workspaces
+        )
+
+
+def resource_etag(request, scopes):
+    """strong ETag of a GET response built from the given resource scopes
+
+    The counters are read in one cache round trip. The path and the user
+    are part of it since the responses vary with both.
+    """
+    digest = hashlib.md5(
+        json.dumps(
+            {
+                "path": request.get_full_path(),
+                "user": str(request.user.id),
+                "timezone": request.user.user_timezone,
+                "versions": scope_versions(scopes),
+            },
+            sort_keys=True,
+        ).encode()
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(request, etag):
+    # If-None-Match compares weakly and GZipMiddleware weakens zipped ETags
+    etags = parse_etags(request.META.get("HTTP_IF_NONE_MATCH", ""))
+    return "*" in etags or etag in [tag.removeprefix("W/") for tag in etags]
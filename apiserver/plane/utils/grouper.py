@@ -1,3 +1,34 @@
+# Django imports
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    IntegerField,
+    Max,
+    OuterRef,
+    Subquery,
+    Value,
+    When,
+    Window,
+)
+from django.db.models.functions import RowNumber
+
+
+# Serialized group keys mapped to the database column backing them
+GROUP_BY_FIELDS = {
+    "state": "state_id",
+    "state_detail.group": "state__group",
+    "priority": "priority",
+    "project": "project_id",
+    "labels": "labels__id",
+    "assignees": "assignees__id",
+    "created_by": "created_by_id",
+}
+
+PRIORITY_ORDER = ["urgent", "high", "medium", "low", "none"]
+STATE_ORDER = ["backlog", "unstarted", "started", "completed", "cancelled"]
+
+
 def resolve_keys(group_keys, value):
     """resolve keys to a key which will be used for
     grouping
@@ -162,3 +193,199 @@ def group_results(results_data, group_by, sub_group_by=False):
                     response_dict[str(group_attribute)].append(value)
 
         return response_dict
+
+
+def issue_group_ordering(queryset, order_by_param):
+    """annotate the queryset with the sort keys used by the issue lists
+
+    Args:
+        queryset (QuerySet): issue queryset
+        order_by_param (string): order_by query parameter
+
+    Returns:
+        tuple: annotated queryset and the ordering to rank groups with
+    """
+    if order_by_param in ["priority", "-priority"]:
+        priority_order = (
+            PRIORITY_ORDER if order_by_param == "priority" else PRIORITY_ORDER[::-1]
+        )
+        queryset = queryset.annotate(
+            priority_order=Case(
+                *[When(priority=p, then=Value(i)) for i, p in enumerate(priority_order)],
+                output_field=IntegerField(),
+            )
+        )
+        return queryset, ["priority_order", "-created_at"]
+
+    if order_by_param in [
+        "state__name",
+        "state__group",
+        "-state__name",
+        "-state__group",
+    ]:
+        state_order = (
+            STATE_ORDER
+            if order_by_param in ["state__name", "state__group"]
+            else STATE_ORDER[::-1]
+        )
+        queryset = queryset.annotate(
+            state_order=Case(
+                *[
+                    When(state__group=state_group, then=Value(i))
+                    for i, state_group in enumerate(state_order)
+                ],
+                default=Value(len(state_order)),
+                output_field=IntegerField(),
+            )
+        )
+        return queryset, ["state_order", "-created_at"]
+
+    if order_by_param in [
+        "labels__name",
+        "-labels__name",
+        "assignees__first_name",
+        "-assignees__first_name",
+    ]:
+        # Correlated max so the multi valued join does not mix with the
+        # join used for grouping
+        queryset = queryset.annotate(
+            max_values=Subquery(
+                queryset.model.objects.filter(pk=OuterRef("pk"))
+                .order_by()
+                .values("pk")
+                .annotate(max_value=Max(order_by_param.lstrip("-")))
+                .values("max_value")
+            )
+        )
+        return queryset, [
+            "-max_values" if order_by_param.startswith("-") else "max_values",
+            "-created_at",
+        ]
+
+    return queryset, list(dict.fromkeys([order_by_param, "-created_at"]))
+
+
+def group_issue_ids(
+    queryset, group_by, sub_group_by=False, order_by="-created_at", per_group=25, offset=0
+):
+    """count the issues of every group and pick a page of issue ids per
+    group in the database with a row number window partitioned by group
+
+    Args:
+        queryset (QuerySet): filtered issue queryset
+        group_by (string): serialized group key
+        sub_group_by (string): serialized sub group key
+        order_by (string): order_by query parameter
+        per_group (int): number of issues per group
+        offset (int): number of issues to skip in every group
+
+    Returns:
+        tuple: counts and ids keyed by (sub_group, group)
+    """
+    group_field = GROUP_BY_FIELDS[group_by]
+    sub_group_field = GROUP_BY_FIELDS[sub_group_by] if sub_group_by else None
+    partition = [F(group_field)] + ([F(sub_group_field)] if sub_group_field else [])
+    keys = {"group_key": F(group_field)}
+    if sub_group_field:
+        keys["sub_group_key"] = F(sub_group_field)
+
+    # Plain issue rows only, the list annotations and fan out joins of the
+    # incoming queryset stay in the id subquery
+    base = queryset.model.objects.filter(pk__in=queryset.order_by().values("pk"))
+
+    counts = {}
+    for row in (
+        base.order_by()
+        .values(**keys)
+        .annotate(count=Count("pk", distinct=True))
+    ):
+        counts[(str(row.get("sub_group_key")), str(row["group_key"]))] = row["count"]
+
+    ranked, ordering = issue_group_ordering(base, order_by)
+    ranked = (
+        ranked.annotate(
+            **keys,
+            row_number=Window(
+                expression=RowNumber(), partition_by=partition, order_by=ordering
+            ),
+        )
+        .filter(row_number__gt=offset, row_number__lte=offset + per_group)
+        .order_by()
+        .values(*keys, "pk", "row_number")
+    )
+
+    ids = {}
+    for row in ranked:
+        key = (str(row.get("sub_group_key")), str(row["group_key"]))
+        ids.setdefault(key, []).append((row["row_number"], row["pk"]))
+
+    return counts, {
+        key: [pk for _, pk in sorted(rows, key=lambda row: row[0])]
+        for key, rows in ids.items()
+    }
+
+
+def group_results_paginated(
+    queryset,
+    on_results,
+    group_by,
+    sub_group_by=False,
+    order_by="-created_at",
+    per_group=25,
+    offset=0,
+):
+    """group the issues in the database and return every group with its
+    total count and the requested page of serialized issues
+
+    Args:
+        queryset (QuerySet): filtered issue queryset used for serialization
+        on_results (function): serializes a queryset into a list of dicts
+        group_by (string): serialized group key
+        sub_group_by (string): serialized sub group key
+
+    Returns:
+        obj: grouped results with count and results per group
+    """
+    counts, ids = group_issue_ids(
+        queryset,
+        group_by,
+        sub_group_by,
+        order_by=order_by,
+        per_group=per_group,
+        offset=offset,
+    )
+
+    issue_ids = {pk for group_ids in ids.values() for pk in group_ids}
+    issues = {
+        str(issue["id"]): issue
+        for issue in on_results(queryset.filter(pk__in=issue_ids))
+    }
+
+    def group(key):
+        return {
+            "count": counts.get(key, 0),
+            "results": [
+                issues[str(pk)] for pk in ids.get(key, []) if str(pk) in issues
+            ],
+        }
+
+    if sub_group_by:
+        response_dict = (
+            {priority: {} for priority in PRIORITY_ORDER}
+            if sub_group_by == "priority"
+            else {}
+        )
+        for sub_group_key, group_key in counts:
+            response_dict.setdefault(sub_group_key, {})[group_key] = group(
+                (sub_group_key, group_key)
+            )
+        return response_dict
+
+    response_dict = (
+        {priority: group((str(None), priority)) for priority in PRIORITY_ORDER}
+        if group_by == "priority"
+        else {}
+    )
+    for _, group_key in counts:
+        response_dict[group_key] = group((str(None), group_key))
+    return response_dict
@@ -0,0 +1,215 @@
+# Python imports
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Django imports
+from django.conf import settings
+from django.db import connection
+
+# Third party imports
+from sentry_sdk import capture_exception
+
+# Module imports
+from plane.settings.redis import connection_pool_stats, redis_instance
+
+REQUEST_METRICS_KEY = "instrumentation:requests"
+TASK_METRICS_KEY = "instrumentation:tasks"
+
+# Prometheus name and help of every recorded field
+REQUEST_METRICS = {
+    "count": ("plane_http_requests_total", "Sampled requests"),
+    "duration": (
+        "plane_http_request_duration_seconds_total",
+        "Time spent in the sampled requests",
+    ),
+    "queries": ("plane_http_request_queries_total", "SQL queries run"),
+    "db": ("plane_http_request_db_seconds_total", "Time spent in SQL queries"),
+    "serializer": (
+        "plane_http_request_serializer_seconds_total",
+        "Time spent in serializers, SQL run while serializing included",
+    ),
+    "response_bytes": ("plane_http_response_bytes_total", "Response body size"),
+}
+TASK_METRICS = {
+    "count": ("plane_task_runs_total", "Sampled task runs"),
+    "duration": ("plane_task_duration_seconds_total", "Time spent in the task runs"),
+    "queries": ("plane_task_queries_total", "SQL queries run"),
+    "db": ("plane_task_db_seconds_total", "Time spent in SQL queries"),
+}
+
+_current_metrics = ContextVar("instrumentation_metrics", default=None)
+_task_runs = {}
+
+
+class Metrics:
+    """Counters of one sampled request or task run"""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.queries = 0
+        self.db_time = 0
+        self.serializer_time = 0
+        self.serializing = False
+
+    @property
+    def duration(self):
+        return time.perf_counter() - self.started_at
+
+    def __call__(self, execute, sql, params, many, context):
+        # Used as the execute wrapper of the connection
+        started_at = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_time += time.perf_counter() - started_at
+
+
+def current_metrics():
+    return _current_metrics.get()
+
+
+def is_sampled():
+    rate = settings.INSTRUMENTATION_SAMPLE_RATE
+    return rate > 0 and random.random() < rate
+
+
+@contextmanager
+def instrument():
+    """collect the metrics of the wrapped block, None when it is not sampled"""
+    if not is_sampled():
+        yield None
+        return
+
+    metrics = Metrics()
+    token = _current_metrics.set(metrics)
+    try:
+        with connection.execute_wrapper(metrics):
+            yield metrics
+    finally:
+        _current_metrics.reset(token)
+
+
+@contextmanager
+def serializer_timer():
+    # Only the outermost serializer is timed so nested ones are not counted twice
+    metrics = current_metrics()
+    if metrics is None or metrics.serializing:
+        yield
+        return
+
+    metrics.serializing = True
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.serializer_time += time.perf_counter() - started_at
+        metrics.serializing = False
+
+
+def server_timing(metrics):
+    return ", ".join(
+        [
+            f'db;dur={metrics.db_time * 1000:.1f};desc="{metrics.queries} queries"',
+            f"serializer;dur={metrics.serializer_time * 1000:.1f}",
+            f"total;dur={metrics.duration * 1000:.1f}",
+        ]
+    )
+
+
+def store(key, labels, values):
+    # One round trip per sampled run, fields are the labels and metric name
+    try:
+        pipe = redis_instance().pipeline(transaction=False)
+        for metric, value in values.items():
+            pipe.hincrbyfloat(key, "\t".join(labels + [metric]), value)
+        pipe.execute()
+    except Exception as e:
+        capture_exception(e)
+
+
+def record_request(view, method, status_code, metrics, response_bytes):
+    store(
+        REQUEST_METRICS_KEY,
+        [view, method, f"{status_code // 100}xx"],
+        {
+            "count": 1,
+            "duration": metrics.duration,
+            "queries": metrics.queries,
+            "db": metrics.db_time,
+            "serializer": metrics.serializer_time,
+            "response_bytes": response_bytes,
+        },
+    )
+
+
+def start_task(task_id):
+    if not is_sampled():
+        return
+
+    metrics = Metrics()
+    connection.execute_wrappers.append(metrics)
+    _task_runs[task_id] = (metrics, _current_metrics.set(metrics))
+
+
+def finish_task(task_id, task_name, state):
+    run = _task_runs.pop(task_id, None)
+    if run is None:
+        return
+
+    metrics, token = run
+    connection.execute_wrappers.remove(metrics)
+    _current_metrics.reset(token)
+    store(
+        TASK_METRICS_KEY,
+        [task_name, state or "UNKNOWN"],
+        {
+            "count": 1,
+            "duration": metrics.duration,
+            "queries": metrics.queries,
+            "db": metrics.db_time,
+        },
+    )
+
+
+def render_series(key, label_names, metrics):
+    series = {}
+    for field, value in redis_instance().hgetall(key).items():
+        *labels, metric = field.decode().split("\t")
+        if metric not in metrics or len(labels) != len(label_names):
+            continue
+        label_text = ",".join(
+            f'{name}="{label}"' for name, label in zip(label_names, labels)
+        )
+        series.setdefault(metric, []).append(f"{{{label_text}}} {value.decode()}")
+
+    lines = []
+    for metric, (name, help_text) in metrics.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+        lines += [f"{name}{sample}" for sample in sorted(series.get(metric, []))]
+    return lines
+
+
+def render_metrics():
+    """sampled request and task metrics in the Prometheus text format"""
+    lines = [
+        "# HELP plane_instrumentation_sample_rate Share of requests and tasks sampled",
+        "# TYPE plane_instrumentation_sample_rate gauge",
+        f"plane_instrumentation_sample_rate {settings.INSTRUMENTATION_SAMPLE_RATE:g}",
+    ]
+    lines += render_series(
+        REQUEST_METRICS_KEY, ["view", "method", "status"], REQUEST_METRICS
+    )
+    lines += render_series(TASK_METRICS_KEY, ["task", "state"], TASK_METRICS)
+
+    # Pools are per process, these are the ones of the process answering
+    lines += [
+        "# HELP plane_redis_pool_connections Redis connections of the pool",
+        "# TYPE plane_redis_pool_connections gauge",
+    ]
+    for state, count in connection_pool_stats().items():
+        lines.append(f'plane_redis_pool_connections{{state="{state}"}} {count}')
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,122 @@
+# Django imports
+from django.db import transaction
+from django.db.models import F, Func, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+# Module imports
+from plane.db.models import (
+    Issue,
+    IssueAttachment,
+    IssueChildCount,
+    IssueComment,
+    IssueLink,
+    IssueReaction,
+)
+
+CHILD_COUNT_FIELDS = [
+    "sub_issues_count",
+    "link_count",
+    "attachment_count",
+    "comment_count",
+    "reaction_count",
+]
+
+
+def count_subquery(queryset, relation):
+    return Coalesce(
+        Subquery(
+            queryset.filter(**{relation: OuterRef("issue_id")})
+            .order_by()
+            .annotate(count=Func(F("id"), function="Count"))
+            .values("count")
+        ),
+        0,
+    )
+
+
+def child_count_annotations(*fields, prefix=""):
+    """maintained child counts to annotate a queryset with
+
+    Args:
+        fields (string): counts to annotate, all of them when none are given
+        prefix (string): path to the issue, like issue__ on cycle issues
+    """
+    return {
+        field: Coalesce(F(f"{prefix}child_counts__{field}"), 0)
+        for field in fields or CHILD_COUNT_FIELDS
+    }
+
+
+def refresh_issue_counts(issue_ids):
+    """recount the children of the given issues in the current transaction
+
+    The count rows are locked before counting, so a concurrent change to the
+    same issue waits for this one and then counts its rows too.
+    """
+    issue_ids = sorted({str(issue_id) for issue_id in issue_ids if issue_id})
+    if not issue_ids:
+        return
+
+    with transaction.atomic():
+        locked = set(
+            str(issue_id)
+            for issue_id in IssueChildCount.objects.select_for_update()
+            .filter(issue_id__in=issue_ids)
+            .order_by("issue_id")
+            .values_list("issue_id", flat=True)
+        )
+        missing = [issue_id for issue_id in issue_ids if issue_id not in locked]
+        if missing:
+            # Deleted issues are not returned, their rows went with them
+            IssueChildCount.objects.bulk_create(
+                [
+                    IssueChildCount(
+                        issue_id=issue["id"],
+                        project_id=issue["project_id"],
+                        workspace_id=issue["workspace_id"],
+                    )
+                    for issue in Issue.objects.filter(pk__in=missing).values(
+                        "id", "project_id", "workspace_id"
+                    )
+                ],
+                ignore_conflicts=True,
+            )
+            list(
+                IssueChildCount.objects.select_for_update()
+                .filter(issue_id__in=missing)
+                .order_by("issue_id")
+                .values_list("id", flat=True)
+            )
+
+        IssueChildCount.objects.filter(issue_id__in=issue_ids).update(
+            sub_issues_count=count_subquery(Issue.issue_objects, "parent_id"),
+            link_count=count_subquery(IssueLink.objects, "issue_id"),
+            attachment_count=count_subquery(IssueAttachment.objects, "issue_id"),
+            comment_count=count_subquery(IssueComment.objects, "issue_id"),
+            reaction_count=count_subquery(IssueReaction.objects, "issue_id"),
+        )
+
+
+def refresh_parent_counts(issue_ids):
+    """recount the sub-issues of the parents of the given issues"""
+    refresh_issue_counts(
+        Issue.objects.filter(pk__in=issue_ids, parent__isnull=False).values_list(
+            "parent_id", flat=True
+        )
+    )
+
+
+def reconcile_issue_counts(project_id=None, batch_size=1000):
+    """rebuild every count row, or those of a project, to repair drift
+
+    Returns:
+        int: issues whose counts were refreshed
+    """
+    issues = Issue.objects.order_by("id")
+    if project_id is not None:
+        issues = issues.filter(project_id=project_id)
+
+    issue_ids = list(issues.values_list("id", flat=True))
+    for start in range(0, len(issue_ids), batch_size):
+        refresh_issue_counts(issue_ids[start : start + batch_size])
+    return len(issue_ids)
@@ -2,22 +2,30 @@
 import re
 
 # Django imports
-from django.db.models import Q
+from django.db.models import Q, Value, FloatField
 
 # Module imports
 from plane.db.models import Issue
+from plane.utils.search import search_query, search_rank
 
 
 def search_issues(query, queryset):
-    fields = ["name", "sequence_id"]
     q = Q()
-    for field in fields:
-        if field == "sequence_id":
-            sequences = re.findall(r"\d+\.\d+|\d+", query)
-            for sequence_id in sequences:
-                q |= Q(**{"sequence_id": sequence_id})
-        else:
-            q |= Q(**{f"{field}__icontains": query})
-    return queryset.filter(
-        q,
-    ).distinct()
+    sequences = re.findall(r"\d+\.\d+|\d+", query)
+    for sequence_id in sequences:
+        q |= Q(**{"sequence_id": sequence_id})
+
+    # Full text match on the indexed name and description, best match first
+    search = search_query(query)
+    if search is not None:
+        q |= Q(search_vector=search)
+
+    return (
+        queryset.filter(q)
+        .annotate(
+            rank=search_rank(search)
+            if search is not None
+            else Value(0.0, output_field=FloatField())
+        )
+        .order_by("-rank", "-created_at")
+    )
@@ -0,0 +1,120 @@
+# Django imports
+from django.db import connection
+
+# Module imports
+from plane.db.models import InboxIssue, Issue, State
+
+# Deepest level walked, also guards against parents pointing in a loop
+MAX_TREE_DEPTH = 32
+
+# Same rows as Issue.issue_objects
+ACTIVE_ISSUE = f"""
+    i.archived_at IS NULL
+    AND NOT i.is_draft
+    AND NOT EXISTS (
+        SELECT 1 FROM {InboxIssue._meta.db_table} ii
+        WHERE ii.issue_id = i.id AND ii.status NOT IN (-1, 1, 2)
+    )
+"""
+
+SUBTREE_SQL = f"""
+    WITH RECURSIVE tree AS (
+        SELECT i.id, i.parent_id, 1 AS depth, ARRAY[i.id] AS path
+        FROM {Issue._meta.db_table} i
+        WHERE i.parent_id = %(issue_id)s AND {ACTIVE_ISSUE}
+        UNION ALL
+        SELECT i.id, i.parent_id, tree.depth + 1, tree.path || i.id
+        FROM {Issue._meta.db_table} i
+        JOIN tree ON i.parent_id = tree.id
+        WHERE tree.depth < %(max_depth)s
+            AND NOT i.id = ANY(tree.path)
+            AND {ACTIVE_ISSUE}
+    )
+    SELECT tree.id, tree.parent_id, tree.depth, s."group", i.estimate_point
+    FROM tree
+    JOIN {Issue._meta.db_table} i ON i.id = tree.id
+    LEFT JOIN {State._meta.db_table} s ON s.id = i.state_id
+    ORDER BY tree.depth, i.sort_order
+"""
+
+ANCESTORS_SQL = f"""
+    WITH RECURSIVE chain AS (
+        SELECT i.id, i.parent_id, 1 AS depth, ARRAY[i.id] AS path
+        FROM {Issue._meta.db_table} i
+        JOIN {Issue._meta.db_table} child ON child.parent_id = i.id
+        WHERE child.id = %(issue_id)s
+        UNION ALL
+        SELECT i.id, i.parent_id, chain.depth + 1, chain.path || i.id
+        FROM {Issue._meta.db_table} i
+        JOIN chain ON i.id = chain.parent_id
+        WHERE chain.depth < %(max_depth)s AND NOT i.id = ANY(chain.path)
+    )
+    SELECT id FROM chain ORDER BY depth DESC
+"""
+
+
+class TreeNode:
+    def __init__(self, issue_id, parent_id, depth, state_group, estimate_point):
+        self.issue_id = issue_id
+        self.parent_id = parent_id
+        self.depth = depth
+        self.state_group = state_group
+        self.estimate_point = estimate_point
+        self.children = []
+        self.state_distribution = {}
+        self.estimate_total = 0
+        self.issue_count = 0
+
+
+def get_subtree(issue_id, max_depth=MAX_TREE_DEPTH):
+    """every descendant of an issue, walked in one recursive query
+
+    Each node carries the rolled up state distribution, estimate total and
+    issue count of the subtree below it.
+
+    Returns:
+        list: the direct children, in sort order
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            SUBTREE_SQL, {"issue_id": str(issue_id), "max_depth": max_depth}
+        )
+        nodes = [TreeNode(*row) for row in cursor.fetchall()]
+
+    nodes_by_id = {node.issue_id: node for node in nodes}
+    roots = []
+    for node in nodes:
+        parent = nodes_by_id.get(node.parent_id)
+        (parent.children if parent is not None else roots).append(node)
+
+    # Rows come ordered by depth, walking them backwards visits children first
+    for node in reversed(nodes):
+        node.issue_count += 1
+        node.estimate_total += node.estimate_point or 0
+        if node.state_group is not None:
+            node.state_distribution[node.state_group] = (
+                node.state_distribution.get(node.state_group, 0) + 1
+            )
+        parent = nodes_by_id.get(node.parent_id)
+        if parent is not None:
+            merge_subtree(parent, node)
+
+    return roots
+
+
+def merge_subtree(parent, node):
+    parent.issue_count += node.issue_count
+    parent.estimate_total += node.estimate_total
+    for state_group, count in node.state_distribution.items():
+        parent.state_distribution[state_group] = (
+            parent.state_distribution.get(state_group, 0) + count
+        )
+
+
+def get_ancestor_ids(issue_id, max_depth=MAX_TREE_DEPTH):
+    """parent chain of an issue from the root down, in one recursive query"""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            ANCESTORS_SQL, {"issue_id": str(issue_id), "max_depth": max_depth}
+        )
+        return [row[0] for row in cursor.fetchall()]
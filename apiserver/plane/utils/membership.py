@@ -0,0 +1,84 @@
+# Django imports
+from django.conf import settings
+
+# Module imports
+from plane.db.models import WorkspaceMember, ProjectMember
+from plane.utils.cache import CacheNamespace
+
+
+MEMBERSHIP_CACHE = CacheNamespace("membership")
+
+
+def invalidate_memberships(user_ids):
+    """move the given users to a new cache version"""
+    MEMBERSHIP_CACHE.invalidate(user_ids)
+
+
+class Membership:
+    """Workspace and project roles of a user
+
+    workspaces maps a workspace slug to (role, is_active) and projects maps
+    a project id to (workspace slug, role, is_active). Inactive rows are
+    kept so callers can decide whether they count.
+    """
+
+    def __init__(self, workspaces, projects):
+        self.workspaces = workspaces
+        self.projects = projects
+
+    def workspace_role(self, slug, active=True):
+        role, is_active = self.workspaces.get(slug, (None, False))
+        if active and not is_active:
+            return None
+        return role
+
+    def project_role(self, slug, project_id, active=True):
+        workspace_slug, role, is_active = self.projects.get(
+            str(project_id), (None, None, False)
+        )
+        if workspace_slug != slug or (active and not is_active):
+            return None
+        return role
+
+    def project_ids(self, slug, active=False):
+        return [
+            project_id
+            for project_id, (workspace_slug, _, is_active) in self.projects.items()
+            if workspace_slug == slug and (is_active or not active)
+        ]
+
+
+def read_membership(user_id):
+    return {
+        "workspaces": {
+            slug: (role, is_active)
+            for slug, role, is_active in WorkspaceMember.objects.filter(
+                member_id=user_id
+            ).values_list("workspace__slug", "role", "is_active")
+        },
+        "projects": {
+            str(project_id): (slug, role, is_active)
+            for project_id, slug, role, is_active in ProjectMember.objects.filter(
+                member_id=user_id
+            ).values_list("project_id", "workspace__slug", "role", "is_active")
+        },
+    }
+
+
+def load_membership(user_id):
+    cached_membership = MEMBERSHIP_CACHE.get_or_set(
+        user_id,
+        "roles",
+        lambda: read_membership(user_id),
+        settings.MEMBERSHIP_CACHE_TTL,
+    )
+    return Membership(**cached_membership)
+
+
+def get_membership(request):
+    """memberships of the request user, resolved once per request"""
+    membership = getattr(request, "_membership", None)
+    if membership is None:
+        membership = load_membership(request.user.id)
+        request._membership = membership
+    return membership
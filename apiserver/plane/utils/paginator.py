@@ -1,7 +1,20 @@
+# Python imports
+import json
+import math
+import base64
+from uuid import UUID
+from decimal import Decimal
+from datetime import date, datetime
+from collections.abc import Sequence
+
+# Django imports
+from django.db.models import F, Q
+from django.http import StreamingHttpResponse
+from django.core.serializers.json import DjangoJSONEncoder
+
+# Third party imports
 from rest_framework.response import Response
 from rest_framework.exceptions import ParseError
-from collections.abc import Sequence
-import math
 
 
 class Cursor:
@@ -39,6 +52,59 @@ class Cursor:
         return cls(*bits)
 
 
+def _encode_key_value(value):
+    # Keep full precision for datetimes, the default django json encoder
+    # truncates microseconds which would break the seek comparison
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    raise TypeError(f"Cannot encode {type(value).__name__} in a cursor")
+
+
+class SeekCursor(Cursor):
+    """
+    Cursor holding the sort key values of the boundary row
+    http://example.com/api/users/?cursor=<encoded key>:0:0&per_page=10
+    value=encoded key of the last (or first for prev) row, offset is unused
+    Legacy offset cursors (eg 30:0:0) are still accepted and map to the
+    first page (or to the offset fallback when offset is non zero)
+    """
+
+    def __str__(self):
+        if isinstance(self.value, (list, tuple)):
+            encoded = json.dumps(
+                list(self.value), default=_encode_key_value, separators=(",", ":")
+            )
+            value = (
+                base64.urlsafe_b64encode(encoded.encode("utf-8"))
+                .decode("ascii")
+                .rstrip("=")
+            )
+            return f"{value}:{self.offset}:{int(self.is_prev)}"
+        return super().__str__()
+
+    @classmethod
+    def from_string(cls, value):
+        try:
+            return super().from_string(value)
+        except ValueError:
+            pass
+
+        bits = value.split(":")
+        if len(bits) != 3:
+            raise ValueError
+        try:
+            padded = bits[0] + "=" * (-len(bits[0]) % 4)
+            key = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            bits = key, int(bits[1]), int(bits[2])
+        except (TypeError, ValueError, UnicodeDecodeError):
+            raise ValueError
+        if not isinstance(bits[0], list):
+            raise ValueError
+        return cls(*bits)
+
+
 class CursorResult(Sequence):
     def __init__(self, results, next, prev, hits=None, max_hits=None):
         self.results = results
@@ -136,6 +202,161 @@ class OffsetPaginator:
         )
 
 
+class SeekPaginator:
+    """
+    The keyset (seek) paginator, the cursor carries the sort key of the
+    boundary row so every page is an indexed range scan instead of an
+    offset scan, and the total count is only computed when asked for
+    http://example.com/api/notifications/?cursor=<encoded key>:0:0&per_page=10
+    """
+
+    cursor_cls = SeekCursor
+
+    def __init__(
+        self,
+        queryset,
+        order_by=None,
+        max_limit=MAX_LIMIT,
+        count_hits=False,
+        max_hits=None,
+        on_results=None,
+    ):
+        if order_by is None:
+            order_by = queryset.query.order_by or queryset.model._meta.ordering
+        order_by = (
+            list(order_by) if isinstance(order_by, (list, tuple)) else [order_by]
+        )
+        # A unique tie breaker is required for the seek to be stable
+        if not any(key.lstrip("-") in ("id", "pk") for key in order_by):
+            order_by.append(
+                "-id" if order_by and order_by[0].startswith("-") else "id"
+            )
+        self.key = order_by
+        self.queryset = queryset
+        self.max_limit = max_limit
+        self.count_hits = count_hits
+        self.max_hits = max_hits
+        self.on_results = on_results
+
+    def _ordering(self, reverse=False):
+        ordering = []
+        for key in self.key:
+            descending = key.startswith("-") != reverse
+            expression = F(key.lstrip("-"))
+            # Pin the postgres default null placement so the seek filter
+            # below knows on which side the nulls live
+            ordering.append(
+                expression.desc(nulls_first=True)
+                if descending
+                else expression.asc(nulls_last=True)
+            )
+        return ordering
+
+    def _after(self, field, value, descending):
+        # Rows strictly after value for a single column in the page direction
+        if value is None:
+            # Nulls are last for ascending and first for descending order
+            return Q(**{f"{field}__isnull": False}) if descending else Q(pk__in=[])
+        if descending:
+            return Q(**{f"{field}__lt": value})
+        return Q(**{f"{field}__gt": value}) | Q(**{f"{field}__isnull": True})
+
+    def _seek_filter(self, values, reverse=False):
+        condition = Q(pk__in=[])
+        equal = Q()
+        for key, value in zip(self.key, values):
+            field = key.lstrip("-")
+            descending = key.startswith("-") != reverse
+            condition |= equal & self._after(field, value, descending)
+            equal &= (
+                Q(**{f"{field}__isnull": True})
+                if value is None
+                else Q(**{field: value})
+            )
+        return condition
+
+    def _key_values(self, row):
+        values = []
+        for key in self.key:
+            value = row
+            for attr in key.lstrip("-").split("__"):
+                if value is None:
+                    break
+                value = (
+                    value.get(attr) if isinstance(value, dict) else getattr(value, attr)
+                )
+            values.append(value)
+        return values
+
+    def get_hits(self):
+        if not self.count_hits:
+            return None
+        queryset = self.queryset.order_by()
+        if self.max_hits is not None:
+            # Count only up to the cap, deep counts are what we avoid here
+            return queryset[: self.max_hits].count()
+        return queryset.count()
+
+    def get_result(self, limit=100, cursor=None):
+        if cursor is None:
+            cursor = SeekCursor(None, 0, False)
+
+        limit = min(limit, self.max_limit)
+        is_seek = isinstance(cursor.value, (list, tuple))
+        is_prev = cursor.is_prev and is_seek
+        queryset = self.queryset.order_by(*self._ordering(reverse=is_prev))
+
+        if is_seek:
+            if len(cursor.value) != len(self.key):
+                raise BadPaginationError("Pagination cursor does not match the sort")
+            queryset = queryset.filter(
+                self._seek_filter(cursor.value, reverse=is_prev)
+            )
+            results = list(queryset[: limit + 1])
+        else:
+            # Legacy offset cursor, value is the page size and offset the page
+            offset = cursor.offset * (cursor.value or limit)
+            if offset < 0:
+                raise BadPaginationError("Pagination offset cannot be negative")
+            results = list(queryset[offset : offset + limit + 1])
+
+        has_more = len(results) > limit
+        results = results[:limit]
+        if is_prev:
+            results.reverse()
+
+        if results:
+            next_cursor = SeekCursor(
+                self._key_values(results[-1]),
+                0,
+                False,
+                has_more if not is_prev else True,
+            )
+            prev_cursor = SeekCursor(
+                self._key_values(results[0]),
+                0,
+                True,
+                has_more if is_prev else (is_seek or cursor.offset > 0),
+            )
+        else:
+            next_cursor = SeekCursor(limit, 0, False, False)
+            prev_cursor = SeekCursor(limit, 0, True, False)
+
+        if self.on_results:
+            results = self.on_results(results)
+
+        hits = self.get_hits()
+        max_hits = math.ceil(hits / limit) if hits is not None else None
+
+        return CursorResult(
+            results=results,
+            next=next_cursor,
+            prev=prev_cursor,
+            hits=hits,
+            max_hits=max_hits,
+        )
+
+
 class BasePaginator:
     """BasePaginator class can be inherited by any View to return a paginated view"""
 
@@ -165,7 +386,7 @@ class BasePaginator:
         paginator_cls=OffsetPaginator,
         default_per_page=100,
         max_per_page=100,
-        cursor_cls=Cursor,
+        cursor_cls=None,
         extra_stats=None,
         controller=None,
         **paginator_kwargs,
@@ -173,6 +394,12 @@ class BasePaginator:
         """Paginate the request"""
         per_page = self.get_per_page(request, default_per_page, max_per_page)
 
+        # Paginators bring their own cursor format (offset or seek key)
+        if cursor_cls is None:
+            cursor_cls = getattr(
+                paginator or paginator_cls, "cursor_cls", Cursor
+            )
+
         # Convert the cursor value to integer and float from string
         input_cursor = None
         if request.GET.get(self.cursor_name):
@@ -216,3 +443,38 @@ class BasePaginator:
         )
 
         return response
+
+    def stream(
+        self,
+        request,
+        queryset,
+        on_results=None,
+        chunk_size=500,
+    ):
+        """Stream the queryset as a json list, serializing chunk by chunk
+
+        Only one chunk of model instances is held in memory at a time, so the
+        results cannot be grouped, grouped lists are paginated per group.
+        """
+
+        def serialize():
+            chunk = []
+            for row in queryset.iterator(chunk_size=chunk_size):
+                chunk.append(row)
+                if len(chunk) == chunk_size:
+                    yield from (on_results(chunk) if on_results else chunk)
+                    chunk = []
+            if chunk:
+                yield from (on_results(chunk) if on_results else chunk)
+
+        encoder = DjangoJSONEncoder()
+
+        def content():
+            yield "["
+            for index, result in enumerate(serialize()):
+                if index:
+                    yield ","
+                yield encoder.encode(result)
+            yield "]"
+
+        return StreamingHttpResponse(content(), content_type="application/json")
@@ -0,0 +1,137 @@
+# Django imports
+from django.db.models import Count, Q, Sum
+
+# Module imports
+from plane.db.models import (
+    Cycle,
+    CycleIssue,
+    CycleProgress,
+    Module,
+    ModuleIssue,
+    ModuleProgress,
+)
+
+STATE_GROUPS = ["completed", "cancelled", "started", "unstarted", "backlog"]
+
+ISSUE_COUNT_FIELDS = ["total_issues"] + [f"{group}_issues" for group in STATE_GROUPS]
+
+CYCLE_PROGRESS_FIELDS = ISSUE_COUNT_FIELDS + [
+    "total_estimates",
+    "completed_estimates",
+    "started_estimates",
+]
+
+
+def progress_annotations(relation):
+    """issue counts per state group over a cycle or module relation
+
+    Args:
+        relation (string): issue_cycle or issue_module
+
+    Returns:
+        dict: annotations to aggregate the progress with
+    """
+    active = Q(
+        **{
+            f"{relation}__issue__archived_at__isnull": True,
+            f"{relation}__issue__is_draft": False,
+        }
+    )
+    annotations = {"total_issues": Count(relation, filter=active)}
+    for group in STATE_GROUPS:
+        annotations[f"{group}_issues"] = Count(
+            f"{relation}__issue__state__group",
+            filter=active & Q(**{f"{relation}__issue__state__group": group}),
+        )
+    return annotations
+
+
+def refresh_cycle_progress(cycle_ids):
+    """recompute the progress rows of the given cycles only"""
+    cycle_ids = {cycle_id for cycle_id in cycle_ids if cycle_id is not None}
+    if not cycle_ids:
+        return
+
+    active = Q(
+        issue_cycle__issue__archived_at__isnull=True,
+        issue_cycle__issue__is_draft=False,
+    )
+    cycles = (
+        Cycle.objects.filter(pk__in=cycle_ids)
+        .order_by()
+        .values("id", "project_id", "workspace_id")
+        .annotate(
+            **progress_annotations("issue_cycle"),
+            total_estimates=Sum("issue_cycle__issue__estimate_point"),
+            completed_estimates=Sum(
+                "issue_cycle__issue__estimate_point",
+                filter=active & Q(issue_cycle__issue__state__group="completed"),
+            ),
+            started_estimates=Sum(
+                "issue_cycle__issue__estimate_point",
+                filter=active & Q(issue_cycle__issue__state__group="started"),
+            ),
+        )
+    )
+
+    CycleProgress.objects.bulk_create(
+        [
+            CycleProgress(
+                cycle_id=cycle["id"],
+                project_id=cycle["project_id"],
+                workspace_id=cycle["workspace_id"],
+                **{field: cycle[field] for field in CYCLE_PROGRESS_FIELDS},
+            )
+            for cycle in cycles
+        ],
+        update_conflicts=True,
+        unique_fields=["cycle"],
+        update_fields=CYCLE_PROGRESS_FIELDS + ["updated_at"],
+    )
+
+
+def refresh_module_progress(module_ids):
+    """recompute the progress rows of the given modules only"""
+    module_ids = {module_id for module_id in module_ids if module_id is not None}
+    if not module_ids:
+        return
+
+    modules = (
+        Module.objects.filter(pk__in=module_ids)
+        .order_by()
+        .values("id", "project_id", "workspace_id")
+        .annotate(**progress_annotations("issue_module"))
+    )
+
+    ModuleProgress.objects.bulk_create(
+        [
+            ModuleProgress(
+                module_id=module["id"],
+                project_id=module["project_id"],
+                workspace_id=module["workspace_id"],
+                **{field: module[field] for field in ISSUE_COUNT_FIELDS},
+            )
+            for module in modules
+        ],
+        update_conflicts=True,
+        unique_fields=["module"],
+        update_fields=ISSUE_COUNT_FIELDS + ["updated_at"],
+    )
+
+
+def refresh_issue_progress(issue_ids):
+    """recompute the progress of the cycles and modules holding the issues"""
+    issue_ids = list(issue_ids)
+    if not issue_ids:
+        return
+
+    refresh_cycle_progress(
+        CycleIssue.objects.filter(issue_id__in=issue_ids).values_list(
+            "cycle_id", flat=True
+        )
+    )
+    refresh_module_progress(
+        ModuleIssue.objects.filter(issue_id__in=issue_ids).values_list(
+            "module_id", flat=True
+        )
+    )
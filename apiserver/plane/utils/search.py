@@ -0,0 +1,58 @@
+# Python imports
+import re
+
+# Django imports
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+
+# The simple configuration does not stem, so prefixes of any language match
+SEARCH_CONFIG = "simple"
+
+# Model fields feeding each search vector with their rank weight
+SEARCH_FIELDS = {
+    "issue": [("name", "A"), ("description_stripped", "B")],
+    "page": [("name", "A"), ("description_stripped", "B")],
+    "issuecomment": [("comment_stripped", "B")],
+}
+
+SEARCH_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def search_vector(model):
+    """weighted tsvector expression for a searchable model"""
+    vector = None
+    for field, weight in SEARCH_FIELDS[model._meta.model_name]:
+        part = SearchVector(
+            Coalesce(field, Value("")), weight=weight, config=SEARCH_CONFIG
+        )
+        vector = part if vector is None else vector + part
+    return vector
+
+
+def update_search_vectors(model, ids):
+    """recompute the stored search vector of the given rows"""
+    ids = [pk for pk in ids if pk is not None]
+    if not ids:
+        return
+    model.objects.filter(pk__in=ids).update(search_vector=search_vector(model))
+
+
+def search_query(query):
+    """prefix tsquery matching every word of the user input
+
+    Returns None when the input holds no searchable word
+    """
+    terms = SEARCH_TERM_RE.findall(query or "")
+    if not terms:
+        return None
+    return SearchQuery(
+        " & ".join(f"{term}:*" for term in terms),
+        search_type="raw",
+        config=SEARCH_CONFIG,
+    )
+
+
+def search_rank(query):
+    # F keeps the stored column, a plain name would be wrapped in to_tsvector
+    return SearchRank(F("search_vector"), query)
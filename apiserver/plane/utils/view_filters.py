@@ -0,0 +1,143 @@
+# Python imports
+import hashlib
+import json
+
+# Django imports
+from django.conf import settings
+from django.core.cache import cache
+
+# Module imports
+from plane.db.models import GlobalView, Issue, IssueView
+from plane.utils.cache import CacheNamespace
+from plane.utils.issue_filters import issue_filters
+
+FILTER_PLAN_VERSION = 1
+
+PROJECT_ISSUES_CACHE = CacheNamespace("project_issues")
+
+# Relative dates like 2_weeks;after;fromnow move with the day they run on
+DATE_FILTER_PARAMS = {
+    "created_at",
+    "updated_at",
+    "start_date",
+    "target_date",
+    "completed_at",
+}
+
+
+def query_param(value):
+    # Saved views keep lists, the request parsers expect comma separated text
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, tuple)):
+        return ",".join(str(item) for item in value)
+    return str(value)
+
+
+def normalize_filter_value(value):
+    if isinstance(value, (list, tuple)):
+        return sorted({str(item) for item in value})
+    return value
+
+
+def compile_filter_plan(query_data):
+    """parse and validate the filters of a saved view once
+
+    The plan holds the ready Django lookups with valid ids only, plus the
+    date filters which are resolved again on every run.
+    """
+    params = {
+        key: query_param(value)
+        for key, value in (query_data or {}).items()
+        if value is not None
+    }
+    filters = issue_filters(
+        {key: value for key, value in params.items() if key not in DATE_FILTER_PARAMS},
+        "GET",
+    )
+    return {
+        "version": FILTER_PLAN_VERSION,
+        "filters": {
+            lookup: normalize_filter_value(value) for lookup, value in filters.items()
+        },
+        "dates": {
+            key: params[key] for key in sorted(DATE_FILTER_PARAMS) if key in params
+        },
+    }
+
+
+def get_filter_plan(view):
+    # Views saved before the plans existed are compiled on first use
+    if view.filter_plan.get("version") != FILTER_PLAN_VERSION:
+        view.filter_plan = compile_filter_plan(view.query_data)
+        type(view).objects.filter(pk=view.pk).update(filter_plan=view.filter_plan)
+    return view.filter_plan
+
+
+def resolve_filter_plan(plan):
+    filters = dict(plan["filters"])
+    filters.update(issue_filters(plan["dates"], "GET"))
+    return filters
+
+
+def get_saved_view(request, slug, project_id=None):
+    """saved view picked with the view_id parameter, if any"""
+    view_id = request.GET.get("view_id", False)
+    if not view_id:
+        return None
+    if project_id is not None:
+        return IssueView.objects.get(
+            pk=view_id, project_id=project_id, workspace__slug=slug
+        )
+    return GlobalView.objects.get(pk=view_id, workspace__slug=slug)
+
+
+def invalidate_project_issues(project_ids):
+    """drop the cached view results of the given projects"""
+    PROJECT_ISSUES_CACHE.invalidate(project_ids)
+
+
+def cached_result_ids(view, filters, project_ids):
+    project_ids = sorted(str(project_id) for project_id in project_ids)
+    versions = PROJECT_ISSUES_CACHE.versions(project_ids)
+    digest = hashlib.md5(
+        json.dumps(
+            {
+                "filters": filters,
+                "projects": project_ids,
+                "versions": [versions[project_id] for project_id in project_ids],
+            },
+            sort_keys=True,
+            default=str,
+        ).encode()
+    ).hexdigest()
+    cache_key = f"view_results:{view.pk}:{digest}"
+
+    result_ids = cache.get(cache_key)
+    if result_ids is None:
+        result_ids = [
+            str(pk)
+            for pk in Issue.issue_objects.filter(
+                project_id__in=project_ids, **filters
+            )
+            .order_by()
+            .values_list("id", flat=True)
+            .distinct()
+        ]
+        cache.set(cache_key, result_ids, settings.VIEW_RESULTS_CACHE_TTL)
+    return result_ids
+
+
+def filter_issues(queryset, request, view=None, project_ids=None):
+    """apply a saved view, or else the request filters, to an issue queryset
+
+    Views with cache_results set are served from their cached result ids,
+    which any issue change in project_ids invalidates.
+    """
+    if view is None:
+        return queryset.filter(**issue_filters(request.query_params, "GET"))
+
+    filters = resolve_filter_plan(get_filter_plan(view))
+    if not view.cache_results or project_ids is None:
+        return queryset.filter(**filters)
+    return queryset.filter(pk__in=cached_result_ids(view, filters, project_ids))